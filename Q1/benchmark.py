@@ -0,0 +1,212 @@
+import argparse
+import datetime
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from execution_trace import NullTrace
+from monte_carlo import DISTRIBUTIONS, sample_workload
+from round_robin_simulacao import ProcessTable, round_robin, round_robin_numpy, simulate_round_robin
+
+DEFAULT_SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_QUANTA = [2, 4, 8]
+
+# Tolerância padrão antes de considerar uma medição uma regressão (20% mais lenta/maior)
+DEFAULT_THRESHOLD = 0.2
+
+# Medições de tempo abaixo disto (em s) são ruído demais para acusar regressão
+_MIN_COMPARABLE_TIME = 0.005
+
+# Repetições de cada medição de tempo: para no máximo `repeat` ou quando a soma passa disto
+_MIN_TIMING = 0.5
+
+
+# ==============================
+# Motores medidos
+# ==============================
+def _run_round_robin(table, bursts, quanta):
+    # Motor orientado a eventos, guardando sequência de execução e amostras (uso padrão)
+    for q in quanta:
+        round_robin(table.copy(), q)
+
+
+def _run_round_robin_streaming(table, bursts, quanta):
+    # Motor orientado a eventos em memória constante (sem trace nem amostras)
+    for q in quanta:
+        round_robin(table.copy(), q, trace=NullTrace(), keep_samples=False)
+
+
+def _run_numpy(table, bursts, quanta):
+    for q in quanta:
+        round_robin_numpy(bursts, q, names=table.names)
+
+
+def _run_sweep(table, bursts, quanta):
+    # Varredura completa de simulate_round_robin() (todos os quanta numa medição)
+    simulate_round_robin(table, quanta)
+
+
+ENGINES = {
+    'round_robin': _run_round_robin,
+    'round_robin_streaming': _run_round_robin_streaming,
+    'numpy': _run_numpy,
+    'sweep': _run_sweep,
+}
+
+
+def count_slices(bursts, quanta):
+    # Fatias simuladas (antes da união de fatias contíguas): ceil(burst / q) por processo, e
+    # pelo menos uma (round_robin() também roda uma fatia para um burst 0)
+    return sum(max(-(-burst // q), 1) for q in quanta for burst in bursts)
+
+
+def _measure(run, table, bursts, quanta, repeat):
+    """
+    Mede uma execução: o melhor tempo entre algumas repetições (sem tracemalloc, que deixa o
+    código mais lento) e o pico de memória numa execução à parte, com tracemalloc.
+    """
+    timings = []
+    while len(timings) < repeat and sum(timings) < _MIN_TIMING:
+        gc.collect()
+        start = time.perf_counter()
+        run(table, bursts, quanta)
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run(table, bursts, quanta)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(timings), peak
+
+
+def case_key(result):
+    return (result['engine'], result['processes'], result['distribution'], tuple(result['quanta']))
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, quanta=DEFAULT_QUANTA, engines=('round_robin_streaming',),
+                   distributions=('bimodal',), seed=0, repeat=3, progress=None):
+    """
+    Roda a grade (motor x tamanho x distribuição x quantum) e devolve uma lista de medições com
+    tempo de parede (s), pico de memória (bytes, via tracemalloc) e fatias simuladas por segundo.
+    Cada motor é medido por quantum, exceto 'sweep', que mede a varredura com todos os quanta.
+    - progress: função chamada com cada medição assim que ela termina (ex.: para imprimir)
+    """
+    results = []
+    for distribution in distributions:
+        for size in sizes:
+            # Todos chegam em 0, para o motor NumPy poder ser comparado com os demais
+            table = ProcessTable.from_processes(sample_workload(seed, size, distribution))
+            bursts = list(table.burst_time)
+            for engine in engines:
+                groups = [list(quanta)] if engine == 'sweep' else [[q] for q in quanta]
+                for group in groups:
+                    wall_time, peak_memory = _measure(ENGINES[engine], table, bursts, group, repeat)
+                    slices = count_slices(bursts, group)
+                    result = {
+                        'engine': engine,
+                        'processes': size,
+                        'distribution': distribution,
+                        'quanta': group,
+                        'wall_time': wall_time,
+                        'peak_memory': peak_memory,
+                        'slices': slices,
+                        'slices_per_sec': slices / wall_time if wall_time > 0 else 0,
+                    }
+                    results.append(result)
+                    if progress is not None:
+                        progress(result)
+    return results
+
+
+def save_baseline(results, path):
+    # Grava as medições em JSON, junto com informações da máquina
+    report = {
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with open(path, 'w', encoding='utf-8') as baseline_file:
+        json.dump(report, baseline_file, indent=2)
+
+
+def load_baseline(path):
+    with open(path, encoding='utf-8') as baseline_file:
+        return json.load(baseline_file)['results']
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compara as medições com um baseline (casos com mesmo motor, tamanho, distribuição e quanta).
+    Retorna a lista de regressões: medições com tempo ou pico de memória mais de `threshold`
+    (fração) acima do baseline. Tempos muito curtos no baseline não são comparados.
+    """
+    previous = {case_key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        old = previous.get(case_key(result))
+        if old is None:
+            continue
+        for field in ('wall_time', 'peak_memory'):
+            if field == 'wall_time' and old[field] < _MIN_COMPARABLE_TIME:
+                continue
+            if old[field] > 0 and result[field] > old[field] * (1 + threshold):
+                regressions.append({
+                    'case': result,
+                    'field': field,
+                    'baseline': old[field],
+                    'current': result[field],
+                    'ratio': result[field] / old[field],
+                })
+    return regressions
+
+
+def _format_result(result):
+    quanta = ','.join(map(str, result['quanta']))
+    return (f"{result['engine']:<22} n={result['processes']:<9} {result['distribution']:<12} "
+            f"q={quanta:<7} {result['wall_time']:>10.4f} s {result['peak_memory'] / 2**20:>9.2f} MB "
+            f"{result['slices_per_sec']:>14,.0f} fatias/s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmarks do simulador Round Robin.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='números de processos (padrão: 10 a 10^6)')
+    parser.add_argument('--quanta', type=int, nargs='+', default=DEFAULT_QUANTA)
+    parser.add_argument('--engines', nargs='+', choices=sorted(ENGINES),
+                        default=['round_robin_streaming'])
+    parser.add_argument('--distributions', nargs='+', choices=sorted(DISTRIBUTIONS),
+                        default=['bimodal'])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3, help='repetições máximas de cada medição')
+    parser.add_argument('--save', help='grava as medições neste arquivo JSON (baseline)')
+    parser.add_argument('--compare', help='baseline JSON para detectar regressões')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='tolerância antes de acusar regressão (padrão: 0.2 = 20%%)')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.quanta, args.engines, args.distributions,
+                             args.seed, args.repeat,
+                             progress=lambda result: print(_format_result(result), flush=True))
+
+    if args.save:
+        save_baseline(results, args.save)
+
+    if args.compare:
+        regressions = compare(results, load_baseline(args.compare), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSÃO {regression['field']} ({regression['ratio']:.2f}x): "
+                  f"{_format_result(regression['case'])}")
+        if regressions:
+            sys.exit(1)
+        print('Nenhuma regressão em relação ao baseline.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+from array import array
+import json
+import mmap
+import os
+
+# Cada fatia é gravada como três inteiros int64: (tempo_inicio, id_processo, duração)
+_FIELDS = 3
+
+
+def _names_path(path):
+    # Os nomes dos processos ficam num arquivo ao lado do trace binário
+    return path + '.names.json'
+
+
+# Classe ExecutionTrace - sequência de execução (Gantt) guardada em colunas tipadas
+class ExecutionTrace:
+    """
+    Guarda a sequência de execução como colunas int64 (início, id do processo, duração), com o
+    nome de cada processo guardado uma única vez em `names`. Fatias consecutivas e contíguas do
+    mesmo processo são unidas em uma só.
+
+    Se `path` for informado, as fatias são descarregadas em lotes num arquivo binário em disco
+    (só as últimas `buffer_size` ficam em memória); depois de close() o trace pode ser lido de
+    volta com load(), via memory map.
+
+    Iterar o trace devolve tuplas (tempo_inicio, nome_processo, duração), como a lista antiga.
+    """
+
+    def __init__(self, path=None, buffer_size=65536):
+        self.names = []
+        self.path = path
+        self.buffer_size = buffer_size
+        self._starts = array('q')
+        self._pids = array('q')
+        self._durations = array('q')
+        self._flushed = 0    # Quantas fatias já foram gravadas em disco
+        self._file = open(path, 'wb') if path is not None else None
+
+    def add_process(self, name):
+        # Registra um processo e devolve o id usado nas fatias
+        self.names.append(name)
+        return len(self.names) - 1
+
+    def append(self, start, pid, duration):
+        if self._pids and self._pids[-1] == pid and self._starts[-1] + self._durations[-1] == start:
+            # Continua a fatia anterior do mesmo processo
+            self._durations[-1] += duration
+            return
+        self._starts.append(start)
+        self._pids.append(pid)
+        self._durations.append(duration)
+        if self._file is not None and len(self._pids) > self.buffer_size:
+            # Mantém a última fatia em memória, pois ela ainda pode ser unida à próxima
+            self._flush(keep_last=True)
+
+    def _flush(self, keep_last=False):
+        pending = len(self._pids) - (1 if keep_last else 0)
+        if pending <= 0:
+            return
+        records = array('q', bytes(8 * _FIELDS * pending))
+        records[0::_FIELDS] = self._starts[:pending]
+        records[1::_FIELDS] = self._pids[:pending]
+        records[2::_FIELDS] = self._durations[:pending]
+        self._file.write(records.tobytes())
+        del self._starts[:pending], self._pids[:pending], self._durations[:pending]
+        self._flushed += pending
+
+    def close(self):
+        # Grava o que falta em disco junto com os nomes dos processos
+        if self._file is None or self._file.closed:
+            return
+        self._flush()
+        self._file.close()
+        with open(_names_path(self.path), 'w', encoding='utf-8') as names_file:
+            json.dump(self.names, names_file)
+
+    @classmethod
+    def from_arrays(cls, starts, pids, durations, names):
+        """
+        Monta um trace em memória a partir de arrays NumPy (usado por round_robin_numpy()),
+        unindo as fatias consecutivas e contíguas do mesmo processo de forma vetorizada.
+        """
+        import numpy as np
+
+        trace = cls()
+        trace.names = list(names)
+        if len(pids):
+            starts = np.asarray(starts, dtype=np.int64)
+            pids = np.asarray(pids, dtype=np.int64)
+            durations = np.asarray(durations, dtype=np.int64)
+            continues = np.zeros(len(pids), dtype=bool)
+            continues[1:] = (pids[1:] == pids[:-1]) & (starts[1:] == starts[:-1] + durations[:-1])
+            heads = np.flatnonzero(~continues)
+            trace._starts = array('q', starts[heads].tobytes())
+            trace._pids = array('q', pids[heads].tobytes())
+            trace._durations = array('q', np.add.reduceat(durations, heads).tobytes())
+        return trace
+
+    def as_arrays(self):
+        """
+        Devolve as colunas (inícios, ids, durações) como arrays NumPy int64.
+        """
+        import numpy as np
+
+        parts = []
+        if self._flushed:
+            if not self._file.closed:
+                self._file.flush()
+            parts.append(MappedExecutionTrace(self.path, self.names, self._flushed).as_arrays())
+        parts.append(tuple(np.frombuffer(column, dtype=np.int64)
+                           for column in (self._starts, self._pids, self._durations)))
+        return tuple(np.concatenate(columns) for columns in zip(*parts))
+
+    @staticmethod
+    def load(path):
+        # Lê um trace gravado em disco sem carregá-lo inteiro na memória
+        return MappedExecutionTrace(path)
+
+    def __len__(self):
+        return self._flushed + len(self._pids)
+
+    def __iter__(self):
+        if self._flushed:
+            if not self._file.closed:
+                self._file.flush()
+            yield from MappedExecutionTrace(self.path, self.names, self._flushed)
+        names = self.names
+        for start, pid, duration in zip(self._starts, self._pids, self._durations):
+            yield (start, names[pid], duration)
+
+
+# Classe MappedExecutionTrace - leitura de um trace binário via memory map
+class MappedExecutionTrace:
+    def __init__(self, path, names=None, length=None):
+        if names is None:
+            with open(_names_path(path), encoding='utf-8') as names_file:
+                names = json.load(names_file)
+        self.names = names
+        self.path = path
+        size = os.path.getsize(path)
+        self._length = size // (8 * _FIELDS) if length is None else length
+        self._records = None
+        if self._length:
+            with open(path, 'rb') as trace_file:
+                self._mmap = mmap.mmap(trace_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._records = memoryview(self._mmap).cast('q')
+
+    @property
+    def starts(self):
+        return self._records[0:_FIELDS * self._length:_FIELDS] if self._length else []
+
+    @property
+    def pids(self):
+        return self._records[1:_FIELDS * self._length:_FIELDS] if self._length else []
+
+    @property
+    def durations(self):
+        return self._records[2:_FIELDS * self._length:_FIELDS] if self._length else []
+
+    def as_arrays(self):
+        # Colunas como arrays NumPy (visões sobre o memory map, sem cópia)
+        import numpy as np
+
+        if not self._length:
+            return tuple(np.empty(0, dtype=np.int64) for _ in range(_FIELDS))
+        records = np.frombuffer(self._mmap, dtype=np.int64, count=_FIELDS * self._length)
+        records = records.reshape(self._length, _FIELDS)
+        return records[:, 0], records[:, 1], records[:, 2]
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('índice fora do trace')
+        base = _FIELDS * index
+        records = self._records
+        return (records[base], self.names[records[base + 1]], records[base + 2])
+
+    def __iter__(self):
+        records = self._records
+        names = self.names
+        for base in range(0, _FIELDS * self._length, _FIELDS):
+            yield (records[base], names[records[base + 1]], records[base + 2])
+
+
+# Classe NullTrace - trace que descarta as fatias (para simulações que só precisam das métricas)
+class NullTrace:
+    def __init__(self):
+        self.names = []
+        self._processes = 0
+
+    def add_process(self, name):
+        self._processes += 1
+        return self._processes - 1
+
+    def append(self, start, pid, duration):
+        pass
+
+    def close(self):
+        pass
+
+    def __len__(self):
+        return 0
+
+    def __iter__(self):
+        return iter(())
@@ -0,0 +1,224 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import json
+import math
+import os
+import random
+import statistics
+import sys
+
+from execution_trace import NullTrace
+from round_robin_simulacao import (T1, T2, T3, T4, SUMMARY_FIELDS, Process, fresh_copy,
+                                   round_robin)
+from streaming_metrics import RunningStats
+
+# Métricas agregadas entre as replicações (todas as escalares, menos o próprio quantum)
+METRICS = [field for field in SUMMARY_FIELDS if field != 'quantum']
+
+
+# ==============================
+# Distribuições de workload
+# ==============================
+def bimodal_bursts(rng, num_processes, short=(T1, T2), long=(T3, T4)):
+    # Mesma mistura de main(): índices pares curtos e ímpares longos
+    return [rng.randint(*short) if i % 2 == 0 else rng.randint(*long) for i in range(num_processes)]
+
+
+def uniform_bursts(rng, num_processes, low=T1, high=T4):
+    return [rng.randint(low, high) for _ in range(num_processes)]
+
+
+def exponential_bursts(rng, num_processes, mean=10):
+    # Burst inteiro de pelo menos 1 unidade
+    return [max(1, round(rng.expovariate(1 / mean))) for _ in range(num_processes)]
+
+
+def lognormal_bursts(rng, num_processes, mu=2.0, sigma=1.0):
+    return [max(1, round(rng.lognormvariate(mu, sigma))) for _ in range(num_processes)]
+
+
+DISTRIBUTIONS = {
+    'bimodal': bimodal_bursts,
+    'uniform': uniform_bursts,
+    'exponential': exponential_bursts,
+    'lognormal': lognormal_bursts,
+}
+
+
+def replication_seed(seed, replication):
+    # Semente própria de cada replicação: o resultado não depende de como o trabalho é dividido
+    return seed * 1_000_003 + replication
+
+
+def sample_workload(seed, num_processes=10, distribution='bimodal', arrival_rate=None, **params):
+    """
+    Gera um workload reprodutível a partir de uma semente.
+    - distribution: nome em DISTRIBUTIONS (parâmetros extras vão em **params)
+    - arrival_rate: se informado, as chegadas seguem um processo de Poisson com essa taxa
+      (processos por unidade de tempo); senão todos chegam em 0
+    """
+    rng = random.Random(seed)
+    bursts = DISTRIBUTIONS[distribution](rng, num_processes, **params)
+    processes = []
+    arrival = 0.0
+    for i, burst_time in enumerate(bursts):
+        arrival_time = None
+        if arrival_rate:
+            arrival += rng.expovariate(arrival_rate)
+            arrival_time = int(arrival)
+        processes.append(Process(f"P{i+1}", burst_time, arrival_time))
+    return processes
+
+
+# ==============================
+# Execução das replicações
+# ==============================
+def _run_replications(task):
+    """
+    Roda um bloco de replicações (executado num worker do pool) e devolve, para cada
+    (quantum, métrica), um RunningStats com os valores de todas as replicações do bloco.
+    """
+    first, last, seed, quanta, workload_options = task
+    accumulators = {(q, metric): RunningStats() for q in quanta for metric in METRICS}
+    for replication in range(first, last):
+        processes = sample_workload(replication_seed(seed, replication), **workload_options)
+        for q in quanta:
+            metrics = round_robin(fresh_copy(processes), q, trace=NullTrace(), keep_samples=False)
+            for metric in METRICS:
+                accumulators[(q, metric)].add(metrics[metric])
+    return accumulators
+
+
+# Até quantos graus de liberdade t_critical() usa a distribuição t exata
+_EXACT_T_DOF = 100
+
+
+def _t_central_probability(t, dof):
+    """
+    P(|T| < t) para T com distribuição t de Student e `dof` inteiro, pela soma finita de
+    Abramowitz & Stegun (26.7.3 e 26.7.4).
+    """
+    theta = math.atan(t / math.sqrt(dof))
+    sin, cos2 = math.sin(theta), math.cos(theta) ** 2
+    if dof % 2 == 0:
+        term = total = 1.0
+        for k in range(2, dof, 2):
+            term *= cos2 * (k - 1) / k
+            total += term
+        return sin * total
+    if dof == 1:
+        return 2 * theta / math.pi
+    term = total = 1.0
+    for k in range(3, dof, 2):
+        term *= cos2 * (k - 1) / k
+        total += term
+    return 2 / math.pi * (theta + sin * math.cos(theta) * total)
+
+
+def t_critical(confidence, dof):
+    """
+    Valor crítico bicaudal da distribuição t de Student.
+    Até _EXACT_T_DOF graus de liberdade é exato (bisseção sobre a distribuição t); acima disso
+    usa a expansão de Cornish-Fisher sobre o quantil da normal, cujo erro já é desprezível.
+    """
+    if dof <= 0:
+        return math.inf
+    z = statistics.NormalDist().inv_cdf(1 - (1 - confidence) / 2)
+    if dof <= _EXACT_T_DOF:
+        low, high = 0.0, max(z, 1.0)
+        while _t_central_probability(high, dof) < confidence:
+            low, high = high, high * 2
+        for _ in range(100):
+            middle = (low + high) / 2
+            if _t_central_probability(middle, dof) < confidence:
+                low = middle
+            else:
+                high = middle
+        return (low + high) / 2
+    g1 = (z ** 3 + z) / 4
+    g2 = (5 * z ** 5 + 16 * z ** 3 + 3 * z) / 96
+    g3 = (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / 384
+    g4 = (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / 92160
+    return z + g1 / dof + g2 / dof ** 2 + g3 / dof ** 3 + g4 / dof ** 4
+
+
+def confidence_interval(stats, confidence=0.95):
+    # Intervalo de confiança da média a partir de um RunningStats
+    if stats.count < 2:
+        return stats.mean, stats.mean
+    half_width = t_critical(confidence, stats.count - 1) * stats.stdev / math.sqrt(stats.count)
+    return stats.mean - half_width, stats.mean + half_width
+
+
+def run_monte_carlo(replications, quanta, seed=0, confidence=0.95, max_workers=None,
+                    chunk_size=None, **workload_options):
+    """
+    Simula `replications` workloads sorteados (cada um com a semente replication_seed()) para cada
+    quantum, distribuindo blocos de replicações num pool de processos.
+    - workload_options: argumentos de sample_workload() (num_processes, distribution, ...)
+
+    Retorna uma lista (uma entrada por quantum, na ordem de quanta) com, para cada métrica,
+    média, desvio padrão e o intervalo de confiança da média.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if chunk_size is None:
+        # Alguns blocos por worker para equilibrar a carga sem custo de comunicação alto
+        chunk_size = max(1, math.ceil(replications / (workers * 4)))
+    tasks = [(first, min(first + chunk_size, replications), seed, list(quanta), workload_options)
+             for first in range(0, replications, chunk_size)]
+
+    # Os acumuladores parciais de cada bloco são combinados (RunningStats.merge)
+    totals = {(q, metric): RunningStats() for q in quanta for metric in METRICS}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for partial in executor.map(_run_replications, tasks):
+            for key, stats in partial.items():
+                totals[key].merge(stats)
+
+    results = []
+    for q in quanta:
+        entry = {'quantum': q, 'replications': replications}
+        for metric in METRICS:
+            stats = totals[(q, metric)]
+            ci_low, ci_high = confidence_interval(stats, confidence)
+            entry[metric] = {'mean': stats.mean, 'std': stats.stdev,
+                             'ci_low': ci_low, 'ci_high': ci_high}
+        results.append(entry)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Replicações Monte Carlo do Round Robin.')
+    parser.add_argument('--replications', type=int, default=1000, help='número de workloads sorteados')
+    parser.add_argument('--quanta', type=int, nargs='+', default=[2, 4, 6], help='valores de quantum')
+    parser.add_argument('--processes', type=int, default=10, help='processos por workload')
+    parser.add_argument('--distribution', choices=sorted(DISTRIBUTIONS), default='bimodal')
+    parser.add_argument('--arrival-rate', type=float, help='taxa de chegadas (Poisson); padrão: todos em 0')
+    parser.add_argument('--seed', type=int, default=0, help='semente base das replicações')
+    parser.add_argument('--confidence', type=float, default=0.95, help='nível de confiança')
+    parser.add_argument('--workers', type=int, help='processos do pool (padrão: número de CPUs)')
+    parser.add_argument('--format', choices=['text', 'json'], default='text')
+    args = parser.parse_args(argv)
+
+    results = run_monte_carlo(args.replications, args.quanta, seed=args.seed,
+                              confidence=args.confidence, max_workers=args.workers,
+                              num_processes=args.processes, distribution=args.distribution,
+                              arrival_rate=args.arrival_rate)
+
+    if args.format == 'json':
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return
+
+    for entry in results:
+        print(f"=== Quantum = {entry['quantum']} ({entry['replications']} replicações) ===")
+        for metric, label in (('average_waiting_time', 'Tempo Médio de Espera'),
+                              ('average_return_time', 'Tempo Médio de Retorno'),
+                              ('throughput', 'Vazão')):
+            summary = entry[metric]
+            print(f"{label}: {summary['mean']:.3f} "
+                  f"(IC {args.confidence:.0%}: {summary['ci_low']:.3f} .. {summary['ci_high']:.3f})")
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,246 @@
+import argparse
+from collections import deque
+import heapq
+import itertools
+import math
+
+from execution_trace import ExecutionTrace
+from round_robin_simulacao import (CONTEXT_SWITCH_TIME, ArrivalQueue, build_metrics,
+                                   open_workload, summarize)
+from streaming_metrics import RunningStats
+
+# Balanceamento de carga entre os núcleos:
+#   none: cada processo fica no núcleo onde chegou
+#   push: a cada balance_interval, processos da fila mais cheia vão para a mais vazia
+#   steal: um núcleo que fica sem trabalho rouba metade da fila do mais carregado
+#   both: push e steal juntos
+BALANCERS = ('none', 'push', 'steal', 'both')
+
+_NO_CORE = -1
+
+
+# Classe _LoadHeap - heap preguiçoso das cargas dos núcleos
+class _LoadHeap:
+    """
+    Heap de (carga, núcleo) atualizado de forma preguiçosa: cada mudança de carga só insere uma
+    entrada nova, e as entradas velhas são descartadas quando aparecem no topo.
+    - sign: 1 para o menos carregado no topo, -1 para o mais carregado
+    """
+
+    def __init__(self, loads, sign):
+        self.loads = loads
+        self.sign = sign
+        self._rebuild()
+
+    def _rebuild(self):
+        self.heap = [(self.sign * load, core) for core, load in enumerate(self.loads)]
+        heapq.heapify(self.heap)
+
+    def update(self, core):
+        heapq.heappush(self.heap, (self.sign * self.loads[core], core))
+        if len(self.heap) > 4 * len(self.loads) + 64:
+            self._rebuild()    # Evita que as entradas velhas se acumulem
+
+    def top(self):
+        heap = self.heap
+        while self.sign * heap[0][0] != self.loads[heap[0][1]]:
+            heapq.heappop(heap)
+        return heap[0][1]
+
+
+def round_robin_multicore(processes, quantum, cores=4, balancer='steal', balance_interval=50,
+                          migration_cost=1, context_switch_time=CONTEXT_SWITCH_TIME,
+                          arrival_time=0, trace=None, keep_samples=True):
+    """
+    Round Robin com vários núcleos, cada um com sua própria fila.
+    - processes, quantum, arrival_time, trace, keep_samples: como em round_robin()
+    - cores: número de núcleos
+    - balancer: estratégia de balanceamento (ver BALANCERS)
+    - balance_interval: período do balanceamento por push
+    - migration_cost: tempo gasto quando um processo volta a executar num núcleo diferente
+    - context_switch_time: custo da troca de contexto após uma preempção (por núcleo)
+
+    Cada processo que chega vai para o núcleo menos carregado (carga = processos na fila mais o
+    que está executando). A simulação é orientada a eventos (fim de fatia, fim de troca de
+    contexto e chegadas, num heap pelo instante); os núcleos menos e mais carregados saem de
+    heaps preguiçosos, então cada operação custa O(log núcleos).
+
+    Com um núcleo o resultado é o mesmo de round_robin(). Além das métricas de sempre, o
+    dicionário traz a utilização e o tempo ocupado de cada núcleo e os contadores de trocas
+    de contexto, migrações, roubos e movimentos do balanceamento.
+    """
+    if balancer not in BALANCERS:
+        raise ValueError(f'balanceamento desconhecido: {balancer} (opções: {", ".join(BALANCERS)})')
+    if cores < 1:
+        raise ValueError('é preciso pelo menos um núcleo')
+    push = balancer in ('push', 'both')
+    steal = balancer in ('steal', 'both')
+
+    arrivals = ArrivalQueue(processes, arrival_time)
+    execution_sequence = trace if trace is not None else ExecutionTrace()
+    waiting_stats = RunningStats()
+    return_stats = RunningStats()
+    waiting_time_list = [] if keep_samples else None
+    return_time_list = [] if keep_samples else None
+
+    queues = [deque() for _ in range(cores)]    # Filas de (pid, processo)
+    running = [None] * cores                     # Fatia em execução em cada núcleo
+    idle = [True] * cores                        # Núcleo sem nenhum evento agendado
+    loads = [0] * cores
+    busy_time = [0] * cores
+    last_core = []                               # Último núcleo de cada processo (por pid)
+    least_loaded = _LoadHeap(loads, 1)
+    most_loaded = _LoadHeap(loads, -1)
+
+    events = []                                  # (instante, desempate, núcleo)
+    sequence = itertools.count()
+    finished_processes = 0
+    current_time = 0
+    counters = {'context_switches': 0, 'migrations': 0, 'steals': 0, 'balance_moves': 0}
+
+    def change_load(core, delta):
+        loads[core] += delta
+        least_loaded.update(core)
+        most_loaded.update(core)
+
+    def wake(core, now):
+        # Agenda um despacho para um núcleo ocioso que recebeu trabalho
+        if idle[core]:
+            idle[core] = False
+            heapq.heappush(events, (now, next(sequence), core))
+
+    def move(source, target, count):
+        # Move os `count` últimos da fila de source para o início da fila de target (mesma ordem)
+        for _ in range(count):
+            queues[target].appendleft(queues[source].pop())
+        change_load(source, -count)
+        change_load(target, count)
+
+    def steal_into(core):
+        victim = most_loaded.top()
+        waiting = len(queues[victim])
+        if victim != core and waiting:
+            move(victim, core, (waiting + 1) // 2)
+            counters['steals'] += 1
+
+    def rebalance(now):
+        while True:
+            busiest, lightest = most_loaded.top(), least_loaded.top()
+            if loads[busiest] - loads[lightest] <= 1 or not queues[busiest]:
+                return
+            move(busiest, lightest, 1)
+            counters['balance_moves'] += 1
+            wake(lightest, now)
+
+    def dispatch(core, now):
+        # Começa a próxima fatia do núcleo (ou deixa o núcleo ocioso)
+        queue = queues[core]
+        if not queue and steal:
+            steal_into(core)
+        if not queue:
+            idle[core] = True
+            return
+        pid, process = queue.popleft()
+        if last_core[pid] != core:
+            if last_core[pid] != _NO_CORE:
+                now += migration_cost
+                counters['migrations'] += 1
+            last_core[pid] = core
+        if process.initial_time is None:
+            process.initial_time = now
+        exec_time = min(quantum, process.remaining_time)
+        process.remaining_time -= exec_time
+        execution_sequence.append(now, pid, exec_time)
+        busy_time[core] += exec_time
+        running[core] = (pid, process)
+        heapq.heappush(events, (now + exec_time, next(sequence), core))
+
+    next_balance = balance_interval if push else math.inf
+    while events or arrivals:
+        next_event = events[0][0] if events else math.inf
+        next_arrival = arrivals.next_time if arrivals else math.inf
+        upcoming = min(next_event, next_arrival)
+
+        if next_balance <= upcoming:
+            # Entre dois eventos nada muda: basta balancear uma vez e pular os períodos vazios
+            rebalance(next_balance)
+            next_balance = max(next_balance + balance_interval,
+                               upcoming - upcoming % balance_interval)
+            continue
+
+        if next_arrival <= next_event:
+            # Chegadas vão para o núcleo menos carregado (antes de quem termina no mesmo instante)
+            process = arrivals.pop()
+            core = least_loaded.top()
+            queues[core].append((execution_sequence.add_process(process.name), process))
+            last_core.append(_NO_CORE)
+            change_load(core, 1)
+            wake(core, next_arrival)
+            continue
+
+        now, _, core = heapq.heappop(events)
+        current_time = max(current_time, now)
+        if running[core] is None:
+            # Fim da troca de contexto (ou núcleo acordado): executa o próximo
+            dispatch(core, now)
+            continue
+
+        pid, process = running[core]
+        running[core] = None
+        if process.remaining_time == 0:
+            process.completion_time = now
+            finished_processes += 1
+            change_load(core, -1)
+            ret_time = now - arrivals.arrival_of(process)
+            wait_time = ret_time - process.burst_time
+            waiting_stats.add(wait_time)
+            return_stats.add(ret_time)
+            if keep_samples:
+                waiting_time_list.append(wait_time)
+                return_time_list.append(ret_time)
+            dispatch(core, now)
+        else:
+            # Preempção: volta para a fila do mesmo núcleo e paga a troca de contexto
+            queues[core].append((pid, process))
+            counters['context_switches'] += 1
+            heapq.heappush(events, (now + context_switch_time, next(sequence), core))
+
+    execution_sequence.close()
+
+    metrics = build_metrics(quantum, waiting_stats, return_stats, finished_processes,
+                            current_time, execution_sequence, waiting_time_list, return_time_list)
+    metrics['cores'] = cores
+    metrics['balancer'] = balancer
+    metrics['core_busy_time'] = busy_time
+    metrics['core_utilization'] = [busy / current_time if current_time > 0 else 0
+                                   for busy in busy_time]
+    metrics.update(counters)
+    return metrics
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Round Robin com vários núcleos.')
+    parser.add_argument('--workload', help='arquivo JSON ou trace com os processos (padrão: aleatório)')
+    parser.add_argument('--processes', type=int, default=100, help='processos do workload aleatório')
+    parser.add_argument('--seed', type=int, help='semente do workload aleatório')
+    parser.add_argument('--quantum', type=int, default=4)
+    parser.add_argument('--cores', type=int, default=4)
+    parser.add_argument('--balancer', choices=BALANCERS, default='steal')
+    parser.add_argument('--balance-interval', type=int, default=50)
+    parser.add_argument('--migration-cost', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    with open_workload(args.workload, args.processes, args.seed) as processes:
+        metrics = round_robin_multicore(processes, args.quantum, args.cores, args.balancer,
+                                        args.balance_interval, args.migration_cost,
+                                        keep_samples=False)
+    for field, value in summarize(metrics).items():
+        print(f"{field}: {value}")
+    for counter in ('context_switches', 'migrations', 'steals', 'balance_moves'):
+        print(f"{counter}: {metrics[counter]}")
+    for core, utilization in enumerate(metrics['core_utilization']):
+        print(f"Núcleo {core}: {utilization:.1%} ocupado")
+
+
+if __name__ == '__main__':
+    main()
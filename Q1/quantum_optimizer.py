@@ -0,0 +1,195 @@
+import argparse
+import json
+import math
+import sys
+
+from execution_trace import NullTrace
+from round_robin_simulacao import ProcessTable, fresh_copy, open_workload, round_robin
+
+# 1/φ: fração usada para posicionar os pontos internos da busca de seção áurea
+INV_PHI = (math.sqrt(5) - 1) / 2
+
+
+# ==============================
+# Objetivos (todos minimizados)
+# ==============================
+def mean_wait(metrics, context_switches, switch_penalty):
+    return metrics['average_waiting_time']
+
+
+def p99_turnaround(metrics, context_switches, switch_penalty):
+    return metrics['return_time_p99']
+
+
+def penalized_throughput(metrics, context_switches, switch_penalty):
+    """
+    Vazão com uma penalidade extra por troca de contexto (ex.: cache frio), além do
+    CONTEXT_SWITCH_TIME já cobrado pela simulação. Negativa, pois a busca minimiza.
+    """
+    finished = metrics['throughput'] * metrics['makespan']
+    elapsed = metrics['makespan'] + switch_penalty * context_switches
+    return -finished / elapsed if elapsed > 0 else 0
+
+
+OBJECTIVES = {
+    'mean_wait': mean_wait,
+    'p99_turnaround': p99_turnaround,
+    'throughput': penalized_throughput,
+}
+
+
+def _burst_times(processes):
+    # Bursts do workload (uma passada; traces em streaming são relidos do arquivo)
+    if isinstance(processes, ProcessTable):
+        return list(processes.burst_time)
+    return [p.burst_time for p in processes]
+
+
+# Classe QuantumObjective - avaliação memorizada do objetivo para cada quantum
+class QuantumObjective:
+    """
+    Simula o workload para um quantum e devolve o valor do objetivo, guardando cada resultado:
+    um quantum já avaliado nunca é simulado de novo.
+    - processes: lista de processos, ProcessTable ou trace (não é modificado)
+    - objective: nome em OBJECTIVES
+    - switch_penalty: custo extra por troca de contexto (objetivo 'throughput')
+    - cache: ResultCache opcional, compartilhado entre execuções
+    """
+
+    def __init__(self, processes, objective='mean_wait', switch_penalty=0.0, cache=None):
+        self.processes = processes
+        self.objective = objective
+        self.switch_penalty = switch_penalty
+        self.cache = cache
+        self.bursts = _burst_times(processes)
+        self.values = {}
+        self.simulations = 0
+
+    def context_switches(self, quantum):
+        # No Round Robin, cada fatia que não termina o processo é seguida de uma troca de contexto
+        # (um burst 0 roda uma fatia vazia e termina nela, sem troca)
+        return sum(max(-(-burst // quantum) - 1, 0) for burst in self.bursts)
+
+    def simulate(self, quantum):
+        if self.cache is not None:
+            from round_robin_simulacao import simulate_round_robin
+
+            return simulate_round_robin(self.processes, [quantum], keep_samples=False,
+                                        record_trace=False, cache=self.cache)[0]
+        return round_robin(fresh_copy(self.processes), quantum, trace=NullTrace(),
+                           keep_samples=False)
+
+    def __call__(self, quantum):
+        if quantum not in self.values:
+            metrics = self.simulate(quantum)
+            self.simulations += 1
+            # Instante final da simulação (throughput = finalizados / makespan)
+            metrics['makespan'] = (len(self.bursts) / metrics['throughput']
+                                   if metrics['throughput'] else 0)
+            self.values[quantum] = OBJECTIVES[self.objective](
+                metrics, self.context_switches(quantum), self.switch_penalty)
+        return self.values[quantum]
+
+    def best(self):
+        # Menor valor; em empate, o menor quantum
+        return min(self.values, key=lambda quantum: (self.values[quantum], quantum))
+
+
+def _bracket(evaluate, low, high):
+    """
+    Avalia uma grade geométrica (low, 2·low, 4·low, ..., high) e devolve o intervalo entre os
+    vizinhos do melhor ponto, onde a busca de seção áurea continua.
+    """
+    grid = []
+    quantum = low
+    while quantum < high:
+        grid.append(quantum)
+        quantum *= 2
+    grid.append(high)
+    best = min(range(len(grid)), key=lambda i: (evaluate(grid[i]), grid[i]))
+    return grid[max(best - 1, 0)], grid[min(best + 1, len(grid) - 1)]
+
+
+def _golden_section(evaluate, low, high):
+    """
+    Busca de seção áurea sobre inteiros em [low, high]: a cada passo descarta a parte do
+    intervalo além do pior ponto interno. Com a memorização, um dos pontos internos é
+    reaproveitado no passo seguinte. No final, os poucos inteiros restantes são avaliados.
+    """
+    while high - low > 3:
+        step = round(INV_PHI * (high - low))
+        left, right = high - step, low + step
+        if left >= right:
+            right = left + 1
+        if (evaluate(left), left) <= (evaluate(right), right):
+            high = right
+        else:
+            low = left
+    for quantum in range(low, high + 1):
+        evaluate(quantum)
+
+
+def optimize_quantum(processes, objective='mean_wait', low=1, high=None, switch_penalty=0.0,
+                     cache=None):
+    """
+    Procura o quantum que minimiza o objetivo (ou maximiza a vazão, em 'throughput').
+    - low, high: faixa de quanta (padrão de high: o maior burst, pois a partir dele todos
+      os quanta dão o mesmo resultado)
+
+    Primeiro uma grade geométrica localiza a região do melhor quantum; depois uma busca de
+    seção áurea refina dentro dela. O objetivo não precisa ser unimodal na faixa toda, só
+    perto do ponto encontrado pela grade.
+
+    Retorna um dicionário com o melhor quantum, o valor dele, a curva avaliada (lista de
+    (quantum, valor) ordenada por quantum) e o número de simulações feitas.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f'objetivo desconhecido: {objective} (opções: {", ".join(OBJECTIVES)})')
+    evaluate = QuantumObjective(processes, objective, switch_penalty, cache)
+    if high is None:
+        high = max(evaluate.bursts, default=low)
+    high = max(high, low)
+
+    _golden_section(evaluate, *_bracket(evaluate, low, high))
+
+    best = evaluate.best()
+    return {
+        'objective': objective,
+        'best_quantum': best,
+        'best_value': evaluate.values[best],
+        'curve': sorted(evaluate.values.items()),
+        'simulations': evaluate.simulations,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Busca do melhor quantum para um workload.')
+    parser.add_argument('--workload', help='arquivo JSON ou trace com os processos (padrão: aleatório)')
+    parser.add_argument('--processes', type=int, default=10, help='processos do workload aleatório')
+    parser.add_argument('--seed', type=int, help='semente do workload aleatório')
+    parser.add_argument('--objective', choices=sorted(OBJECTIVES), default='mean_wait')
+    parser.add_argument('--min', type=int, default=1, dest='low', help='menor quantum (padrão: 1)')
+    parser.add_argument('--max', type=int, dest='high', help='maior quantum (padrão: maior burst)')
+    parser.add_argument('--switch-penalty', type=float, default=0.0,
+                        help='custo extra por troca de contexto (objetivo throughput)')
+    parser.add_argument('--format', choices=['text', 'json'], default='text')
+    args = parser.parse_args(argv)
+
+    with open_workload(args.workload, args.processes, args.seed) as processes:
+        result = optimize_quantum(processes, args.objective, args.low, args.high,
+                                  args.switch_penalty)
+
+    if args.format == 'json':
+        json.dump(result, sys.stdout, indent=2)
+        print()
+        return
+
+    for quantum, value in result['curve']:
+        marker = '  <-- melhor' if quantum == result['best_quantum'] else ''
+        print(f"Quantum {quantum:>6}: {value:.4f}{marker}")
+    print(f"Melhor quantum para {result['objective']}: {result['best_quantum']} "
+          f"({result['simulations']} simulações)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+from array import array
+import hashlib
+import json
+import os
+import pickle
+import re
+import shutil
+import tempfile
+
+import execution_trace
+import round_robin_simulacao
+import streaming_metrics
+from execution_trace import NullTrace
+from round_robin_simulacao import ENGINE_VERSION, ProcessTable
+
+# Módulos cujo código-fonte entra na impressão digital do motor: qualquer mudança neles
+# invalida os resultados guardados
+_ENGINE_MODULES = (round_robin_simulacao, execution_trace, streaming_metrics)
+_NO_ARRIVAL = -1
+# Pasta própria do cache dentro da pasta escolhida, e arquivo que marca cada versão como criada
+# por ele: só pastas com o nome de uma impressão digital e com esse arquivo são apagadas
+_CACHE_SUBDIR = 'rr_cache'
+_MARKER = '.rr_cache'
+_VERSION_NAME = re.compile(r'[0-9a-f]{16}')
+
+
+def engine_fingerprint():
+    # ENGINE_VERSION mais um hash do código dos módulos do motor
+    digest = hashlib.sha256(ENGINE_VERSION.encode())
+    for module in _ENGINE_MODULES:
+        with open(module.__file__, 'rb') as source:
+            digest.update(source.read())
+    return digest.hexdigest()
+
+
+def workload_digest(processes, chunk_size=65536):
+    """
+    Hash do conteúdo do workload (nome, burst e chegada de cada processo, na ordem), igual
+    para uma lista, uma ProcessTable ou um trace em streaming com os mesmos processos.
+    Cada coluna tem seu próprio hash, atualizado em blocos (a ProcessTable de uma vez só).
+    """
+    bursts, arrivals, names = hashlib.sha256(), hashlib.sha256(), hashlib.sha256()
+    if isinstance(processes, ProcessTable):
+        bursts.update(processes.burst_time.tobytes())
+        arrivals.update(processes.arrival_time.tobytes())
+        for name in processes.names:
+            names.update(name.encode('utf-8') + b'\0')
+    else:
+        burst_chunk, arrival_chunk = array('q'), array('q')
+        for process in processes:
+            burst_chunk.append(process.burst_time)
+            arrival_chunk.append(_NO_ARRIVAL if process.arrival_time is None else process.arrival_time)
+            names.update(process.name.encode('utf-8') + b'\0')
+            if len(burst_chunk) >= chunk_size:
+                bursts.update(burst_chunk.tobytes())
+                arrivals.update(arrival_chunk.tobytes())
+                del burst_chunk[:], arrival_chunk[:]
+        bursts.update(burst_chunk.tobytes())
+        arrivals.update(arrival_chunk.tobytes())
+
+    digest = hashlib.sha256()
+    for column in (bursts, arrivals, names):
+        digest.update(column.digest())
+    return digest.hexdigest()
+
+
+# Classe ResultCache - cache em disco das métricas, endereçado pelo conteúdo
+class ResultCache:
+    """
+    Guarda métricas de simulação em disco, com chave = hash(workload, parâmetros, motor).
+    - directory: pasta do cache
+    - max_bytes: tamanho máximo; ao passar dele, as entradas usadas há mais tempo são
+      removidas (LRU pela data de modificação, atualizada a cada acerto)
+
+    As entradas ficam em directory/rr_cache/<versão do motor>; ao abrir o cache, as pastas de
+    outras versões criadas por ele são apagadas, então resultados antigos nunca são
+    reaproveitados. Nada fora de directory/rr_cache é tocado.
+    """
+
+    def __init__(self, directory, max_bytes=512 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.fingerprint = engine_fingerprint()
+        root = os.path.join(directory, _CACHE_SUBDIR)
+        self.directory = os.path.join(root, self.fingerprint[:16])
+        self._create()
+        self.hits = 0
+        self.misses = 0
+        for entry in os.scandir(root):
+            if (entry.is_dir(follow_symlinks=False) and entry.path != self.directory
+                    and _VERSION_NAME.fullmatch(entry.name)
+                    and os.path.isfile(os.path.join(entry.path, _MARKER))):
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+    def _create(self):
+        os.makedirs(self.directory, exist_ok=True)
+        open(os.path.join(self.directory, _MARKER), 'a').close()
+
+    def key(self, workload_hash, **params):
+        # Chave da entrada: hash do workload + parâmetros da simulação
+        payload = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha256(f'{workload_hash}:{payload}'.encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.pkl')
+
+    def get(self, key):
+        # Devolve as métricas guardadas (ou None) e marca a entrada como usada agora
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as entry:
+                metrics = pickle.load(entry)
+            os.utime(path)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return metrics
+
+    def put(self, key, metrics, include_trace=False):
+        """
+        Guarda as métricas; a sequência de execução só é guardada se include_trace for True
+        (e se ela estiver em memória).
+        """
+        metrics = dict(metrics)
+        trace = metrics.get('execution_sequence')
+        if not include_trace or getattr(trace, 'path', None) is not None:
+            metrics['execution_sequence'] = NullTrace()
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(descriptor, 'wb') as entry:
+            pickle.dump(metrics, entry, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, self._path(key))   # Escrita atômica
+        self._evict()
+
+    def _evict(self):
+        entries = [entry for entry in os.scandir(self.directory) if entry.name.endswith('.pkl')]
+        total = sum(entry.stat().st_size for entry in entries)
+        if total <= self.max_bytes:
+            return
+        # Remove as menos usadas recentemente até caber no limite
+        for entry in sorted(entries, key=lambda entry: entry.stat().st_mtime):
+            total -= entry.stat().st_size
+            os.remove(entry.path)
+            if total <= self.max_bytes:
+                break
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self._create()
@@ -1,21 +1,41 @@
+from array import array
 from collections import deque
+from contextlib import nullcontext
+import argparse
+import csv
+import heapq
+import json
+import os
 import random
-import copy
-import statistics
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-import seaborn as sns
+import sys
 
-# Estilo para os gráficos
-sns.set(style="whitegrid")
-plt.rcParams["figure.figsize"] = (12, 6)
+from execution_trace import ExecutionTrace, NullTrace
+from streaming_metrics import RunningStats, PERCENTILES
+
+# NumPy, as bibliotecas de gráficos e o pool de processos da varredura paralela são importados
+# só quando usados, para o script iniciar rápido quando roda em lote (--no-plot)
+
+# Custo (em unidades de tempo) de uma troca de contexto após uma preempção
+CONTEXT_SWITCH_TIME = 1
+
+# Versão do motor de simulação; entra na chave do ResultCache (result_cache.py). Incrementar
+# quando a semântica da simulação mudar (o cache também detecta mudanças no código-fonte)
+ENGINE_VERSION = '1'
+
+
+# Marca de "sem valor" (None) nas colunas inteiras da ProcessTable
+_NO_VALUE = -1
 
 
 # Classe Process - representa cada processo do sistema
 class Process:
-    def __init__(self, name, burst_time):
+    # __slots__ evita um __dict__ por instância (bem menos memória com milhões de processos)
+    __slots__ = ('name', 'burst_time', 'arrival_time', 'remaining_time', 'initial_time', 'completion_time')
+
+    def __init__(self, name, burst_time, arrival_time=None):
         self.name = name
         self.burst_time = burst_time
+        self.arrival_time = arrival_time  # Instante de chegada (None = usa o padrão de round_robin())
         self.remaining_time = burst_time
         self.initial_time = None        # Quando o processo começou a ser executado pela primeira vez
         self.completion_time = None     # Quando o processo terminou completamente
@@ -27,33 +47,270 @@ class Process:
         self.completion_time = None
 
 
-def round_robin(processes, quantum, arrival_time=0):
+def _column_property(column):
+    # Propriedade que lê/escreve uma coluna da tabela, traduzindo _NO_VALUE <-> None
+    def getter(self):
+        value = getattr(self._table, column)[self._index]
+        return None if value == _NO_VALUE else value
+
+    def setter(self, value):
+        getattr(self._table, column)[self._index] = _NO_VALUE if value is None else value
+
+    return property(getter, setter)
+
+
+# Classe ProcessView - "visão" de uma linha da ProcessTable com a mesma interface de Process
+class ProcessView:
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+
+    @property
+    def name(self):
+        return self._table.names[self._index]
+
+    @property
+    def burst_time(self):
+        return self._table.burst_time[self._index]
+
+    arrival_time = _column_property('arrival_time')
+    remaining_time = _column_property('remaining_time')
+    initial_time = _column_property('initial_time')
+    completion_time = _column_property('completion_time')
+
+    def reset(self):
+        self._table.remaining_time[self._index] = self._table.burst_time[self._index]
+        self._table.initial_time[self._index] = _NO_VALUE
+        self._table.completion_time[self._index] = _NO_VALUE
+
+
+# Classe ProcessTable - tabela de processos em colunas (struct-of-arrays)
+class ProcessTable:
+    """
+    Guarda cada campo dos processos como uma coluna em um array tipado (int64), em vez de um
+    objeto Python por processo. Valores None são guardados como -1.
+    Iterar ou indexar a tabela devolve objetos ProcessView, que podem ser passados para
+    round_robin() no lugar de objetos Process.
+    """
+
+    def __init__(self, names=(), burst_times=(), arrival_times=None):
+        self.names = list(names)
+        self.burst_time = array('q', burst_times)
+        if arrival_times is None:
+            self.arrival_time = array('q', [_NO_VALUE]) * len(self.names)
+        else:
+            self.arrival_time = array('q', (_NO_VALUE if a is None else a for a in arrival_times))
+        self.remaining_time = array('q')
+        self.initial_time = array('q')
+        self.completion_time = array('q')
+        self.reset()
+
+    @classmethod
+    def from_processes(cls, processes):
+        # Converte uma lista de objetos Process para a forma em colunas
+        return cls([p.name for p in processes],
+                   [p.burst_time for p in processes],
+                   [p.arrival_time for p in processes])
+
+    def append(self, name, burst_time, arrival_time=None):
+        self.names.append(name)
+        self.burst_time.append(burst_time)
+        self.arrival_time.append(_NO_VALUE if arrival_time is None else arrival_time)
+        self.remaining_time.append(burst_time)
+        self.initial_time.append(_NO_VALUE)
+        self.completion_time.append(_NO_VALUE)
+
+    def reset(self):
+        # Retorna todos os processos ao estado inicial de uma vez (operação em bloco)
+        total = len(self.names)
+        self.remaining_time = array('q', self.burst_time)
+        self.initial_time = array('q', [_NO_VALUE]) * total
+        self.completion_time = array('q', [_NO_VALUE]) * total
+
+    def copy(self):
+        # Cópia no estado inicial (os nomes são compartilhados, pois nunca são alterados)
+        table = ProcessTable()
+        table.names = self.names
+        table.burst_time = array('q', self.burst_time)
+        table.arrival_time = array('q', self.arrival_time)
+        table.reset()
+        return table
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.names)
+        if not 0 <= index < len(self.names):
+            raise IndexError('índice fora da tabela de processos')
+        return ProcessView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.names)):
+            yield ProcessView(self, index)
+
+
+def table_arrival_order(table, default_arrival=0):
+    """
+    Ordem de chegada de uma ProcessTable sem criar um objeto por processo.
+    Retorna (índices em ordem de chegada, função índice -> instante de chegada). Se a coluna
+    arrival_time já estiver em ordem, os índices são só um range; senão, um array de índices
+    com ordenação estável (empates respeitam a posição na tabela).
+    """
+    column = table.arrival_time
+
+    def arrival(index):
+        value = column[index]
+        return default_arrival if value == _NO_VALUE else value
+
+    order = range(len(table))
+    if any(arrival(i) > arrival(i + 1) for i in range(len(table) - 1)):
+        order = array('q', sorted(order, key=arrival))
+    return order, arrival
+
+
+# Classe ArrivalQueue - processos que ainda não chegaram, em ordem de chegada
+class ArrivalQueue:
+    """
+    Entrega os processos em ordem de chegada para os motores de simulação.
+    - Listas e tuplas vão para um heap ordenado por (chegada, posição na lista).
+    - Numa ProcessTable a ordem sai da coluna arrival_time (um array de índices, ou nada se a
+      coluna já estiver em ordem) e cada ProcessView só é criada quando o processo chega.
+    - Qualquer outro iterável (ex.: um gerador lendo um trace do disco) é consumido aos
+      poucos, só quando o relógio alcança a próxima chegada, sem materializar a lista; nesse
+      caso os processos precisam vir ordenados por tempo de chegada.
+    """
+
+    def __init__(self, processes, arrival_time=0):
+        self.default_arrival = arrival_time
+        if isinstance(processes, ProcessTable):
+            self._source = self._table_order(processes)
+        elif isinstance(processes, (list, tuple)):
+            heap = [(self.arrival_of(process), index, process) for index, process in enumerate(processes)]
+            heapq.heapify(heap)
+            self._source = self._drain(heap)
+        else:
+            self._source = self._ordered(processes)
+        self._next = next(self._source, None)
+
+    def arrival_of(self, process):
+        return process.arrival_time if process.arrival_time is not None else self.default_arrival
+
+    def _table_order(self, table):
+        order, arrival = table_arrival_order(table, self.default_arrival)
+        for index in order:
+            yield arrival(index), ProcessView(table, index)
+
+    @staticmethod
+    def _drain(heap):
+        while heap:
+            arrival, _, process = heapq.heappop(heap)
+            yield arrival, process
+
+    def _ordered(self, processes):
+        last_arrival = None
+        for process in processes:
+            arrival = self.arrival_of(process)
+            if last_arrival is not None and arrival < last_arrival:
+                raise ValueError('processos em streaming precisam estar ordenados por tempo de chegada')
+            last_arrival = arrival
+            yield arrival, process
+
+    @property
+    def next_time(self):
+        # Instante da próxima chegada
+        return self._next[0]
+
+    def pop(self):
+        process = self._next[1]
+        self._next = next(self._source, None)
+        return process
+
+    def __bool__(self):
+        return self._next is not None
+
+
+def build_metrics(quantum, waiting_stats, return_stats, finished_processes, current_time,
+                  execution_sequence, waiting_time_list=None, return_time_list=None):
+    """
+    Monta o dicionário de métricas a partir dos acumuladores de tempo de espera e de retorno.
+    As listas de amostras só aparecem se tiverem sido guardadas (senão ficam como None).
+    """
+    metrics = {
+        'quantum': quantum,
+        'average_waiting_time': waiting_stats.mean,
+        'waiting_time_std': waiting_stats.stdev,
+        'average_return_time': return_stats.mean,
+        'return_time_std': return_stats.stdev,
+        'throughput': finished_processes / current_time if current_time > 0 else 0,
+        'execution_sequence': execution_sequence,
+        'waiting_times': waiting_time_list,
+        'return_times': return_time_list,
+        'waiting_stats': waiting_stats,
+        'return_stats': return_stats
+    }
+    # Percentis (p50/p95/p99) estimados pelos sketches
+    for p in PERCENTILES:
+        metrics[f'waiting_time_p{p}'] = waiting_stats.percentile(p)
+        metrics[f'return_time_p{p}'] = return_stats.percentile(p)
+    return metrics
+
+
+def round_robin(processes, quantum, arrival_time=0, trace=None, keep_samples=True):
     """
     Função que simula o escalonamento Round Robin.
-    - processes: lista de processos (objetos da classe Process)
+    - processes: lista de processos (objetos da classe Process), uma ProcessTable ou um
+      iterável em ordem de chegada (ex.: trace_loader.open_trace()), consumido em streaming
     - quantum: valor do quantum (tempo de fatia de CPU para cada processo)
-    - arrival_time: tempo de chegada dos processos (aqui assumimos todos chegam em 0)
+    - arrival_time: tempo de chegada padrão, usado pelos processos sem arrival_time próprio
+    - trace: ExecutionTrace onde gravar a sequência de execução (padrão: um trace novo em
+      memória); use ExecutionTrace(path) para mandar a sequência direto para o disco
+    - keep_samples: se False, não guarda as listas de tempos de espera/retorno; média, desvio
+      padrão e percentis saem dos acumuladores em memória constante
+
+    A simulação é orientada a eventos: as chegadas ficam num heap ordenado pelo instante de
+    chegada (empates respeitam a ordem da lista) e, quando a CPU fica ociosa, o relógio pula
+    direto para a próxima chegada.
 
     Retorna um dicionário com diversas métricas e a sequência de execução.
     """
-    ready_queue = deque(processes)
+    if isinstance(processes, ProcessTable):
+        return _round_robin_table(processes, quantum, arrival_time, trace, keep_samples)
+
+    # Chegadas ordenadas por (instante_chegada, posição_na_lista)
+    arrivals = ArrivalQueue(processes, arrival_time)
+
+    ready_queue = deque()
     current_time = 0
     finished_processes = 0
-    total_processes = len(processes)
 
-    execution_sequence = []  # Armazena (tempo_inicio, nome_processo, duração_executada)
-    waiting_time_list = []
-    return_time_list = []
+    # Armazena (tempo_inicio, id_processo, duração_executada)
+    execution_sequence = trace if trace is not None else ExecutionTrace()
+    waiting_stats = RunningStats()
+    return_stats = RunningStats()
+    waiting_time_list = [] if keep_samples else None
+    return_time_list = [] if keep_samples else None
+
+    def admit_arrivals():
+        # Coloca na fila todos os processos que já chegaram, registrando-os no trace
+        while arrivals and arrivals.next_time <= current_time:
+            process = arrivals.pop()
+            ready_queue.append((execution_sequence.add_process(process.name), process))
 
     # Loop até que todos os processos sejam concluídos
-    while finished_processes < total_processes:
+    while ready_queue or arrivals:
+        admit_arrivals()
+
         if not ready_queue:
-            # Se não há processo pronto, avança o tempo
-            current_time += 1
+            # CPU ociosa: avança o tempo direto para a próxima chegada
+            current_time = arrivals.next_time
             continue
 
         # Pega o próximo processo da fila
-        process = ready_queue.popleft()
+        pid, process = ready_queue.popleft()
 
         # Se for a primeira execução do processo, registra o tempo inicial
         if process.initial_time is None:
@@ -64,71 +321,349 @@ def round_robin(processes, quantum, arrival_time=0):
         process.remaining_time -= exec_time
 
         # Adiciona a execução no histórico
-        execution_sequence.append((current_time, process.name, exec_time))
+        execution_sequence.append(current_time, pid, exec_time)
 
         # Avança o tempo corrente
         current_time += exec_time
 
+        # Quem chegou durante a fatia entra na fila antes do processo preemptado
+        admit_arrivals()
+
         # Verifica se o processo finalizou
         if process.remaining_time == 0:
             process.completion_time = current_time
             finished_processes += 1
 
-            # Cálculo do tempo de espera e retorno
-            # Todos chegam em arrival_time = 0
-            wait_time = process.completion_time - process.burst_time
-            ret_time = process.completion_time  # retorno = completion_time - arrival_time (0)
-            waiting_time_list.append(wait_time)
-            return_time_list.append(ret_time)
+            # Cálculo do tempo de espera e retorno em relação à chegada real
+            ret_time = process.completion_time - arrivals.arrival_of(process)
+            wait_time = ret_time - process.burst_time
+            waiting_stats.add(wait_time)
+            return_stats.add(ret_time)
+            if keep_samples:
+                waiting_time_list.append(wait_time)
+                return_time_list.append(ret_time)
         else:
             # Se ainda não finalizou, volta para a fila
-            ready_queue.append(process)
+            ready_queue.append((pid, process))
             
         # Inserimos um tempo de troca de contexto se ainda existem processos pendentes
         if ready_queue and process.remaining_time > 0:
-            current_time += 1
+            current_time += CONTEXT_SWITCH_TIME
+
+    # Traces em disco são finalizados aqui (grava o restante e os nomes)
+    execution_sequence.close()
 
     # Cálculo das métricas finais
-    avg_waiting_time = sum(waiting_time_list) / total_processes
-    avg_return_time = sum(return_time_list) / total_processes
-    waiting_time_std = statistics.stdev(waiting_time_list) if len(waiting_time_list) > 1 else 0
-    return_time_std = statistics.stdev(return_time_list) if len(return_time_list) > 1 else 0
-    throughput = finished_processes / current_time if current_time > 0 else 0
+    return build_metrics(quantum, waiting_stats, return_stats, finished_processes, current_time,
+                         execution_sequence, waiting_time_list, return_time_list)
 
-    metrics = {
-        'quantum': quantum,
-        'average_waiting_time': avg_waiting_time,
-        'waiting_time_std': waiting_time_std,
-        'average_return_time': avg_return_time,
-        'return_time_std': return_time_std,
-        'throughput': throughput,
-        'execution_sequence': execution_sequence,
-        'waiting_times': waiting_time_list,
-        'return_times': return_time_list
-    }
 
-    return metrics
+def _round_robin_table(table, quantum, arrival_time, trace, keep_samples):
+    """
+    round_robin() direto nas colunas de uma ProcessTable: a fila de prontos guarda só o índice
+    de cada processo (o pid no trace fica numa coluna à parte), sem criar um objeto por
+    processo. Mesmas regras e mesmo resultado de round_robin() com a lista equivalente.
+    """
+    order, arrival_of = table_arrival_order(table, arrival_time)
+    names, burst_time = table.names, table.burst_time
+    remaining_time, initial_time, completion_time = (table.remaining_time, table.initial_time,
+                                                     table.completion_time)
+    pid_of = array('q', [0]) * len(table)
+    arrivals = iter(order)
+    next_index = next(arrivals, None)
+
+    ready_queue = deque()
+    current_time = 0
+    finished_processes = 0
+
+    execution_sequence = trace if trace is not None else ExecutionTrace()
+    waiting_stats = RunningStats()
+    return_stats = RunningStats()
+    waiting_time_list = [] if keep_samples else None
+    return_time_list = [] if keep_samples else None
+
+    def admit_arrivals():
+        nonlocal next_index
+        while next_index is not None and arrival_of(next_index) <= current_time:
+            pid_of[next_index] = execution_sequence.add_process(names[next_index])
+            ready_queue.append(next_index)
+            next_index = next(arrivals, None)
+
+    while ready_queue or next_index is not None:
+        admit_arrivals()
+
+        if not ready_queue:
+            # CPU ociosa: avança o tempo direto para a próxima chegada
+            current_time = arrival_of(next_index)
+            continue
+
+        index = ready_queue.popleft()
+        if initial_time[index] == _NO_VALUE:
+            initial_time[index] = current_time
+
+        exec_time = min(quantum, remaining_time[index])
+        remaining_time[index] -= exec_time
+        execution_sequence.append(current_time, pid_of[index], exec_time)
+        current_time += exec_time
+
+        # Quem chegou durante a fatia entra na fila antes do processo preemptado
+        admit_arrivals()
+
+        if remaining_time[index] == 0:
+            completion_time[index] = current_time
+            finished_processes += 1
+
+            ret_time = current_time - arrival_of(index)
+            wait_time = ret_time - burst_time[index]
+            waiting_stats.add(wait_time)
+            return_stats.add(ret_time)
+            if keep_samples:
+                waiting_time_list.append(wait_time)
+                return_time_list.append(ret_time)
+        else:
+            ready_queue.append(index)
+            current_time += CONTEXT_SWITCH_TIME
+
+    execution_sequence.close()
+
+    return build_metrics(quantum, waiting_stats, return_stats, finished_processes, current_time,
+                         execution_sequence, waiting_time_list, return_time_list)
+
+
+def round_robin_numpy(burst_times, quantum, names=None):
+    """
+    Versão vetorizada (NumPy) do Round Robin, pensada para conjuntos muito grandes de processos.
+    - burst_times: sequência/array com o burst time de cada processo (todos chegam em 0)
+    - quantum: valor do quantum
+    - names: nomes dos processos (padrão: "P1", "P2", ...)
+
+    Em vez de tirar e recolocar um processo por vez na fila, calcula rodadas inteiras de uma vez:
+    rodadas em que nenhum processo termina são puladas em bloco (cada sobrevivente consome um
+    quantum cheio), e na rodada em que alguém termina os tempos de término saem de uma soma
+    acumulada dos tempos executados mais as trocas de contexto.
+
+    Retorna o mesmo dicionário de métricas de round_robin().
+    """
+    import numpy as np
+
+    bursts = np.asarray(burst_times, dtype=np.int64)
+    total_processes = len(bursts)
+    if names is None:
+        names = [f"P{i+1}" for i in range(total_processes)]
+    names = np.asarray(names, dtype=object)
+
+    ids = np.arange(total_processes)       # Processos ainda na fila, na ordem da fila
+    remaining = bursts.copy()
+    current_time = 0
+
+    # Pedaços da sequência de execução e dos processos finalizados, concatenados no final
+    seq_starts, seq_ids, seq_durations = [], [], []
+    finished_ids, completion_times = [], []
+
+    step = quantum + CONTEXT_SWITCH_TIME
+    while ids.size:
+        # Rodadas completas em que nenhum processo termina: todos usam o quantum inteiro
+        rounds_needed = np.maximum(-(-remaining // quantum), 1)
+        skipped_rounds = int(rounds_needed.min()) - 1
+        if skipped_rounds > 0:
+            alive = ids.size
+            slices = skipped_rounds * alive
+            seq_starts.append(current_time + np.arange(slices, dtype=np.int64) * step)
+            seq_ids.append(np.tile(ids, skipped_rounds))
+            seq_durations.append(np.full(slices, quantum, dtype=np.int64))
+            current_time += slices * step
+            remaining -= skipped_rounds * quantum
+
+        # Rodada em que pelo menos um processo termina
+        exec_time = np.minimum(remaining, quantum)
+        done = remaining <= quantum
+        cost = exec_time + CONTEXT_SWITCH_TIME * (~done)  # Só há troca de contexto após preempção
+        ends = current_time + np.cumsum(cost)
+
+        seq_starts.append(ends - cost)
+        seq_ids.append(ids)
+        seq_durations.append(exec_time)
+        finished_ids.append(ids[done])
+        completion_times.append(ends[done])
+
+        current_time = int(ends[-1])
+        keep = ~done
+        ids = ids[keep]
+        remaining = remaining[keep] - exec_time[keep]
+
+    finished_ids = np.concatenate(finished_ids) if finished_ids else np.empty(0, dtype=np.int64)
+    completion = np.concatenate(completion_times) if completion_times else np.empty(0, dtype=np.int64)
+
+    # Todos chegam em 0: retorno = término, espera = término - burst
+    return_times = completion
+    waiting_times = completion - bursts[finished_ids]
+
+    starts = np.concatenate(seq_starts) if seq_starts else np.empty(0, dtype=np.int64)
+    order = np.concatenate(seq_ids) if seq_ids else np.empty(0, dtype=np.int64)
+    durations = np.concatenate(seq_durations) if seq_durations else np.empty(0, dtype=np.int64)
+    execution_sequence = ExecutionTrace.from_arrays(starts, order, durations, names)
+
+    return build_metrics(quantum, RunningStats.from_array(waiting_times),
+                         RunningStats.from_array(return_times), total_processes, current_time,
+                         execution_sequence, waiting_times.tolist(), return_times.tolist())
+
+
+# Workload compartilhado por cada worker do pool (preenchido em _init_sweep_worker)
+_sweep_workload = None
+
+
+def fresh_copy(processes):
+    """
+    Cópia do workload (lista de Process ou ProcessTable) com todos os processos no estado inicial.
+    Outros iteráveis (ex.: trace_loader.open_trace()) são devolvidos como estão: eles já geram
+    processos novos a cada iteração.
+    """
+    if isinstance(processes, ProcessTable):
+        return processes.copy()
+    if isinstance(processes, (list, tuple)):
+        return [Process(p.name, p.burst_time, p.arrival_time) for p in processes]
+    return processes
+
+
+def _fresh_processes(names, burst_times, arrival_times):
+    # Monta processos novos (no estado inicial) a partir das colunas do workload
+    return [Process(name, burst, arrival)
+            for name, burst, arrival in zip(names, burst_times, arrival_times)]
+
+
+def _init_sweep_worker(shm_name, total_processes, names):
+    """
+    Inicializa um worker do pool: conecta no bloco de memória compartilhada que guarda os
+    burst times e tempos de chegada (somente leitura) e guarda os nomes recebidos uma única vez.
+    """
+    from multiprocessing import shared_memory
+    import numpy as np
+
+    global _sweep_workload
+    shm = shared_memory.SharedMemory(name=shm_name)
+    columns = np.ndarray((2, total_processes), dtype=np.int64, buffer=shm.buf)
+    _sweep_workload = (shm, columns, names)
+
+
+def _run_sweep_quantum(task):
+    quantum, options = task
+    shm, columns, names = _sweep_workload
+    burst_times = columns[0].tolist()
+    # -1 (_NO_VALUE) marca processos sem tempo de chegada próprio
+    arrival_times = [None if a == _NO_VALUE else a for a in columns[1].tolist()]
+    return round_robin(_fresh_processes(names, burst_times, arrival_times), quantum, **options)
 
 
-def simulate_round_robin(processes, quanta):
+def simulate_round_robin(processes, quanta, parallel=False, max_workers=None,
+                         keep_samples=True, record_trace=True, cache=None):
     """
     Simula o Round Robin para diferentes valores de quantum.
-    Retorna uma lista com as métricas de cada simulação.
+    - processes: lista de processos, ProcessTable ou trace em streaming (não é modificado)
+    - quanta: valores de quantum a testar
+    - parallel: se True, cada quantum roda em um worker de um pool de processos
+    - max_workers: número de workers do pool (padrão: número de CPUs)
+    - keep_samples: repassado para round_robin()
+    - record_trace: se False, a sequência de execução não é guardada (memória limitada)
+    - cache: ResultCache opcional (result_cache.py); quanta já simulados para o mesmo workload
+      são lidos do disco e só os que faltam são simulados
+
+    No modo paralelo o workload é copiado uma única vez para um bloco de memória
+    compartilhada, lido por todos os workers, em vez de ser copiado a cada quantum.
+    Retorna uma lista com as métricas de cada simulação, na ordem de quanta.
     """
-    all_metrics = []
-    for q in quanta:
-        # Faz uma cópia dos processos (para não bagunçar a lista original)
-        processes_copy = copy.deepcopy(processes)
-        metrics = round_robin(processes_copy, q)
-        all_metrics.append(metrics)
-    return all_metrics
+    if cache is None:
+        return _simulate_quanta(processes, quanta, parallel, max_workers, keep_samples,
+                                record_trace)
+
+    from result_cache import workload_digest
+
+    workload_hash = workload_digest(processes)
+    keys = [cache.key(workload_hash, engine='round_robin', quantum=q,
+                      context_switch_time=CONTEXT_SWITCH_TIME, keep_samples=keep_samples,
+                      record_trace=record_trace)
+            for q in quanta]
+    results = [cache.get(key) for key in keys]
+    missing = [i for i, metrics in enumerate(results) if metrics is None]
+    if missing:
+        computed = _simulate_quanta(processes, [quanta[i] for i in missing], parallel,
+                                    max_workers, keep_samples, record_trace)
+        for i, metrics in zip(missing, computed):
+            cache.put(keys[i], metrics, include_trace=record_trace)
+            results[i] = metrics
+    return results
+
+
+def _simulate_quanta(processes, quanta, parallel, max_workers, keep_samples, record_trace):
+    def options():
+        return {'keep_samples': keep_samples, 'trace': None if record_trace else NullTrace()}
+
+    if not parallel:
+        all_metrics = []
+        for q in quanta:
+            # Processos novos a cada quantum (para não bagunçar os processos originais)
+            processes_copy = fresh_copy(processes)
+            metrics = round_robin(processes_copy, q, **options())
+            all_metrics.append(metrics)
+        return all_metrics
+
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+    import numpy as np
+
+    if isinstance(processes, ProcessTable):
+        names = processes.names
+        burst_times = processes.burst_time
+        arrival_times = processes.arrival_time
+    else:
+        # Uma única passada (traces em streaming só são lidos uma vez aqui)
+        rows = [(p.name, p.burst_time, _NO_VALUE if p.arrival_time is None else p.arrival_time)
+                for p in processes]
+        names = [row[0] for row in rows]
+        burst_times = [row[1] for row in rows]
+        arrival_times = [row[2] for row in rows]
+        del rows
+
+    total_processes = len(names)
+    shm = shared_memory.SharedMemory(create=True, size=max(2 * total_processes * 8, 1))
+    try:
+        columns = np.ndarray((2, total_processes), dtype=np.int64, buffer=shm.buf)
+        columns[0] = burst_times
+        columns[1] = arrival_times
+        del columns  # Solta a referência ao buffer antes de fechar o bloco
+
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_sweep_worker,
+                                 initargs=(shm.name, total_processes, names)) as executor:
+            # map preserva a ordem dos quanta
+            return list(executor.map(_run_sweep_quantum, [(q, options()) for q in quanta]))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _load_plotting():
+    """
+    Importa matplotlib/seaborn (só quando algum gráfico é pedido) e aplica o estilo dos gráficos.
+    Retorna (pyplot, patches, seaborn).
+    """
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as mpatches
+    import seaborn as sns
 
+    # Estilo para os gráficos
+    sns.set(style="whitegrid")
+    plt.rcParams["figure.figsize"] = (12, 6)
+    return plt, mpatches, sns
 
-def plot_metrics(all_metrics):
+
+def plot_metrics(all_metrics, output=None):
     """
     Plota gráficos comparando as métricas (tempo médio de espera, retorno e vazão)
     para diferentes valores de quantum.
+    - output: caminho de um arquivo (.png, .svg, ...) para salvar o gráfico sem abrir janela
     """
+    plt, _, sns = _load_plotting()
+    from matplotlib.figure import Figure
+
     quanta = [m['quantum'] for m in all_metrics]
     avg_waiting = [m['average_waiting_time'] for m in all_metrics]
     std_waiting = [m['waiting_time_std'] for m in all_metrics]
@@ -136,105 +671,329 @@ def plot_metrics(all_metrics):
     std_return = [m['return_time_std'] for m in all_metrics]
     throughput = [m['throughput'] for m in all_metrics]
 
-    plt.figure(figsize=(14, 6))
+    fig = Figure(figsize=(14, 6)) if output is not None else plt.figure(figsize=(14, 6))
+    ax_waiting, ax_return, ax_throughput = fig.subplots(1, 3)
 
     # Plot do Tempo Médio de Espera
-    plt.subplot(1, 3, 1)
-    sns.barplot(x=quanta, y=avg_waiting, palette="Blues_d")
-    plt.errorbar(x=range(len(quanta)), y=avg_waiting, yerr=std_waiting, fmt='none', color='black', capsize=5)
-    plt.xlabel('Quantum')
-    plt.ylabel('Tempo Médio de Espera')
-    plt.title('Tempo Médio de Espera vs Quantum')
+    sns.barplot(x=quanta, y=avg_waiting, palette="Blues_d", ax=ax_waiting)
+    ax_waiting.errorbar(x=range(len(quanta)), y=avg_waiting, yerr=std_waiting, fmt='none', color='black', capsize=5)
+    ax_waiting.set_xlabel('Quantum')
+    ax_waiting.set_ylabel('Tempo Médio de Espera')
+    ax_waiting.set_title('Tempo Médio de Espera vs Quantum')
 
     # Plot do Tempo Médio de Retorno
-    plt.subplot(1, 3, 2)
-    sns.barplot(x=quanta, y=avg_return, palette="Greens_d")
-    plt.errorbar(x=range(len(quanta)), y=avg_return, yerr=std_return, fmt='none', color='black', capsize=5)
-    plt.xlabel('Quantum')
-    plt.ylabel('Tempo Médio de Retorno')
-    plt.title('Tempo Médio de Retorno vs Quantum')
+    sns.barplot(x=quanta, y=avg_return, palette="Greens_d", ax=ax_return)
+    ax_return.errorbar(x=range(len(quanta)), y=avg_return, yerr=std_return, fmt='none', color='black', capsize=5)
+    ax_return.set_xlabel('Quantum')
+    ax_return.set_ylabel('Tempo Médio de Retorno')
+    ax_return.set_title('Tempo Médio de Retorno vs Quantum')
 
     # Plot da Vazão
-    plt.subplot(1, 3, 3)
-    sns.barplot(x=quanta, y=throughput, palette="Oranges_d")
-    plt.xlabel('Quantum')
-    plt.ylabel('Vazão (Processos/Unidade de Tempo)')
-    plt.title('Vazão vs Quantum')
+    sns.barplot(x=quanta, y=throughput, palette="Oranges_d", ax=ax_throughput)
+    ax_throughput.set_xlabel('Quantum')
+    ax_throughput.set_ylabel('Vazão (Processos/Unidade de Tempo)')
+    ax_throughput.set_title('Vazão vs Quantum')
 
-    plt.tight_layout()
-    plt.show()
+    fig.tight_layout()
+    if output is not None:
+        fig.savefig(output)
+    else:
+        plt.show()
 
 
-def plot_gantt_chart(metrics, title_suffix=""):
+def _trace_columns(execution_sequence):
+    # Colunas (inícios, ids, durações) e nomes, seja de um ExecutionTrace ou de uma lista de tuplas
+    import numpy as np
+
+    if hasattr(execution_sequence, 'as_arrays'):
+        starts, pids, durations = execution_sequence.as_arrays()
+        return starts, pids, durations, list(execution_sequence.names)
+    ids = {}
+    rows = [(start, ids.setdefault(name, len(ids)), duration)
+            for start, name, duration in execution_sequence]
+    columns = np.array(rows, dtype=np.int64).reshape(-1, 3)
+    return columns[:, 0], columns[:, 1], columns[:, 2], list(ids)
+
+
+def _gantt_rectangles(starts, pids, durations, view, size_px, height=0.4):
+    """
+    Vértices dos retângulos do Gantt visíveis em view = (xmin, xmax, ymin, ymax).
+    - size_px: (largura, altura) da área do gráfico em pixels
+
+    Fatias mais estreitas que um pixel são agregadas em um retângulo por (processo, pixel), e
+    pixels vizinhos do mesmo processo viram um único retângulo. Se houver mais processos que
+    pixels na vertical, os processos de um mesmo pixel também são agrupados (com a cor do
+    primeiro deles). Assim o número de retângulos é limitado pelo tamanho da imagem e não
+    pelo número de fatias.
+    Retorna (vértices, id do processo usado para a cor de cada retângulo).
+    """
+    import numpy as np
+
+    xmin, xmax, ymin, ymax = view
+    width_px, height_px = max(int(size_px[0]), 1), max(int(size_px[1]), 1)
+    ends = starts + durations
+    visible = (ends >= xmin) & (starts <= xmax) & (pids >= ymin - 1) & (pids <= ymax + 1)
+    starts, pids, ends = starts[visible], pids[visible], ends[visible]
+
+    pixel = max((xmax - xmin) / width_px, 1e-9)
+    rows_per_pixel = (ymax - ymin) / height_px
+    if rows_per_pixel > 1:
+        # Vários processos por pixel vertical: agrupa as linhas e agrega todas as fatias
+        groups = np.floor((pids - ymin) / rows_per_pixel).astype(np.int64)
+        narrow = np.ones(len(pids), dtype=bool)
+    else:
+        groups = pids
+        narrow = (ends - starts) < pixel
+
+    # Fatias largas são desenhadas como estão
+    lefts = [starts[~narrow].astype(float)]
+    rights = [ends[~narrow].astype(float)]
+    rows = [groups[~narrow]]
+
+    if narrow.any():
+        # Um retângulo por (linha, pixel), juntando pixels vizinhos da mesma linha
+        stride = width_px + 3
+        first_bins = np.clip(np.floor((starts[narrow] - xmin) / pixel).astype(np.int64), -1, width_px + 1)
+        last_bins = np.clip(np.floor((ends[narrow] - xmin) / pixel).astype(np.int64), -1, width_px + 1)
+        spans = last_bins - first_bins + 1
+        # Cada fatia marca todos os pixels que cobre (poucos, já que é estreita ou agrupada)
+        slice_rows = np.repeat(groups[narrow], spans)
+        offsets = np.arange(spans.sum()) - np.repeat(np.cumsum(spans) - spans, spans)
+        bins = np.repeat(first_bins, spans) + offsets + 1
+        keys = np.unique(slice_rows * stride + bins)
+        key_rows, key_bins = np.divmod(keys, stride)
+        run_heads = np.ones(len(keys), dtype=bool)
+        run_heads[1:] = (np.diff(keys) != 1) | (key_rows[1:] != key_rows[:-1])
+        heads = np.flatnonzero(run_heads)
+        tails = np.append(heads[1:], len(keys)) - 1
+        left = xmin + (key_bins[heads] - 1) * pixel
+        lefts.append(left)
+        rights.append(xmin + key_bins[tails] * pixel)
+        rows.append(key_rows[heads])
+
+    lefts, rights, rows = np.concatenate(lefts), np.concatenate(rights), np.concatenate(rows)
+    if rows_per_pixel > 1:
+        bottoms = ymin + rows * rows_per_pixel - 0.5
+        tops = bottoms + rows_per_pixel
+        rows = np.minimum(np.ceil(bottoms + 0.5), ymax).astype(np.int64)
+    else:
+        bottoms, tops = rows - height / 2, rows + height / 2
+    verts = np.stack([np.column_stack([lefts, bottoms]), np.column_stack([lefts, tops]),
+                      np.column_stack([rights, tops]), np.column_stack([rights, bottoms])], axis=1)
+    return verts, rows
+
+
+def plot_gantt_chart(metrics, title_suffix="", output=None):
     """
     Plota o diagrama de Gantt com base na sequência de execução registrada.
     Isso ajuda a visualizar a ordem e a duração de execução de cada processo.
-    """
-    execution_sequence = metrics['execution_sequence']
-    quantum = metrics['quantum']
-
-    fig, ax = plt.subplots(figsize=(14, 6))
+    - output: caminho de um arquivo (.png, .svg, ...) para salvar o gráfico direto, sem abrir
+      janela interativa
 
-    colors = {}
-    color_palette = sns.color_palette("hsv", len(execution_sequence))
-    color_idx = 0
-
-    for start_time, proc_name, duration in execution_sequence:
-        if proc_name not in colors:
-            colors[proc_name] = color_palette[color_idx]
-            color_idx += 1
-        ax.barh(proc_name, duration, left=start_time, height=0.4, color=colors[proc_name], edgecolor='black')
+    Todas as fatias são desenhadas numa única coleção de polígonos, com uma cor por processo,
+    e as fatias menores que um pixel no zoom atual são agregadas (o gráfico é recalculado
+    quando o zoom muda na janela interativa).
+    """
+    import numpy as np
+    plt, mpatches, _ = _load_plotting()
+    from matplotlib.collections import PolyCollection
+    from matplotlib.figure import Figure
 
+    starts, pids, durations, names = _trace_columns(metrics['execution_sequence'])
+    quantum = metrics['quantum']
+    total_processes = len(names)
+
+    if output is not None:
+        fig = Figure(figsize=(14, 6))    # Sem pyplot: nenhuma janela é aberta
+        ax = fig.subplots()
+    else:
+        fig, ax = plt.subplots(figsize=(14, 6))
+
+    # Uma cor por processo (e não uma por fatia)
+    palette = plt.get_cmap('hsv')(np.arange(max(total_processes, 1)) / max(total_processes, 1))
+
+    xmax = float((starts + durations).max()) if len(starts) else 1.0
+    view = (0.0, xmax, -0.5, total_processes - 0.5)
+    size_px = (fig.get_figwidth() * fig.dpi * 0.8, fig.get_figheight() * fig.dpi * 0.8)
+    verts, rows = _gantt_rectangles(starts, pids, durations, view, size_px)
+    collection = PolyCollection(verts, facecolors=palette[rows],
+                                edgecolors='black' if len(starts) < 1000 else 'none', linewidths=0.5)
+    ax.add_collection(collection)
+    ax.set_xlim(0, xmax)
+    ax.set_ylim(-0.5, total_processes - 0.5)
+
+    def redraw_visible(ax):
+        # Recalcula a agregação para o novo intervalo visível
+        view = (*ax.get_xlim(), *sorted(ax.get_ylim()))
+        verts, rows = _gantt_rectangles(starts, pids, durations, view, (ax.bbox.width, ax.bbox.height))
+        collection.set_verts(verts)
+        collection.set_facecolor(palette[rows])
+
+    ax.callbacks.connect('xlim_changed', redraw_visible)
+    ax.callbacks.connect('ylim_changed', redraw_visible)
+
+    # Nomes e legenda só fazem sentido com poucos processos
+    if total_processes <= 50:
+        ax.set_yticks(range(total_processes), labels=names)
     ax.set_xlabel('Tempo')
     ax.set_ylabel('Processos')
     ax.set_title(f'Diagrama de Gantt - Quantum = {quantum} {title_suffix}')
     ax.grid(True)
 
-    # Legenda dos processos
-    patches = [mpatches.Patch(color=colors[p], label=p) for p in colors]
-    ax.legend(handles=patches, bbox_to_anchor=(1.05, 1), loc='upper left')
+    if total_processes <= 20:
+        # Legenda dos processos
+        patches = [mpatches.Patch(color=palette[pid], label=name) for pid, name in enumerate(names)]
+        ax.legend(handles=patches, bbox_to_anchor=(1.05, 1), loc='upper left')
+
+    fig.tight_layout()
+    if output is not None:
+        fig.savefig(output)
+    else:
+        plt.show()
 
-    plt.tight_layout()
-    plt.show()
 
+# Limites dos burst times curtos (T1..T2) e longos (T3..T4) do workload aleatório
+T1, T2 = 0, 5
+T3, T4 = 20, 25
 
-def main():
-    # Gerar alguns processos com burst times aleatórios
-    # Vamos manter a lógica de gerar processos com burst time variados.
-    T1, T2 = 0, 5
-    T3, T4 = 20, 25
-    num_processes = 10
+# Métricas escalares exportadas pela linha de comando (na ordem das colunas do CSV)
+SUMMARY_FIELDS = ['quantum', 'average_waiting_time', 'waiting_time_std', 'average_return_time',
+                  'return_time_std', 'throughput'] + \
+                 [f'{kind}_time_p{p}' for kind in ('waiting', 'return') for p in PERCENTILES]
 
+
+def generate_workload(num_processes=10, seed=None):
+    """
+    Gera processos com burst times variados: os de índice par são curtos (T1..T2) e os
+    de índice ímpar são longos (T3..T4). Todos chegam em 0.
+    """
+    rng = random.Random(seed)
     processes = []
     for i in range(num_processes):
         if i % 2 == 0:
-            burst_time = random.randint(T1, T2)
+            burst_time = rng.randint(T1, T2)
         else:
-            burst_time = random.randint(T3, T4)
+            burst_time = rng.randint(T3, T4)
         processes.append(Process(f"P{i+1}", burst_time))
+    return processes
+
 
-    # Definindo quanta para teste
-    quanta = [2, 4, 6]
+def load_workload(path):
+    """
+    Abre um workload de um arquivo JSON (lista de objetos com name, burst_time e, opcionalmente,
+    arrival_time) ou de um trace CSV/JSONL/binário, lido em streaming (ver trace_loader).
+    """
+    if not path.endswith('.json'):
+        from trace_loader import open_trace
+        return open_trace(path)
+    with open(path, encoding='utf-8') as workload_file:
+        records = json.load(workload_file)
+    processes = []
+    for i, record in enumerate(records):
+        arrival = record.get('arrival_time')
+        processes.append(Process(record.get('name') or f"P{i+1}", int(record['burst_time']),
+                                 int(arrival) if arrival not in (None, '') else None))
+    return processes
 
-    # Simulação
-    all_metrics = simulate_round_robin(processes, quanta)
 
-    # Exibição dos resultados
-    for m in all_metrics:
-        print(f"=== Resultados para Quantum = {m['quantum']} ===")
-        print(f"Tempo Médio de Espera: {m['average_waiting_time']:.2f}")
-        print(f"Tempo Médio de Retorno: {m['average_return_time']:.2f}")
-        print(f"Vazão: {m['throughput']:.2f}\n")
+def open_workload(path=None, num_processes=10, seed=None):
+    """
+    load_workload() (ou generate_workload() sem `path`) como context manager, para usar com
+    `with`: o trace aberto por load_workload() é fechado na saída.
+    """
+    if path is None:
+        return nullcontext(generate_workload(num_processes, seed))
+    workload = load_workload(path)
+    return workload if hasattr(workload, 'close') else nullcontext(workload)
+
+
+def summarize(metrics):
+    # Só as métricas escalares (sem a sequência de execução nem os acumuladores)
+    return {field: metrics[field] for field in SUMMARY_FIELDS}
+
+
+def write_metrics(all_metrics, output_format, output):
+    """
+    Escreve as métricas de cada quantum em `output` (arquivo aberto) no formato pedido.
+    """
+    if output_format == 'json':
+        json.dump([summarize(m) for m in all_metrics], output, indent=2)
+        output.write('\n')
+    elif output_format == 'csv':
+        writer = csv.DictWriter(output, fieldnames=SUMMARY_FIELDS)
+        writer.writeheader()
+        writer.writerows(summarize(m) for m in all_metrics)
+    else:
+        # Exibição dos resultados
+        for m in all_metrics:
+            output.write(f"=== Resultados para Quantum = {m['quantum']} ===\n")
+            output.write(f"Tempo Médio de Espera: {m['average_waiting_time']:.2f}\n")
+            output.write(f"Tempo Médio de Retorno: {m['average_return_time']:.2f}\n")
+            output.write(f"Vazão: {m['throughput']:.2f}\n\n")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Simulação do escalonamento Round Robin.')
+    parser.add_argument('--workload',
+                        help='arquivo JSON ou trace CSV/JSONL/binário com os processos (padrão: workload aleatório)')
+    parser.add_argument('--processes', type=int, default=10,
+                        help='número de processos do workload aleatório (padrão: 10)')
+    parser.add_argument('--quanta', type=int, nargs='+', default=[2, 4, 6],
+                        help='valores de quantum a testar (padrão: 2 4 6)')
+    parser.add_argument('--seed', type=int, help='semente do workload aleatório')
+    parser.add_argument('--format', choices=['text', 'json', 'csv'], default='text',
+                        help='formato das métricas (padrão: text)')
+    parser.add_argument('--output', help='arquivo de saída das métricas (padrão: saída padrão)')
+    parser.add_argument('--no-plot', action='store_true', help='só calcula e escreve as métricas')
+    parser.add_argument('--plot-dir', help='salva os gráficos (PNG) nesta pasta em vez de abrir janelas')
+    parser.add_argument('--parallel', action='store_true', help='roda cada quantum em um processo separado')
+    parser.add_argument('--cache-dir', help='reaproveita resultados guardados nesta pasta (ResultCache)')
+    parser.add_argument('--cache-size', type=int, default=512,
+                        help='tamanho máximo do cache em MB (padrão: 512)')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    cache = None
+    if args.cache_dir:
+        from result_cache import ResultCache
+        cache = ResultCache(args.cache_dir, max_bytes=args.cache_size * 1024 * 1024)
+
+    # Processos do arquivo ou gerados aleatoriamente (com burst times variados)
+    with open_workload(args.workload, args.processes, args.seed) as processes:
+        # Simulação
+        # Sem gráficos, nem a sequência de execução nem as amostras precisam ficar em memória
+        all_metrics = simulate_round_robin(processes, args.quanta, parallel=args.parallel,
+                                           keep_samples=not args.no_plot,
+                                           record_trace=not args.no_plot, cache=cache)
+
+    if args.output:
+        with open(args.output, 'w', newline='', encoding='utf-8') as output:
+            write_metrics(all_metrics, args.format, output)
+    else:
+        write_metrics(all_metrics, args.format, sys.stdout)
+
+    if args.no_plot:
+        return
+
+    if args.plot_dir:
+        os.makedirs(args.plot_dir, exist_ok=True)
+
+    def plot_path(name):
+        return os.path.join(args.plot_dir, name) if args.plot_dir else None
 
     # Plot das métricas
-    plot_metrics(all_metrics)
+    plot_metrics(all_metrics, output=plot_path('metricas.png'))
 
     # Plot do Gantt para cada quantum
     for m in all_metrics:
-        plot_gantt_chart(m, title_suffix="(Comparação)")
+        plot_gantt_chart(m, title_suffix="(Comparação)", output=plot_path(f"gantt_q{m['quantum']}.png"))
 
-    # Adicionando um recadinho divertido no final! 😎
-    print("Simulação concluída! 🎉 Aproveite os gráficos e métricas! 😄")
+    if args.format == 'text' and not args.output:
+        # Adicionando um recadinho divertido no final! 😎
+        print("Simulação concluída! 🎉 Aproveite os gráficos e métricas! 😄")
 
 
 if __name__ == "__main__":
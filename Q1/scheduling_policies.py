@@ -0,0 +1,365 @@
+from collections import deque
+import heapq
+import itertools
+
+from execution_trace import ExecutionTrace
+from round_robin_simulacao import CONTEXT_SWITCH_TIME, ArrivalQueue, build_metrics, fresh_copy
+from streaming_metrics import RunningStats
+
+
+# Classe SchedulingPolicy - interface comum das políticas de escalonamento
+class SchedulingPolicy:
+    """
+    Uma política decide qual processo pronto roda em seguida e por quanto tempo.
+    - add(pid, process, now): um processo chegou (ou voltou) para a fila de prontos
+    - pop(now): retira o próximo processo a rodar, devolvendo (pid, processo)
+    - timeslice(pid, process, now): tempo máximo da próxima fatia (None = até terminar)
+    - requeue(pid, process, now, ran): o processo foi preemptado depois de rodar `ran`
+    - finish(pid, process, now): o processo terminou
+
+    Se `preempt_on_arrival` for True, o processo em execução é interrompido a cada chegada
+    para que a política possa escolher de novo (SRTF, prioridade, MLFQ).
+    """
+
+    name = 'base'
+    preempt_on_arrival = False
+
+    def add(self, pid, process, now):
+        raise NotImplementedError
+
+    def pop(self, now):
+        raise NotImplementedError
+
+    def timeslice(self, pid, process, now):
+        return None
+
+    def requeue(self, pid, process, now, ran):
+        self.add(pid, process, now)
+
+    def finish(self, pid, process, now):
+        pass
+
+    def __len__(self):
+        raise NotImplementedError
+
+
+# Classe RoundRobinPolicy - fila FIFO com quantum fixo (mesma política de round_robin())
+class RoundRobinPolicy(SchedulingPolicy):
+    name = 'RR'
+
+    def __init__(self, quantum):
+        self.quantum = quantum
+        self._queue = deque()
+
+    def add(self, pid, process, now):
+        self._queue.append((pid, process))
+
+    def pop(self, now):
+        return self._queue.popleft()
+
+    def timeslice(self, pid, process, now):
+        return self.quantum
+
+    def __len__(self):
+        return len(self._queue)
+
+
+# Classe SRTFPolicy - menor tempo restante primeiro (preemptivo), com heap por tempo restante
+class SRTFPolicy(SchedulingPolicy):
+    name = 'SRTF'
+    preempt_on_arrival = True
+
+    def __init__(self):
+        self._heap = []
+        self._order = itertools.count()  # Desempate estável: quem entrou antes na fila
+
+    def add(self, pid, process, now):
+        heapq.heappush(self._heap, (process.remaining_time, next(self._order), pid, process))
+
+    def pop(self, now):
+        _, _, pid, process = heapq.heappop(self._heap)
+        return pid, process
+
+    def __len__(self):
+        return len(self._heap)
+
+
+# Classe PriorityAgingPolicy - prioridade (menor valor = mais prioritário) com envelhecimento
+class PriorityAgingPolicy(SchedulingPolicy):
+    """
+    - priority_of: função que devolve a prioridade base de um processo (padrão: 0 para todos)
+    - aging_rate: quanto a prioridade melhora por unidade de tempo de espera na fila
+    - quantum: fatia máxima antes de reavaliar as prioridades (None = não preempta por tempo)
+
+    A prioridade efetiva é base - aging_rate * (now - entrada_na_fila). Como o termo
+    aging_rate * now é o mesmo para todos na fila, a ordem só depende de
+    base + aging_rate * entrada_na_fila, que não muda enquanto o processo espera: por isso
+    um heap comum com essa chave já implementa o envelhecimento em O(log n).
+    """
+
+    name = 'Prioridade'
+    preempt_on_arrival = True
+
+    def __init__(self, priority_of=None, aging_rate=0.1, quantum=None):
+        self.priority_of = priority_of if priority_of is not None else (lambda process: 0)
+        self.aging_rate = aging_rate
+        self.quantum = quantum
+        self._heap = []
+        self._order = itertools.count()
+
+    def add(self, pid, process, now):
+        key = self.priority_of(process) + self.aging_rate * now
+        heapq.heappush(self._heap, (key, next(self._order), pid, process))
+
+    def pop(self, now):
+        _, _, pid, process = heapq.heappop(self._heap)
+        return pid, process
+
+    def timeslice(self, pid, process, now):
+        return self.quantum
+
+    def __len__(self):
+        return len(self._heap)
+
+
+# Classe MLFQPolicy - filas multinível com realimentação
+class MLFQPolicy(SchedulingPolicy):
+    """
+    - quanta: quantum de cada nível (o nível 0 é o mais prioritário)
+    - boost_interval: de quanto em quanto tempo todos os processos voltam para o nível 0
+
+    Quem esgota o quantum do seu nível desce um nível; quem é interrompido antes (por uma
+    chegada) volta para o começo do mesmo nível com o que sobrou do quantum, então só perde a
+    vez para um processo de nível mais alto (uma chegada no mesmo nível espera na fila). Cada nível é uma fila FIFO
+    e o número de níveis é fixo, então cada decisão custa O(número de níveis).
+
+    O boost é preguiçoso: as filas inteiras são encadeadas no fim do nível 0 (em ordem de
+    nível) e o nível de cada processo só é zerado quando ele é consultado de novo, então um
+    boost custa O(número de níveis) em vez de O(processos prontos).
+    """
+
+    name = 'MLFQ'
+    preempt_on_arrival = True
+
+    def __init__(self, quanta=(2, 4, 8, 16), boost_interval=200):
+        self.quanta = tuple(quanta)
+        self.boost_interval = boost_interval
+        # O nível 0 é uma fila de segmentos; os novos processos entram no último segmento
+        self._top = deque([deque()])
+        self._levels = [None] + [deque() for _ in self.quanta[1:]]
+        self._state = {}        # pid -> [nível, tempo usado do quantum no nível, época do boost]
+        self._epoch = 0
+        self._next_boost = boost_interval
+        self._size = 0
+
+    def _boost(self, now):
+        # Sobe todo mundo para o nível 0 (evita starvation dos processos longos)
+        while now >= self._next_boost:
+            self._next_boost += self.boost_interval
+        for index in range(1, len(self._levels)):
+            if self._levels[index]:
+                self._top.append(self._levels[index])
+                self._levels[index] = deque()
+        self._top.append(deque())
+        self._epoch += 1
+
+    def _current_state(self, pid):
+        state = self._state.get(pid)
+        if state is None or state[2] != self._epoch:
+            # Processo novo ou que passou por um boost: volta ao nível 0
+            state = self._state[pid] = [0, 0, self._epoch]
+        return state
+
+    def add(self, pid, process, now):
+        level = self._current_state(pid)[0]
+        queue = self._top[-1] if level == 0 else self._levels[level]
+        queue.append((pid, process))
+        self._size += 1
+
+    def pop(self, now):
+        if self.boost_interval and now >= self._next_boost:
+            self._boost(now)
+        top = self._top
+        while len(top) > 1 and not top[0]:
+            top.popleft()
+        if top[0]:
+            self._size -= 1
+            return top[0].popleft()
+        for queue in self._levels[1:]:
+            if queue:
+                self._size -= 1
+                return queue.popleft()
+        raise IndexError('nenhum processo pronto')
+
+    def timeslice(self, pid, process, now):
+        level, used, _ = self._current_state(pid)
+        return self.quanta[level] - used
+
+    def requeue(self, pid, process, now, ran):
+        state = self._current_state(pid)
+        state[1] += ran
+        if state[1] >= self.quanta[state[0]]:
+            # Usou o quantum inteiro: desce um nível
+            state[0] = min(state[0] + 1, len(self.quanta) - 1)
+            state[1] = 0
+            self.add(pid, process, now)
+            return
+        # Interrompido por uma chegada: continua à frente do seu nível
+        queue = self._top[0] if state[0] == 0 else self._levels[state[0]]
+        queue.appendleft((pid, process))
+        self._size += 1
+
+    def finish(self, pid, process, now):
+        del self._state[pid]
+
+    def __len__(self):
+        return self._size
+
+
+# Classe CFSPolicy - escalonador "justo" no estilo do CFS do Linux, por tempo virtual (vruntime)
+class CFSPolicy(SchedulingPolicy):
+    """
+    - sched_latency: período em que todos os processos prontos deveriam rodar uma vez
+    - min_granularity: fatia mínima de um processo
+    - weight_of: função que devolve o peso de um processo (padrão: 1024, o peso de nice 0)
+
+    Roda sempre o processo com menor vruntime (heap). Cada unidade de tempo executada soma
+    1024 / peso ao vruntime; quem chega entra com pelo menos o menor vruntime da fila.
+    """
+
+    name = 'CFS'
+
+    def __init__(self, sched_latency=24, min_granularity=3, weight_of=None):
+        self.sched_latency = sched_latency
+        self.min_granularity = min_granularity
+        self.weight_of = weight_of if weight_of is not None else (lambda process: 1024)
+        self._heap = []
+        self._order = itertools.count()
+        self._vruntime = {}         # pid -> vruntime
+        self._queued_weight = 0     # Soma dos pesos de quem está na fila
+        self.min_vruntime = 0
+
+    def add(self, pid, process, now):
+        vruntime = max(self._vruntime.get(pid, 0), self.min_vruntime)
+        self._vruntime[pid] = vruntime
+        self._queued_weight += self.weight_of(process)
+        heapq.heappush(self._heap, (vruntime, next(self._order), pid, process))
+
+    def pop(self, now):
+        vruntime, _, pid, process = heapq.heappop(self._heap)
+        self._queued_weight -= self.weight_of(process)
+        self.min_vruntime = max(self.min_vruntime, vruntime)
+        return pid, process
+
+    def timeslice(self, pid, process, now):
+        weight = self.weight_of(process)
+        share = self.sched_latency * weight / (self._queued_weight + weight)
+        return max(self.min_granularity, int(share))
+
+    def requeue(self, pid, process, now, ran):
+        self._vruntime[pid] += ran * 1024 / self.weight_of(process)
+        self.add(pid, process, now)
+
+    def finish(self, pid, process, now):
+        del self._vruntime[pid]
+
+    def __len__(self):
+        return len(self._heap)
+
+
+def simulate(processes, policy, arrival_time=0, trace=None, keep_samples=True):
+    """
+    Núcleo de simulação compartilhado pelas políticas (mesmo modelo de round_robin()).
+    - processes: lista de processos (Process), ProcessTable ou iterável em ordem de chegada
+    - policy: instância de SchedulingPolicy
+    - arrival_time, trace, keep_samples: como em round_robin()
+
+    As chegadas ficam num heap por instante de chegada e a CPU ociosa pula direto para a
+    próxima. Como em round_robin(), a troca de contexto (CONTEXT_SWITCH_TIME) é cobrada logo
+    depois de cada preempção e quem chega durante ela entra na fila antes da próxima escolha;
+    com RoundRobinPolicy o resultado é o mesmo de round_robin(). Nas políticas com
+    preempt_on_arrival, a fatia é cortada a cada chegada só para a política escolher de novo,
+    então a troca só é cobrada se outro processo for escolhido. Retorna o mesmo dicionário de
+    métricas de round_robin(), com a chave extra 'policy'.
+    """
+    arrivals = ArrivalQueue(processes, arrival_time)
+
+    current_time = 0
+    finished_processes = 0
+    preempted_pid = None    # Processo interrompido por uma chegada (preempt_on_arrival)
+
+    execution_sequence = trace if trace is not None else ExecutionTrace()
+    waiting_stats = RunningStats()
+    return_stats = RunningStats()
+    waiting_time_list = [] if keep_samples else None
+    return_time_list = [] if keep_samples else None
+
+    def admit_arrivals():
+        while arrivals and arrivals.next_time <= current_time:
+            process = arrivals.pop()
+            policy.add(execution_sequence.add_process(process.name), process, current_time)
+
+    while len(policy) or arrivals:
+        admit_arrivals()
+
+        if not len(policy):
+            # CPU ociosa: avança o tempo direto para a próxima chegada
+            current_time = arrivals.next_time
+            continue
+
+        pid, process = policy.pop(current_time)
+        if preempted_pid is not None and preempted_pid != pid:
+            current_time += CONTEXT_SWITCH_TIME
+            admit_arrivals()   # Quem chegou durante a troca de contexto
+        preempted_pid = None
+
+        if process.initial_time is None:
+            process.initial_time = current_time
+
+        # Tamanho da fatia: limite da política, tempo restante e (se for o caso) próxima chegada
+        exec_time = process.remaining_time
+        slice_limit = policy.timeslice(pid, process, current_time)
+        if slice_limit is not None:
+            exec_time = min(exec_time, slice_limit)
+        if policy.preempt_on_arrival and arrivals:
+            exec_time = min(exec_time, max(arrivals.next_time - current_time, 0))
+
+        process.remaining_time -= exec_time
+        execution_sequence.append(current_time, pid, exec_time)
+        current_time += exec_time
+        admit_arrivals()
+
+        if process.remaining_time == 0:
+            process.completion_time = current_time
+            finished_processes += 1
+            policy.finish(pid, process, current_time)
+
+            ret_time = process.completion_time - arrivals.arrival_of(process)
+            wait_time = ret_time - process.burst_time
+            waiting_stats.add(wait_time)
+            return_stats.add(ret_time)
+            if keep_samples:
+                waiting_time_list.append(wait_time)
+                return_time_list.append(ret_time)
+        else:
+            policy.requeue(pid, process, current_time, exec_time)
+            if policy.preempt_on_arrival:
+                preempted_pid = pid
+            else:
+                current_time += CONTEXT_SWITCH_TIME
+
+    execution_sequence.close()
+
+    metrics = build_metrics(getattr(policy, 'quantum', None), waiting_stats, return_stats,
+                            finished_processes, current_time, execution_sequence,
+                            waiting_time_list, return_time_list)
+    metrics['policy'] = policy.name
+    return metrics
+
+
+def compare_policies(processes, policies):
+    """
+    Roda cada política sobre uma cópia nova do mesmo workload.
+    Retorna uma lista com as métricas de cada política, na mesma ordem.
+    """
+    return [simulate(fresh_copy(processes), policy) for policy in policies]
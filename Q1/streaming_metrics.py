@@ -0,0 +1,157 @@
+import math
+
+# Percentis reportados nas métricas
+PERCENTILES = (50, 95, 99)
+
+
+# Classe QuantileSketch - histograma logarítmico para estimar percentis em memória constante
+class QuantileSketch:
+    """
+    Sketch de quantis no estilo DDSketch: cada valor positivo cai no balde ceil(log_gamma(x)),
+    com gamma = (1 + alpha) / (1 - alpha), e o percentil estimado tem erro relativo de no
+    máximo `alpha`. Valores <= 0 são contados à parte. O número de baldes é limitado por
+    `max_buckets` (os menores são agrupados) e dois sketches com o mesmo alpha podem ser
+    somados com merge().
+    """
+
+    def __init__(self, alpha=0.01, max_buckets=2048):
+        self.alpha = alpha
+        self.max_buckets = max_buckets
+        self.gamma = (1 + alpha) / (1 - alpha)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets = {}      # índice do balde -> quantidade
+        self.zero_count = 0    # Valores <= 0
+        self.count = 0
+
+    def add(self, value, count=1):
+        self.count += count
+        if value <= 0:
+            self.zero_count += count
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + count
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def _collapse(self):
+        # Junta os baldes mais baixos até respeitar o limite (perde precisão só nos menores valores)
+        keys = sorted(self.buckets)
+        excess = len(keys) - self.max_buckets
+        target = keys[excess]
+        for key in keys[:excess]:
+            self.buckets[target] += self.buckets.pop(key)
+
+    def merge(self, other):
+        if other.alpha != self.alpha:
+            raise ValueError('só é possível juntar sketches com o mesmo alpha')
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+        return self
+
+    def quantile(self, q):
+        """
+        Valor estimado do quantil q (0 <= q <= 1).
+        """
+        if self.count == 0:
+            return 0
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                # Ponto do balde que minimiza o erro relativo
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+
+# Classe RunningStats - média, desvio padrão e percentis calculados de forma online
+class RunningStats:
+    """
+    Acumula média e variância pelo método de Welford e os percentis por um QuantileSketch,
+    sem guardar as amostras. Acumuladores de execuções paralelas ou de partes diferentes de um
+    workload podem ser combinados com merge().
+    """
+
+    def __init__(self, alpha=0.01):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0        # Soma dos quadrados das diferenças para a média
+        self.min = None
+        self.max = None
+        self.sketch = QuantileSketch(alpha)
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        self.sketch.add(value)
+
+    @classmethod
+    def from_array(cls, values, alpha=0.01):
+        """
+        Monta o acumulador a partir de um array NumPy de uma vez (usado por round_robin_numpy()).
+        """
+        import numpy as np
+
+        stats = cls(alpha)
+        values = np.asarray(values)
+        if values.size == 0:
+            return stats
+        stats.count = int(values.size)
+        stats.mean = float(values.mean())
+        stats._m2 = float(((values - stats.mean) ** 2).sum())
+        stats.min = values.min().item()
+        stats.max = values.max().item()
+
+        sketch = stats.sketch
+        positive = values[values > 0]
+        sketch.count = stats.count
+        sketch.zero_count = stats.count - int(positive.size)
+        keys, counts = np.unique(np.ceil(np.log(positive) / sketch._log_gamma).astype(np.int64),
+                                 return_counts=True)
+        sketch.buckets = dict(zip(keys.tolist(), counts.tolist()))
+        if len(sketch.buckets) > sketch.max_buckets:
+            sketch._collapse()
+        return stats
+
+    def merge(self, other):
+        # Combinação de Chan et al. para médias e variâncias de dois grupos
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.mean, self._m2 = other.mean, other._m2
+        else:
+            total = self.count + other.count
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / total
+            self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.count += other.count
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+        return self
+
+    @property
+    def stdev(self):
+        # Desvio padrão amostral (mesma definição de statistics.stdev)
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0
+
+    def percentile(self, p):
+        if self.count == 0:
+            return 0
+        # A estimativa do sketch é limitada ao intervalo realmente observado
+        return min(max(self.sketch.quantile(p / 100), self.min), self.max)
+
+    def percentiles(self):
+        return {p: self.percentile(p) for p in PERCENTILES}
@@ -0,0 +1,210 @@
+import argparse
+import csv
+import itertools
+import json
+import mmap
+import os
+import struct
+import tempfile
+
+from round_robin_simulacao import Process
+
+# Formato binário:
+#   cabeçalho: MAGIC (8 bytes), quantidade de registros (int64), deslocamento dos nomes (int64)
+#   registros: (chegada, burst, início do nome, tamanho do nome), 4 x int64 cada
+#   nomes: bytes UTF-8 concatenados
+MAGIC = b'RRTRACE1'
+_HEADER = struct.Struct('<8sqq')
+_RECORD_FIELDS = 4
+_RECORD_SIZE = 8 * _RECORD_FIELDS
+_NO_ARRIVAL = -1   # Chegada não informada (None)
+
+
+def _parse_arrival(value):
+    return int(value) if value not in (None, '') else None
+
+
+def iter_csv(path):
+    """
+    Lê um trace CSV (cabeçalho com name, burst_time e, opcionalmente, arrival_time) linha a
+    linha, gerando um Process novo por registro.
+    """
+    with open(path, newline='', encoding='utf-8') as trace_file:
+        for i, record in enumerate(csv.DictReader(trace_file)):
+            yield Process(record.get('name') or f"P{i+1}", int(record['burst_time']),
+                          _parse_arrival(record.get('arrival_time')))
+
+
+def iter_jsonl(path):
+    # Lê um trace JSONL (um objeto com name/burst_time/arrival_time por linha)
+    with open(path, encoding='utf-8') as trace_file:
+        for i, line in enumerate(trace_file):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            yield Process(record.get('name') or f"P{i+1}", int(record['burst_time']),
+                          _parse_arrival(record.get('arrival_time')))
+
+
+# Classe BinaryTrace - trace binário lido via memory map
+class BinaryTrace:
+    """
+    Acesso a um trace no formato binário sem carregá-lo na memória: os registros são lidos
+    direto do memory map. Cada iteração gera processos novos. O memory map (e o descritor de
+    arquivo que ele mantém) só é liberado em close(), então use o trace com `with`.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as trace_file:
+            header = trace_file.read(_HEADER.size)
+            magic, self._count, self._names_offset = _HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f'{path} não é um trace binário válido')
+            self._mmap = mmap.mmap(trace_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._records = memoryview(self._mmap)[_HEADER.size:self._names_offset].cast('q')
+
+    def close(self):
+        """
+        Libera o memory map. Os arrays devolvidos por as_arrays() precisam ter sido descartados
+        antes (senão o mmap levanta BufferError).
+        """
+        if self._mmap.closed:
+            return
+        self._records.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def _process(self, index):
+        base = _RECORD_FIELDS * index
+        arrival, burst, name_start, name_length = self._records[base:base + _RECORD_FIELDS]
+        start = self._names_offset + name_start
+        name = self._mmap[start:start + name_length].decode('utf-8')
+        return Process(name, burst, None if arrival == _NO_ARRIVAL else arrival)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('índice fora do trace')
+        return self._process(index)
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self._process(index)
+
+    def as_arrays(self):
+        """
+        Colunas (chegadas, bursts) como arrays NumPy sobre o memory map, sem cópia; os bursts
+        podem ir direto para round_robin_numpy(). Chegadas não informadas valem -1.
+        """
+        import numpy as np
+
+        records = np.frombuffer(self._mmap, dtype=np.int64, count=_RECORD_FIELDS * self._count,
+                                offset=_HEADER.size).reshape(self._count, _RECORD_FIELDS)
+        return records[:, 0], records[:, 1]
+
+
+# Classe TextTrace - trace CSV/JSONL que é relido do disco a cada iteração
+class TextTrace:
+    def __init__(self, path, reader):
+        self.path = path
+        self._reader = reader
+
+    def __iter__(self):
+        return self._reader(self.path)
+
+    # Nada a liberar (cada iteração abre e fecha o arquivo); existe para ser usado como BinaryTrace
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_trace(path):
+    """
+    Abre um trace conforme a extensão (.csv, .jsonl ou .bin). O objeto devolvido pode ser
+    iterado várias vezes (ex.: um quantum por iteração em simulate_round_robin()) e cada
+    iteração lê o arquivo em streaming, gerando processos novos. Use-o com `with` para que o
+    memory map de um trace binário seja fechado.
+    """
+    if path.endswith('.bin'):
+        return BinaryTrace(path)
+    if path.endswith('.jsonl'):
+        return TextTrace(path, iter_jsonl)
+    return TextTrace(path, iter_csv)
+
+
+def iter_chunks(processes, chunk_size=65536):
+    # Agrupa um iterável de processos em listas de até chunk_size elementos
+    iterator = iter(processes)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def convert_to_binary(source, destination, chunk_size=65536):
+    """
+    Converte um trace de texto (CSV/JSONL) para o formato binário em streaming: os registros
+    são gravados em blocos e os nomes vão para um arquivo temporário, que é anexado no final.
+    Retorna o número de registros gravados.
+    """
+    count = 0
+    names_size = 0
+    with open(destination, 'wb') as output, tempfile.TemporaryFile() as names, \
+            open_trace(source) as trace:
+        output.write(_HEADER.pack(MAGIC, 0, 0))    # Cabeçalho provisório
+        for chunk in iter_chunks(trace, chunk_size):
+            records = []
+            for process in chunk:
+                encoded = process.name.encode('utf-8')
+                arrival = _NO_ARRIVAL if process.arrival_time is None else process.arrival_time
+                records.extend((arrival, process.burst_time, names_size, len(encoded)))
+                names.write(encoded)
+                names_size += len(encoded)
+            output.write(struct.pack(f'<{len(records)}q', *records))
+            count += len(chunk)
+
+        names_offset = output.tell()
+        names.seek(0)
+        while True:
+            block = names.read(1 << 20)
+            if not block:
+                break
+            output.write(block)
+
+        output.seek(0)
+        output.write(_HEADER.pack(MAGIC, count, names_offset))
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Ferramentas para traces de processos.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    convert = subparsers.add_parser('convert', help='converte um trace CSV/JSONL para o formato binário')
+    convert.add_argument('source')
+    convert.add_argument('destination')
+    args = parser.parse_args(argv)
+
+    if args.command == 'convert':
+        count = convert_to_binary(args.source, args.destination)
+        print(f'{count} registros gravados em {args.destination} '
+              f'({os.path.getsize(args.destination)} bytes)')
+
+
+if __name__ == '__main__':
+    main()
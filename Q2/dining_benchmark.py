@@ -0,0 +1,62 @@
+import argparse
+import statistics
+import time
+
+import phi_problem
+from dining_strategies import STRATEGIES
+from philosopher_pool import PhilosopherPool
+
+
+def fairness(meals):
+    # Índice de justiça de Jain: 1 quando todos comem igual, 1/n quando um só come
+    total = sum(meals)
+    squares = sum(m * m for m in meals)
+    return total * total / (len(meals) * squares) if squares else 1.0
+
+
+def run_strategy(strategy, philos, food, delay, rounds=1, food_strategy='global'):
+    """
+    Roda `rounds` rodadas com a estratégia de hashis indicada e a mesma mesa para todas.
+    Retorna refeições por segundo e a distribuição das refeições entre os filósofos
+    (mínimo, máximo, desvio padrão e índice de Jain, somando todas as rodadas).
+    """
+    phi_problem.VERBOSE = False
+    phi_problem.configure(philos=philos, food=food, delay=delay, food_strategy=food_strategy,
+                          dining_strategy=strategy)
+    totals = [0] * philos
+    with PhilosopherPool(philos, phi_problem.philosopher, phi_problem.reset_table) as pool:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            pool.run_round()
+            totals = [total + m for total, m in zip(totals, phi_problem.meals)]
+        elapsed = time.perf_counter() - start
+
+    return {
+        'strategy': strategy,
+        'meals_per_second': sum(totals) / elapsed if elapsed > 0 else 0,
+        'min_meals': min(totals),
+        'max_meals': max(totals),
+        'meals_std': statistics.pstdev(totals),
+        'fairness': fairness(totals),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compara as estratégias anti-deadlock dos filósofos.')
+    parser.add_argument('--philos', type=int, default=phi_problem.PHILOS)
+    parser.add_argument('--food', type=int, default=phi_problem.FOOD)
+    parser.add_argument('--delay', type=float, default=phi_problem.DELAY)
+    parser.add_argument('--rounds', type=int, default=1)
+    parser.add_argument('--strategies', nargs='+', choices=sorted(STRATEGIES), default=list(STRATEGIES))
+    args = parser.parse_args(argv)
+
+    print(f"PHILOS={args.philos} FOOD={args.food} DELAY={args.delay} ({args.rounds} rodada(s))")
+    print(f"{'estratégia':<14} {'refeições/s':>12} {'mín':>5} {'máx':>5} {'desvio':>8} {'Jain':>6}")
+    for strategy in args.strategies:
+        result = run_strategy(strategy, args.philos, args.food, args.delay, args.rounds)
+        print(f"{strategy:<14} {result['meals_per_second']:>12,.1f} {result['min_meals']:>5} "
+              f"{result['max_meals']:>5} {result['meals_std']:>8.2f} {result['fairness']:>6.3f}")
+
+
+if __name__ == '__main__':
+    main()
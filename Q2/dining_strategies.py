@@ -0,0 +1,167 @@
+import random
+import threading
+import time
+
+# Estratégias para evitar deadlock no jantar dos filósofos.
+# Cada estratégia recebe o módulo da mesa (phi_problem) e usa as funções dele para pegar e
+# soltar os hashis; pick_up(phil) só retorna quando o filósofo pode comer e put_down(phil)
+# devolve os hashis depois da refeição.
+
+
+def chopsticks_of(phil, philosophers):
+    # (esquerdo, direito) do filósofo, como em philosopher()
+    return (phil + 1) % philosophers, phil
+
+
+# Classe AsymmetricStrategy - filósofos pares começam pelo direito e ímpares pelo esquerdo
+class AsymmetricStrategy:
+    def __init__(self, table):
+        self.table = table
+        self.philosophers = table.PHILOS
+
+    def pick_up(self, phil):
+        left, right = chopsticks_of(phil, self.philosophers)
+        if phil % 2 == 0:
+            self.table.grab_chopstick(phil, right, "direito")
+            self.table.grab_chopstick(phil, left, "esquerdo")
+        else:
+            self.table.grab_chopstick(phil, left, "esquerdo")
+            self.table.grab_chopstick(phil, right, "direito")
+
+    def put_down(self, phil):
+        self.table.down_chopsticks(*chopsticks_of(phil, self.philosophers))
+
+
+# Classe ResourceHierarchyStrategy - sempre pega primeiro o hashi de menor índice
+class ResourceHierarchyStrategy(AsymmetricStrategy):
+    def pick_up(self, phil):
+        left, right = chopsticks_of(phil, self.philosophers)
+        for c, hand in sorted(((left, "esquerdo"), (right, "direito"))):
+            self.table.grab_chopstick(phil, c, hand)
+
+
+# Classe WaiterStrategy - um garçom (semáforo) deixa no máximo N-1 filósofos à mesa
+class WaiterStrategy(AsymmetricStrategy):
+    def __init__(self, table):
+        super().__init__(table)
+        self.waiter = threading.Semaphore(max(self.philosophers - 1, 1))
+
+    def pick_up(self, phil):
+        # Com no máximo N-1 disputando, pelo menos um consegue os dois hashis
+        self.waiter.acquire()
+        left, right = chopsticks_of(phil, self.philosophers)
+        self.table.grab_chopstick(phil, left, "esquerdo")
+        self.table.grab_chopstick(phil, right, "direito")
+
+    def put_down(self, phil):
+        super().put_down(phil)
+        self.waiter.release()
+
+
+# Classe TryLockStrategy - tenta os dois hashis sem bloquear, com backoff exponencial aleatório
+class TryLockStrategy(AsymmetricStrategy):
+    """
+    Se o segundo hashi estiver ocupado, devolve o primeiro e espera um tempo aleatório entre 0 e
+    base_delay * 2^tentativas (limitado a max_delay) antes de tentar de novo.
+    """
+
+    def __init__(self, table, base_delay=0.0001, max_delay=0.01):
+        super().__init__(table)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def pick_up(self, phil):
+        left, right = chopsticks_of(phil, self.philosophers)
+        attempts = 0
+        while True:
+            if self.table.try_grab_chopstick(phil, left, "esquerdo"):
+                if self.table.try_grab_chopstick(phil, right, "direito"):
+                    return
+                self.table.release_chopstick(left)
+            time.sleep(random.uniform(0, min(self.base_delay * 2 ** attempts, self.max_delay)))
+            if self.base_delay * 2 ** attempts < self.max_delay:
+                attempts += 1 # Depois de chegar em max_delay o expoente para de crescer
+
+
+# Classe _Fork - garfo do algoritmo de Chandy-Misra
+class _Fork:
+    def __init__(self, owner):
+        self.owner = owner
+        self.dirty = True
+        self.requested = False  # Se o vizinho que não é o dono pediu o garfo
+
+
+# Classe ChandyMisraStrategy - garfos sujos/limpos (Chandy-Misra)
+class ChandyMisraStrategy:
+    """
+    Cada garfo pertence a um dos dois vizinhos; no começo fica com o de menor número, sujo.
+    Um filósofo com fome pede os garfos que não tem. O dono de um garfo pedido que esteja sujo
+    o limpa e entrega assim que não estiver comendo, inclusive antes de comer de novo; garfos
+    limpos ficam com o dono até ele comer, quando sujam, e ao soltá-los os pedidos pendentes
+    são atendidos. Isso evita deadlock e também starvation: quem acabou de comer cede os garfos
+    que os vizinhos pediram.
+    Os garfos substituem os locks dos hashis da mesa; o estado de todos fica sob uma única
+    Condition, para que pedir, ceder e pegar os dois garfos sejam atômicos.
+    """
+
+    def __init__(self, table):
+        self.table = table
+        self.philosophers = table.PHILOS
+        self.forks = [_Fork(min(c, (c - 1) % self.philosophers)) for c in range(self.philosophers)]
+        self.eating = [False] * self.philosophers
+        self.condition = threading.Condition()
+
+    def _neighbour(self, c, phil):
+        # O garfo c fica entre os filósofos c e c - 1
+        return (c - 1) % self.philosophers if phil == c else c
+
+    def _hand_over(self, c, phil):
+        # O dono (phil) limpa o garfo pedido e entrega ao vizinho
+        fork = self.forks[c]
+        fork.owner = self._neighbour(c, phil)
+        fork.dirty = False
+        fork.requested = False
+
+    def pick_up(self, phil):
+        left, right = chopsticks_of(phil, self.philosophers)
+        with self.condition:
+            while True:
+                changed = False
+                for c in (left, right):
+                    fork = self.forks[c]
+                    if fork.owner == phil:
+                        if fork.dirty and fork.requested:
+                            self._hand_over(c, phil)   # Garfo sujo pedido: cede antes de comer
+                            changed = True
+                    elif fork.dirty and not self.eating[fork.owner]:
+                        self._hand_over(c, fork.owner) # O dono tem que ceder o garfo sujo
+                        changed = True
+                    else:
+                        fork.requested = True
+                if self.forks[left].owner == phil and self.forks[right].owner == phil:
+                    self.eating[phil] = True
+                    break
+                if changed:
+                    self.condition.notify_all()
+                self.condition.wait()
+        self.table.announce_grab(phil, left, "esquerdo")
+        self.table.announce_grab(phil, right, "direito")
+
+    def put_down(self, phil):
+        left, right = chopsticks_of(phil, self.philosophers)
+        with self.condition:
+            self.eating[phil] = False
+            for c in (left, right):
+                self.forks[c].dirty = True
+                if self.forks[c].requested:
+                    self._hand_over(c, phil)
+            self.condition.notify_all()
+
+
+STRATEGIES = {
+    'asymmetric': AsymmetricStrategy,
+    'hierarchy': ResourceHierarchyStrategy,
+    'waiter': WaiterStrategy,
+    'chandy_misra': ChandyMisraStrategy,
+    'trylock': TryLockStrategy,
+}
@@ -0,0 +1,131 @@
+import itertools
+import threading
+
+# Estratégias de distribuição da comida entre os filósofos.
+# Todas seguem a regra original de food_on_table(): take(phil) tira uma porção e devolve quanto
+# sobrou; o filósofo come enquanto o valor devolvido for > 0. Como a porção que zera a mesa não é
+# comida, cada rodada serve FOOD - 1 refeições em todas as estratégias.
+# lock_acquisitions conta quantas vezes um lock compartilhado foi adquirido.
+
+
+# Classe GlobalLockFood - um contador protegido por um único lock (comportamento original)
+class GlobalLockFood:
+    def __init__(self, food, philosophers, lock=None):
+        self.food = food
+        self.initial_food = food
+        self.lock = lock if lock is not None else threading.Lock()
+        self.lock_acquisitions = 0
+
+    def reset(self):
+        self.food = self.initial_food
+        self.lock_acquisitions = 0
+
+    def take(self, phil):
+        with self.lock:   # Bloqueia pra garantir acesso exclusivo
+            self.lock_acquisitions += 1
+            if self.food > 0:
+                self.food -= 1
+            return self.food
+
+
+# Classe PartitionedFood - comida dividida de antemão entre os filósofos (sem lock)
+class PartitionedFood:
+    """
+    Cada filósofo recebe sua parte das FOOD - 1 refeições num contador próprio, que só ele
+    altera. O valor devolvido é uma estimativa do que resta na mesa (a parte dele vezes o
+    número de filósofos), usada no tempo de comer.
+    """
+
+    def __init__(self, food, philosophers):
+        self.initial_food = food
+        self.philosophers = philosophers
+        self.lock_acquisitions = 0
+        self.reset()
+
+    def reset(self):
+        meals = max(self.initial_food - 1, 0)
+        base, extra = divmod(meals, self.philosophers)
+        # +1 em cada parte: a porção que zera o contador não é comida, como na regra original
+        self.portions = [base + (1 if phil < extra else 0) + 1 for phil in range(self.philosophers)]
+
+    def take(self, phil):
+        if self.portions[phil] > 0:
+            self.portions[phil] -= 1
+        return min(self.portions[phil] * self.philosophers, self.initial_food)
+
+
+# Classe BatchedFood - contador global, mas cada aquisição do lock reserva várias porções
+class BatchedFood:
+    """
+    O filósofo pega um lote de até batch_size porções por aquisição do lock e come do seu
+    estoque local até ele acabar. Menos aquisições, ao custo de uma divisão menos justa no
+    final da rodada.
+    """
+
+    def __init__(self, food, philosophers, batch_size=8):
+        self.initial_food = food
+        self.philosophers = philosophers
+        self.batch_size = batch_size
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.food = self.initial_food
+        self.stash = [0] * self.philosophers
+        self.lock_acquisitions = 0
+
+    def take(self, phil):
+        if self.stash[phil] == 0:
+            with self.lock:
+                self.lock_acquisitions += 1
+                if self.food > 1:
+                    claimed = min(self.batch_size, self.food - 1)
+                    self.food -= claimed
+                    self.stash[phil] = claimed
+                else:
+                    self.food = 0   # Mesa vazia, como quando a última porção é retirada
+                    return 0
+        self.stash[phil] -= 1
+        return self.food + self.stash[phil]
+
+
+# Classe AtomicFood - contador "atômico" com itertools.count (sem lock)
+class AtomicFood:
+    """
+    next() de um itertools.count é uma única operação em C, que o GIL não interrompe: funciona
+    como um fetch-and-add. A porção de número n (a partir de 0) deixa FOOD - n - 1 na mesa.
+    """
+
+    def __init__(self, food, philosophers):
+        self.initial_food = food
+        self.lock_acquisitions = 0
+        self.reset()
+
+    def reset(self):
+        self._served = itertools.count()
+
+    def take(self, phil):
+        return max(self.initial_food - next(self._served) - 1, 0)
+
+
+ALLOCATORS = {
+    'global': GlobalLockFood,
+    'partitioned': PartitionedFood,
+    'batched': BatchedFood,
+    'atomic': AtomicFood,
+}
+
+
+def single_philosopher_sequences(food):
+    """
+    Valores devolvidos por take(0) de cada estratégia com um único filósofo, até a mesa
+    esvaziar. Pela regra de food_on_table(), todas devem dar FOOD - 1, FOOD - 2, ..., 1, 0.
+    """
+    sequences = {}
+    for name, allocator in ALLOCATORS.items():
+        table = allocator(food, 1)
+        values = [table.take(0)]
+        while values[-1] > 0:
+            values.append(table.take(0))
+        sequences[name] = values
+    return sequences
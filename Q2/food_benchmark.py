@@ -0,0 +1,83 @@
+import argparse
+import sys
+import time
+
+import phi_problem
+from food_allocation import ALLOCATORS, single_philosopher_sequences
+from philosopher_pool import PhilosopherPool
+
+
+def _take_all(num):
+    # Só disputa a comida, sem hashis nem tempo de comer (isola o custo da alocação)
+    while phi_problem.food_on_table(num) > 0:
+        pass
+
+
+def benchmark(strategy, philos, food, rounds=5, table=True):
+    """
+    Mede uma estratégia de comida com `philos` filósofos e `food` porções por rodada.
+    - table: se True roda o filósofo completo (hashis + comer com DELAY = 0); senão só a
+      disputa pela comida
+    Retorna refeições por segundo e aquisições de lock compartilhado por refeição.
+    """
+    phi_problem.VERBOSE = False
+    phi_problem.configure(philos=philos, food=food, delay=0, food_strategy=strategy)
+    target = phi_problem.philosopher if table else _take_all
+
+    acquisitions = 0
+    with PhilosopherPool(philos, target, phi_problem.reset_table) as pool:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            pool.run_round()
+            acquisitions += phi_problem.food_allocator.lock_acquisitions
+        elapsed = time.perf_counter() - start
+
+    meals = rounds * (food - 1)
+    return {
+        'strategy': strategy,
+        'philosophers': philos,
+        'meals_per_second': meals / elapsed if elapsed > 0 else 0,
+        'lock_acquisitions_per_meal': acquisitions / meals if meals else 0,
+    }
+
+
+def check_allocators(foods=(1, 2, 3, 10, 50, 100)):
+    # Com um filósofo, todas as estratégias devem devolver a mesma sequência da global
+    failures = 0
+    for food in foods:
+        sequences = single_philosopher_sequences(food)
+        for name, values in sequences.items():
+            if values != sequences['global']:
+                failures += 1
+                print(f"{name}: FOOD={food} devolveu {values}, esperado {sequences['global']}")
+    print('todas as estratégias seguem food_on_table()' if not failures else f'{failures} falhas')
+    return 1 if failures else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compara as estratégias de distribuição da comida.')
+    parser.add_argument('--philos', type=int, nargs='+', default=[5, 50, 200, 500],
+                        help='números de filósofos')
+    parser.add_argument('--portions', type=int, default=50, help='porções por filósofo em cada rodada')
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--strategies', nargs='+', choices=sorted(ALLOCATORS), default=list(ALLOCATORS))
+    parser.add_argument('--food-only', action='store_true',
+                        help='mede só a disputa pela comida, sem hashis')
+    parser.add_argument('--check', action='store_true',
+                        help='só confere se todas as estratégias seguem a regra de food_on_table()')
+    args = parser.parse_args(argv)
+
+    if args.check:
+        return check_allocators()
+
+    print(f"{'estratégia':<12} {'filósofos':>9} {'refeições/s':>14} {'locks/refeição':>15}")
+    for philos in args.philos:
+        for strategy in args.strategies:
+            result = benchmark(strategy, philos, philos * args.portions, args.rounds,
+                               table=not args.food_only)
+            print(f"{strategy:<12} {philos:>9} {result['meals_per_second']:>14,.0f} "
+                  f"{result['lock_acquisitions_per_meal']:>15.3f}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
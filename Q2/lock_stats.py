@@ -0,0 +1,186 @@
+import threading
+import time
+
+# Tempos em nanossegundos (time.perf_counter_ns)
+PERCENTILES = (50, 95, 99)
+
+
+# Classe LatencyHistogram - histograma com baldes em potências de 2
+class LatencyHistogram:
+    """
+    O balde k conta as amostras em [2^(k-1), 2^k) ns: registrar uma amostra é só um
+    bit_length() e um incremento. Percentis saem do limite superior do balde, com erro de
+    no máximo 2x, suficiente para ver onde o tempo vai.
+    Não é protegido por lock: quem registra precisa ser o único escritor (o dono do lock
+    instrumentado ou a própria thread do filósofo).
+    """
+
+    def __init__(self):
+        self.buckets = [0] * 64
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, ns):
+        self.buckets[ns.bit_length()] += 1
+        self.count += 1
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+
+    def merge(self, other):
+        for k, count in enumerate(other.buckets):
+            self.buckets[k] += count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, p):
+        if not self.count:
+            return 0
+        target = self.count * p / 100
+        seen = 0
+        for k, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                return min(1 << k, self.max)
+        return self.max
+
+    def summary(self):
+        summary = {
+            'count': self.count,
+            'mean_ns': self.total / self.count if self.count else 0,
+            'max_ns': self.max,
+        }
+        for p in PERCENTILES:
+            summary[f'p{p}_ns'] = self.percentile(p)
+        return summary
+
+
+# Classe LockStats - espera, posse e disputas de um lock (ou de um filósofo)
+class LockStats:
+    def __init__(self):
+        self.wait = LatencyHistogram()
+        self.hold = LatencyHistogram()
+        self.contentions = 0
+
+    def merge(self, other):
+        self.wait.merge(other.wait)
+        self.hold.merge(other.hold)
+        self.contentions += other.contentions
+
+    def summary(self):
+        return {'acquisitions': self.wait.count, 'contentions': self.contentions,
+                'wait': self.wait.summary(), 'hold': self.hold.summary()}
+
+
+# Classe ContentionRegistry - junta as estatísticas de todos os locks instrumentados
+class ContentionRegistry:
+    """
+    Guarda as estatísticas por lock e por filósofo. Cada thread informa qual filósofo ela é
+    com bind(); cada filósofo só escreve nas próprias estatísticas, e as de um lock só são
+    escritas por quem está com ele, então nada disso precisa de lock extra.
+    """
+
+    def __init__(self):
+        self.locks = {}
+        self.philosophers = {}
+        self._local = threading.local()
+
+    def bind(self, phil):
+        self._local.phil = phil
+        self.philosophers.setdefault(phil, {})
+
+    def philosopher_stats(self, lock_name):
+        phil = getattr(self._local, 'phil', None)
+        if phil is None:
+            return None
+        per_lock = self.philosophers[phil]
+        stats = per_lock.get(lock_name)
+        if stats is None:
+            stats = per_lock[lock_name] = LockStats()
+        return stats
+
+    def reset(self):
+        for stats in self.locks.values():
+            stats.__init__()
+        self.philosophers.clear()
+
+    def summary(self):
+        # Resumo por lock e por filósofo (somando todos os locks que ele usou)
+        per_philosopher = {}
+        for phil, per_lock in sorted(self.philosophers.items()):
+            total = LockStats()
+            for stats in per_lock.values():
+                total.merge(stats)
+            per_philosopher[phil] = total.summary()
+        return {
+            'locks': {name: stats.summary() for name, stats in self.locks.items()},
+            'philosophers': per_philosopher,
+        }
+
+    def report(self):
+        # Tabela de texto com o resumo (tempos em microssegundos)
+        lines = [f"{'':<14} {'aquisições':>10} {'disputas':>9} {'espera p50':>11} "
+                 f"{'espera p99':>11} {'posse p50':>10} {'posse p99':>10}"]
+        summary = self.summary()
+        rows = list(summary['locks'].items())
+        rows += [(f'filósofo {phil}', stats) for phil, stats in summary['philosophers'].items()]
+        for label, stats in rows:
+            lines.append(f"{label:<14} {stats['acquisitions']:>10} {stats['contentions']:>9} "
+                         f"{stats['wait']['p50_ns'] / 1000:>11.1f} {stats['wait']['p99_ns'] / 1000:>11.1f} "
+                         f"{stats['hold']['p50_ns'] / 1000:>10.1f} {stats['hold']['p99_ns'] / 1000:>10.1f}")
+        return "\n".join(lines)
+
+
+# Classe InstrumentedLock - lock que mede espera, posse e disputas
+class InstrumentedLock:
+    """
+    Envolve um threading.Lock com a mesma interface (acquire/release/locked/with).
+    Antes de bloquear tenta pegar o lock sem esperar: se não conseguir, conta uma disputa.
+    """
+
+    def __init__(self, name, registry, lock=None):
+        self.name = name
+        self.registry = registry
+        self.stats = registry.locks.setdefault(name, LockStats())
+        self._lock = lock if lock is not None else threading.Lock()
+        self._acquired_at = 0
+        self._holder_stats = None
+
+    def acquire(self, blocking=True, timeout=-1):
+        start = time.perf_counter_ns()
+        contended = False
+        if not self._lock.acquire(blocking=False):
+            if not blocking:
+                return False
+            contended = True
+            if not self._lock.acquire(timeout=timeout):
+                return False
+        now = time.perf_counter_ns()
+        # Daqui em diante esta thread tem o lock: pode escrever nas estatísticas dele
+        phil_stats = self.registry.philosopher_stats(self.name)
+        for stats in (self.stats, phil_stats):
+            if stats is not None:
+                stats.wait.add(now - start)
+                stats.contentions += contended
+        self._acquired_at = now
+        self._holder_stats = phil_stats
+        return True
+
+    def release(self):
+        held = time.perf_counter_ns() - self._acquired_at
+        self.stats.hold.add(held)
+        if self._holder_stats is not None:
+            self._holder_stats.hold.add(held)
+        self._lock.release()
+
+    def locked(self):
+        return self._lock.locked()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
@@ -0,0 +1,151 @@
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+
+from dining_strategies import chopsticks_of
+from philosopher_pool import PhilosopherPool
+
+# Tamanhos usados na comparação entre threads e asyncio
+COMPARISON_SIZES = (10, 1_000, 10_000)
+
+
+# Classe AsyncTable - mesa do jantar para a versão com asyncio
+class AsyncTable:
+    """
+    Hashis são asyncio.Lock e a comida é um contador simples: todas as corrotinas rodam numa
+    única thread e só trocam de vez nos awaits, então tirar uma porção já é atômico.
+    - announce: função (filósofo, hashi, mão) chamada a cada hashi pego (None: não anuncia)
+    - slow_philosopher, slow_extra: um filósofo que segura os hashis slow_extra segundos a mais
+    """
+
+    def __init__(self, philos, food, delay, announce=None, slow_philosopher=None, slow_extra=0):
+        self.philos = philos
+        self.food = food
+        self.delay = delay
+        self.announce = announce
+        self.slow_philosopher = slow_philosopher
+        self.slow_extra = slow_extra
+        self.remaining = food
+        self.chopstick = [asyncio.Lock() for _ in range(philos)]
+        self.meals = [0] * philos
+
+    def food_on_table(self):
+        # Mesma regra de phi_problem.food_on_table(): tira uma porção e devolve o que sobrou
+        if self.remaining > 0:
+            self.remaining -= 1
+        return self.remaining
+
+
+async def philosopher(num, table):
+    left, right = chopsticks_of(num, table.philos)
+    # Mesma ordem da versão com threads: pares começam pelo direito e ímpares pelo esquerdo
+    if num % 2 == 0:
+        first, second = (right, "direito"), (left, "esquerdo")
+    else:
+        first, second = (left, "esquerdo"), (right, "direito")
+
+    extra = table.slow_extra if num == table.slow_philosopher else 0
+
+    while True:
+        f = table.food_on_table()
+        if f <= 0:
+            break
+        async with table.chopstick[first[0]]:
+            if table.announce:
+                table.announce(num, *first)
+            async with table.chopstick[second[0]]:
+                if table.announce:
+                    table.announce(num, *second)
+                await asyncio.sleep(table.delay * (table.food - f + 1) + extra) # Simula o tempo de comer
+                table.meals[num] += 1
+
+
+async def dinner(table):
+    await asyncio.gather(*(philosopher(num, table) for num in range(table.philos)))
+    return table
+
+
+def run_async(philos, food, delay, announce=None, slow_philosopher=None, slow_extra=0):
+    """
+    Uma rodada com uma corrotina por filósofo; devolve refeições e tempo gasto.
+    - announce, slow_philosopher, slow_extra: como em AsyncTable
+    """
+    start = time.perf_counter()
+    table = asyncio.run(dinner(AsyncTable(philos, food, delay, announce, slow_philosopher,
+                                          slow_extra)))
+    elapsed = time.perf_counter() - start
+    return sum(table.meals), elapsed
+
+
+def run_threads(philos, food, delay):
+    # Uma rodada da versão com threads (phi_problem), com a mesma mesa
+    import phi_problem
+
+    phi_problem.VERBOSE = False
+    phi_problem.configure(philos=philos, food=food, delay=delay)
+    with PhilosopherPool(philos, phi_problem.philosopher, phi_problem.reset_table) as pool:
+        start = time.perf_counter()
+        pool.run_round()
+        elapsed = time.perf_counter() - start
+    return sum(phi_problem.meals), elapsed
+
+
+ENGINES = {'thread': run_threads, 'asyncio': run_async}
+
+
+def _peak_rss_kb():
+    import resource
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def measure(engine, philos, food, delay):
+    """
+    Roda um motor num processo novo (o pico de memória de um processo não pode ser zerado) e
+    devolve refeições/s e o pico de memória residente (RSS, em KB) acima do processo ocioso.
+    """
+    command = [sys.executable, __file__, '--engine', engine, '--philos', str(philos),
+               '--food', str(food), '--delay', str(delay), '--json']
+    output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main(argv=None):
+    import phi_problem
+
+    parser = argparse.ArgumentParser(description='Jantar dos filósofos com asyncio.')
+    parser.add_argument('--engine', choices=sorted(ENGINES),
+                        help='roda só um motor (padrão: compara threads e asyncio)')
+    parser.add_argument('--philos', type=int, help='número de filósofos (padrão: 10, 1000 e 10000)')
+    parser.add_argument('--portions', type=int, default=3, help='porções por filósofo (comparação)')
+    parser.add_argument('--food', type=int, help='porções na mesa (padrão: filósofos x portions)')
+    parser.add_argument('--delay', type=float, default=0.00001)
+    parser.add_argument('--json', action='store_true', help='imprime o resultado em JSON')
+    args = parser.parse_args(argv)
+
+    if args.engine:
+        philos = args.philos or phi_problem.PHILOS
+        food = args.food or philos * args.portions
+        baseline = _peak_rss_kb()
+        meals, elapsed = ENGINES[args.engine](philos, food, args.delay)
+        result = {'engine': args.engine, 'philosophers': philos, 'meals': meals,
+                  'elapsed': elapsed, 'meals_per_second': meals / elapsed if elapsed > 0 else 0,
+                  'peak_rss_kb': _peak_rss_kb() - baseline}
+        print(json.dumps(result) if args.json else result)
+        return
+
+    sizes = [args.philos] if args.philos else COMPARISON_SIZES
+    print(f"{'motor':<8} {'filósofos':>9} {'refeições/s':>13} {'memória (MB)':>13}")
+    for philos in sizes:
+        food = args.food or philos * args.portions
+        for engine in ('thread', 'asyncio'):
+            result = measure(engine, philos, food, args.delay)
+            print(f"{engine:<8} {philos:>9} {result['meals_per_second']:>13,.0f} "
+                  f"{result['peak_rss_kb'] / 1024:>13.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+import argparse
+import multiprocessing
+import time
+
+import phi_problem
+from dining_strategies import chopsticks_of
+
+
+def _philosopher(num, settings, chopstick, food, meals, start, end):
+    """
+    Processo de um filósofo: a cada rodada espera a barreira de início, come enquanto houver
+    comida (mesma ordem dos hashis e mesma regra da comida da versão com threads) e espera a
+    barreira de fim.
+    - settings: (PHILOS, FOOD, DELAY, EAT_MODE, VERBOSE, sleep_seconds, rounds)
+    """
+    philos, total_food, delay, eat_mode, verbose, sleep_seconds, rounds = settings
+    # Este processo tem a própria cópia do módulo: ajusta a mesa dele
+    phi_problem.PHILOS, phi_problem.FOOD, phi_problem.DELAY = philos, total_food, delay
+    phi_problem.EAT_MODE, phi_problem.VERBOSE = eat_mode, verbose
+
+    left, right = chopsticks_of(num, philos)
+    if num % 2 == 0:
+        order = ((right, "direito"), (left, "esquerdo"))
+    else:
+        order = ((left, "esquerdo"), (right, "direito"))
+    extra = sleep_seconds if num == phi_problem.SLOW_PHILOSOPHER else 0
+
+    for _ in range(rounds):
+        start.wait()
+        while True:
+            with food.get_lock(): # O contador em memória compartilhada tem o próprio lock
+                if food.value > 0:
+                    food.value -= 1
+                f = food.value
+            if f <= 0:
+                break
+
+            for c, hand in order:
+                chopstick[c].acquire()
+                phi_problem.announce_grab(num, c, hand)
+            if verbose:
+                phi_problem.log('comendo', f"O filósofo {num}: está comendo.")
+            phi_problem.eat(total_food - f + 1)
+            if extra:
+                time.sleep(extra)
+            meals[num] += 1 # Só este processo escreve nesta posição
+            chopstick[left].release()
+            chopstick[right].release()
+        if verbose:
+            # Filhos saem sem rodar o atexit: escreve os eventos desta rodada aqui
+            phi_problem.logger.flush()
+        end.wait()
+
+
+def run_processes(philos, food, delay, eat_mode='sleep', rounds=1, verbose=False,
+                  sleep_seconds=0, on_round=None):
+    """
+    Roda `rounds` rodadas com um processo por filósofo (criados uma vez só). Os hashis são
+    multiprocessing.Lock e a comida e as refeições ficam em memória compartilhada
+    (multiprocessing.Value/Array). Antes de cada rodada a comida é reposta.
+    - on_round: função chamada ao fim de cada rodada (opcional)
+    Retorna (refeições totais, tempo gasto nas rodadas).
+    """
+    chopstick = [multiprocessing.Lock() for _ in range(philos)]
+    food_left = multiprocessing.Value('i', food)
+    meals = multiprocessing.Array('i', philos, lock=False)
+    start = multiprocessing.Barrier(philos + 1)
+    end = multiprocessing.Barrier(philos + 1)
+    settings = (philos, food, delay, eat_mode, verbose, sleep_seconds, rounds)
+
+    workers = [multiprocessing.Process(target=_philosopher,
+                                       args=(num, settings, chopstick, food_left, meals, start, end))
+               for num in range(philos)]
+    for p in workers:
+        p.start()
+
+    began = time.perf_counter()
+    for _ in range(rounds):
+        food_left.value = food
+        start.wait()
+        end.wait()
+        if on_round is not None:
+            on_round()
+    elapsed = time.perf_counter() - began
+
+    for p in workers:
+        p.join()
+    return sum(meals), elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compara os filósofos em threads e em processos.')
+    parser.add_argument('--philos', type=int, default=phi_problem.PHILOS)
+    parser.add_argument('--food', type=int, default=phi_problem.FOOD)
+    parser.add_argument('--delay', type=float, default=phi_problem.DELAY)
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    phi_problem.VERBOSE = False
+    print(f"{'comer':<6} {'backend':<8} {'refeições/s':>12}")
+    for eat_mode in phi_problem.EAT_MODES:
+        phi_problem.EAT_MODE = eat_mode
+        phi_problem.configure(philos=args.philos, food=args.food, delay=args.delay)
+        meals, elapsed = phi_problem.run_threads(args.rounds)
+        print(f"{eat_mode:<6} {'thread':<8} {meals / elapsed:>12,.1f}")
+        meals, elapsed = run_processes(args.philos, args.food, args.delay, eat_mode, args.rounds)
+        print(f"{eat_mode:<6} {'process':<8} {meals / elapsed:>12,.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,18 @@
+import argparse
+import os
 import threading
 import time
 import sys
 
+# O log de eventos em lotes é compartilhado com a Q3
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Q3'))
+from event_logger import log, logger
+
+from dining_strategies import STRATEGIES
+from food_allocation import ALLOCATORS, GlobalLockFood
+from lock_stats import ContentionRegistry, InstrumentedLock
+from philosopher_pool import PhilosopherPool
+
 # Define o número de filósofos e a quantidade inicial de comida disponível, além do tempo de espera de cada filósofo
 PHILOS = 5
 FOOD = 50
@@ -10,6 +21,28 @@ DELAY = 0.005
 # Aqui pode ser defino o número de vezes que o scrip irá executar
 num_of_executions = 1000
 
+# Estratégia de distribuição da comida (ver food_allocation.ALLOCATORS)
+FOOD_STRATEGY = 'global'
+
+# Estratégia para pegar os hashis sem deadlock (ver dining_strategies.STRATEGIES)
+DINING_STRATEGY = 'asymmetric'
+
+# Se False, os filósofos não imprimem nada (útil em benchmarks)
+VERBOSE = True
+
+# Como o filósofo come: 'sleep' espera (time.sleep) e 'cpu' faz uma conta que ocupa o processador
+EAT_MODES = ('sleep', 'cpu')
+EAT_MODE = 'sleep'
+CPU_WORK = 2000 # Iterações por unidade de tempo de comer no modo 'cpu'
+
+# Backends de execução: uma thread, um processo ou uma corrotina por filósofo
+BACKENDS = ('thread', 'process', 'asyncio')
+
+# Se True, configure() cria os hashis e o food_lock instrumentados (tempos de espera e de posse
+# e disputas por lock e por filósofo), e main() imprime o resumo no final
+INSTRUMENT_LOCKS = False
+lock_registry = ContentionRegistry()
+
 #Cria uma lista de threads lock pra representar os hashis
 chopstick = [threading.Lock() for _ in range(PHILOS)]
 
@@ -18,70 +51,222 @@ food_lock = threading.Lock()
 
 # Essa variável controla o tempo de espera extra de algum filósofo específico
 sleep_seconds = 0
+SLOW_PHILOSOPHER = 0
+
+def new_food_allocator(strategy):
+    # A estratégia global usa o food_lock do módulo, como no código original
+    if strategy == 'global':
+        return GlobalLockFood(FOOD, PHILOS, food_lock)
+    return ALLOCATORS[strategy](FOOD, PHILOS)
+
+food_allocator = new_food_allocator(FOOD_STRATEGY)
+
+# Refeições de cada filósofo na rodada atual (cada um só altera a própria posição)
+meals = [0] * PHILOS
+
+def new_lock(name):
+    # Lock comum ou instrumentado, conforme INSTRUMENT_LOCKS
+    if INSTRUMENT_LOCKS:
+        return InstrumentedLock(name, lock_registry)
+    return threading.Lock()
+
+def configure(philos=None, food=None, delay=None, food_strategy=None, dining_strategy=None,
+              instrument=None):
+    """
+    Ajusta a mesa antes de uma execução; os parâmetros omitidos ficam como estão.
+    Os hashis, o food_lock, o alocador de comida e a estratégia dos hashis são recriados com os
+    novos valores.
+    """
+    global PHILOS, FOOD, DELAY, FOOD_STRATEGY, DINING_STRATEGY, INSTRUMENT_LOCKS
+    global chopstick, food_lock, food_allocator, dining, meals
+    PHILOS = philos if philos is not None else PHILOS
+    FOOD = food if food is not None else FOOD
+    DELAY = delay if delay is not None else DELAY
+    FOOD_STRATEGY = food_strategy or FOOD_STRATEGY
+    DINING_STRATEGY = dining_strategy or DINING_STRATEGY
+    INSTRUMENT_LOCKS = instrument if instrument is not None else INSTRUMENT_LOCKS
+    chopstick = [new_lock(f'hashi {c}') for c in range(PHILOS)]
+    food_lock = new_lock('food_lock')
+    food_allocator = new_food_allocator(FOOD_STRATEGY)
+    dining = STRATEGIES[DINING_STRATEGY](sys.modules[__name__])
+    meals = [0] * PHILOS
 
-food = FOOD
+def reset_table():
+    # Coloca a comida de volta na mesa antes de uma nova execução
+    food_allocator.reset()
+    meals[:] = [0] * PHILOS
 
-def food_on_table():
-    global food
-    with food_lock: # Bloqueia pra garantir acesso exclusivo
-        if food > 0:
-            food -= 1
-        return food
+def food_on_table(phil):
+    # Tira uma porção para o filósofo e devolve quanto sobrou (<= 0: acabou a comida)
+    return food_allocator.take(phil)
+
+def announce_grab(phil, c, hand):
+    if VERBOSE:
+        log('hashi', f"O filósofo {phil}: pegou {hand} o hashi {c}")
 
 def grab_chopstick(phil, c, hand):
     chopstick[c].acquire() # Bloqueia o hashi pra um único filósofo utilizar ele
-    print(f"O filósofo {phil}: pegou {hand} o hashi {c}")
+    announce_grab(phil, c, hand)
+
+def try_grab_chopstick(phil, c, hand):
+    # Tenta pegar o hashi sem bloquear; devolve se conseguiu
+    if not chopstick[c].acquire(blocking=False):
+        return False
+    announce_grab(phil, c, hand)
+    return True
+
+def release_chopstick(c):
+    chopstick[c].release()
 
 def down_chopsticks(c1, c2):
     chopstick[c1].release() # Libera o hashi esquerdo
     chopstick[c2].release() # Libera o hashi direito
 
+def eat(units):
+    # Simula o tempo de comer: units vezes DELAY no modo 'sleep', ou units vezes CPU_WORK
+    # iterações no modo 'cpu' (que sob o GIL não rodam em paralelo entre threads)
+    if EAT_MODE == 'cpu':
+        total = 0
+        for i in range(CPU_WORK * units):
+            total += i * i
+        return total
+    time.sleep(DELAY * units)
+
+# Estratégia dos hashis em uso (recriada por configure())
+dining = STRATEGIES[DINING_STRATEGY](sys.modules[__name__])
+
 def philosopher(num):
     id = num
-    left_chopstick = (id + 1) % PHILOS # calcula o índice do hashi esquerdo
-    right_chopstick = id # Pega o índice do hashi direito
+    if INSTRUMENT_LOCKS:
+        lock_registry.bind(id) # As esperas desta thread contam para este filósofo
 
-    print(f"O filósofo {id} terminou de refletir e agora está com fome.")
+    if VERBOSE:
+        log('fome', f"O filósofo {id} terminou de refletir e agora está com fome.")
 
     while True:
-        f = food_on_table() # Checa se ainda tem comida sobrando
+        f = food_on_table(id) # Checa se ainda tem comida sobrando
         if f <= 0:
             break
 
-       
-        # Pega os hashis em uma ordem específica pra evitar starvation
-        if id % 2 == 0:
-            grab_chopstick(id, right_chopstick, "direito")
-            grab_chopstick(id, left_chopstick, "esquerdo")
-        else:
-            grab_chopstick(id, left_chopstick, "esquerdo")
-            grab_chopstick(id, right_chopstick, "direito")
+        # Pega os hashis conforme a estratégia escolhida (a padrão, assimétrica, faz os pares
+        # começarem pelo direito e os ímpares pelo esquerdo, evitando deadlock)
+        dining.pick_up(id)
+
+        if VERBOSE:
+            log('comendo', f"O filósofo {id}: está comendo.")
+        # Simula o tempo de comer (o filósofo mais lento segura os hashis sleep_seconds a mais)
+        eat(FOOD - f + 1)
+        if id == SLOW_PHILOSOPHER and sleep_seconds:
+            time.sleep(sleep_seconds)
+        meals[id] += 1
+
+        dining.put_down(id)
 
-        print(f"O filósofo {id}: está comendo.")
-        time.sleep(DELAY * (FOOD - f + 1)) # Simula o tempo de comer
+    if VERBOSE:
+        log('satisfeito', f"O filósofo {id} já está satisfeito.")
 
-        down_chopsticks(left_chopstick, right_chopstick)
+def run_threads(rounds, on_round=None):
+    """
+    Roda `rounds` rodadas com uma thread por filósofo, reaproveitada em todas elas (barreiras
+    marcam o início e o fim de cada rodada, e a comida é reposta antes de cada uma).
+    - on_round: função chamada ao fim de cada rodada (opcional)
+    Retorna (refeições totais, tempo gasto).
+    """
+    total_meals = 0
+    start = time.perf_counter()
+    with PhilosopherPool(PHILOS, philosopher, reset_table) as pool:
+        for _ in range(rounds):
+            pool.run_round()
+            total_meals += sum(meals)
+            if on_round is not None:
+                on_round()
+    return total_meals, time.perf_counter() - start
 
-    print(f"O filósofo {id} já está satisfeito.")
+def run_asyncio(rounds, on_round=None):
+    # Uma corrotina por filósofo (ver phi_async), mesma mesa e mesma ordem dos hashis da
+    # estratégia assimétrica; a comida é um contador sem lock (uma thread só)
+    from phi_async import run_async
 
-def main():
-    for i in range(num_of_executions): # Cria e inicia as threads pra cada filósofo, executando n vezes
-        philosophers_threads = []
-        for i in range(PHILOS):
-            t = threading.Thread(target=philosopher, args=(i,))
-            philosophers_threads.append(t)
-            t.start()
+    announce = announce_grab if VERBOSE else None
+    total_meals, elapsed = 0, 0
+    for _ in range(rounds):
+        round_meals, round_time = run_async(PHILOS, FOOD, DELAY, announce, SLOW_PHILOSOPHER,
+                                            sleep_seconds)
+        total_meals += round_meals
+        elapsed += round_time
+        if on_round is not None:
+            on_round()
+    return total_meals, elapsed
 
-        for t in philosophers_threads:
-            t.join()
+def main(backend='thread'):
+    if INSTRUMENT_LOCKS:
+        configure(instrument=True) # Recria os hashis e o food_lock instrumentados
 
-        print("\n Todos os filósofos terminaram de comer. \n\n")
-    
+    def round_finished():
+        log('rodada', "Todos os filósofos terminaram de comer.")
+
+    if backend == 'process':
+        # Um processo por filósofo: o modo de comer 'cpu' roda de fato em paralelo
+        from phi_multiprocessing import run_processes
+
+        total_meals, elapsed = run_processes(PHILOS, FOOD, DELAY, EAT_MODE, num_of_executions,
+                                             VERBOSE, sleep_seconds, round_finished)
+    elif backend == 'asyncio':
+        total_meals, elapsed = run_asyncio(num_of_executions, round_finished)
+    else:
+        total_meals, elapsed = run_threads(num_of_executions, round_finished)
+
+    logger.flush() # Escreve os eventos pendentes antes do resumo
     print(f"\nNúmero de execuções: {num_of_executions}\n")
+    print(f"Rodadas por segundo: {num_of_executions / elapsed:.2f}")
+    print(f"Refeições por segundo: {total_meals / elapsed:.2f}\n")
+
+    if INSTRUMENT_LOCKS and backend == 'thread':
+        print("Disputa pelos locks (tempos em µs):")
+        print(lock_registry.report())
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Jantar dos filósofos.')
+    parser.add_argument('sleep_seconds', nargs='?', type=float, default=0,
+                        help='tempo extra que o filósofo SLOW_PHILOSOPHER segura os hashis')
+    parser.add_argument('--backend', choices=BACKENDS, default='thread',
+                        help='uma thread, um processo ou uma corrotina por filósofo')
+    parser.add_argument('--eat', choices=EAT_MODES, default=EAT_MODE,
+                        help="'sleep' espera e 'cpu' ocupa o processador (backends thread e process)")
+    parser.add_argument('--executions', type=int, default=num_of_executions)
+    parser.add_argument('--philos', type=int, default=PHILOS)
+    parser.add_argument('--food', type=int, default=FOOD)
+    parser.add_argument('--delay', type=float, default=DELAY)
+    parser.add_argument('--food-strategy', choices=sorted(ALLOCATORS), default=FOOD_STRATEGY,
+                        help='distribuição da comida (backend thread)')
+    parser.add_argument('--strategy', choices=sorted(STRATEGIES), default=DINING_STRATEGY,
+                        help='estratégia anti-deadlock dos hashis (backend thread)')
+    parser.add_argument('--instrument', action='store_true',
+                        help='mede a disputa pelos locks (backend thread)')
+    parser.add_argument('--quiet', action='store_true', help='não imprime as ações dos filósofos')
+    args = parser.parse_args(argv)
+
+    # Os backends process e asyncio usam sempre a ordem assimétrica e um contador de comida
+    # próprio: recusa as opções que eles não implementam em vez de ignorá-las
+    if args.backend != 'thread':
+        unsupported = [option for option, used in (
+            ('--strategy', args.strategy != 'asymmetric'),
+            ('--food-strategy', args.food_strategy != 'global'),
+            ('--instrument', args.instrument),
+            ('--eat cpu', args.backend == 'asyncio' and args.eat == 'cpu'),
+        ) if used]
+        if unsupported:
+            parser.error(f"o backend {args.backend} não suporta {', '.join(unsupported)}")
+    return args
 
 if __name__ == "__main__":
+    args = parse_args()
+    sleep_seconds = args.sleep_seconds
+    num_of_executions = args.executions
+    EAT_MODE = args.eat
+    VERBOSE = not args.quiet
+    configure(philos=args.philos, food=args.food, delay=args.delay,
+              food_strategy=args.food_strategy, dining_strategy=args.strategy,
+              instrument=args.instrument)
 
-    if len(sys.argv) == 2:
-        sleep_seconds = float(sys.argv[1])
-    
-    main()
+    main(args.backend)
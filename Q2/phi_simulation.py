@@ -0,0 +1,207 @@
+import argparse
+from collections import deque
+import heapq
+import itertools
+import random
+import statistics
+import time
+
+import phi_problem
+from dining_benchmark import fairness
+from dining_strategies import chopsticks_of
+
+# Eventos da simulação
+HUNGRY, GRAB, DONE = range(3)
+
+# Ordens de pegar os hashis simuladas:
+#   asymmetric: pares começam pelo direito e ímpares pelo esquerdo (phi_problem)
+#   hierarchy: sempre o hashi de menor índice primeiro
+#   naive: todos começam pelo esquerdo (pode dar deadlock)
+ORDERS = ('asymmetric', 'hierarchy', 'naive')
+
+
+def grab_order(phil, philos, order):
+    left, right = chopsticks_of(phil, philos)
+    if order == 'naive':
+        return left, right
+    if order == 'hierarchy':
+        return min(left, right), max(left, right)
+    return (right, left) if phil % 2 == 0 else (left, right)
+
+
+def simulate(philos=phi_problem.PHILOS, food=phi_problem.FOOD, delay=phi_problem.DELAY,
+             seed=0, order='asymmetric', think_time=0, starvation_threshold=None,
+             slow_philosopher=None, slow_extra=0):
+    """
+    Simula uma rodada do jantar em tempo virtual, sem threads nem sleeps.
+    As regras são as de phi_problem.philosopher(): o filósofo tira uma porção (para quando
+    food_on_table() devolve <= 0), pega os dois hashis na ordem escolhida, come por
+    DELAY * (FOOD - f + 1) e devolve os hashis. Pegar cada hashi é um evento separado; eventos
+    no mesmo instante são ordenados por um sorteio com a semente `seed`, então cada semente é
+    uma intercalação possível, sempre reproduzível. Hashis ocupados têm fila FIFO e são
+    entregues direto ao próximo da fila.
+    - think_time: tempo entre uma refeição e a próxima tentativa (0 no código original)
+    - starvation_threshold: espera (em tempo virtual) a partir da qual um filósofo conta como
+      em starvation; filósofos que não comeram nada também contam
+    - slow_philosopher, slow_extra: um filósofo que segura os hashis slow_extra a mais
+
+    Retorna um dicionário com as refeições de cada filósofo, o instante final, a maior espera
+    de cada um, os filósofos em starvation e, se houver deadlock, o ciclo de espera.
+    """
+    rng = random.Random(seed)
+    orders = [grab_order(phil, philos, order) for phil in range(philos)]
+    holder = [None] * philos                  # Quem está com cada hashi
+    waiters = [deque() for _ in range(philos)]
+    waiting_on = [None] * philos              # Hashi que o filósofo espera
+    step = [0] * philos                       # Quantos hashis o filósofo já tem
+    portion = [0] * philos                    # Valor de f da refeição atual
+    hungry_since = [0.0] * philos
+    max_wait = [0.0] * philos
+    meals = [0] * philos
+    satisfied = 0
+    remaining = food
+    now = 0.0
+    events = []
+    sequence = itertools.count()
+
+    def schedule(at, phil, event):
+        heapq.heappush(events, (at, rng.random(), next(sequence), phil, event))
+
+    def acquired(phil, at):
+        # O filósofo conseguiu mais um hashi: pega o próximo ou começa a comer
+        step[phil] += 1
+        if step[phil] < 2:
+            schedule(at, phil, GRAB)
+            return
+        wait = at - hungry_since[phil]
+        if wait > max_wait[phil]:
+            max_wait[phil] = wait
+        eating = delay * (food - portion[phil] + 1)
+        if phil == slow_philosopher:
+            eating += slow_extra
+        schedule(at + eating, phil, DONE)
+
+    for phil in range(philos):
+        schedule(0.0, phil, HUNGRY)
+
+    while events:
+        now, _, _, phil, event = heapq.heappop(events)
+        if event == HUNGRY:
+            if remaining > 0:
+                remaining -= 1
+            if remaining <= 0:
+                satisfied += 1
+                continue
+            portion[phil] = remaining
+            hungry_since[phil] = now
+            schedule(now, phil, GRAB)
+        elif event == GRAB:
+            c = orders[phil][step[phil]]
+            if holder[c] is None:
+                holder[c] = phil
+                acquired(phil, now)
+            else:
+                waiting_on[phil] = c
+                waiters[c].append(phil)
+        else:
+            meals[phil] += 1
+            step[phil] = 0
+            for c in orders[phil]:
+                holder[c] = None
+                if waiters[c]:
+                    # Entrega o hashi direto ao primeiro da fila
+                    nxt = waiters[c].popleft()
+                    waiting_on[nxt] = None
+                    holder[c] = nxt
+                    acquired(nxt, now)
+            schedule(now + think_time, phil, HUNGRY)
+
+    deadlock = satisfied < philos
+    cycle = _wait_cycle(waiting_on, holder) if deadlock else None
+    if deadlock:
+        # Quem ficou preso espera até o fim da simulação
+        for phil in range(philos):
+            if waiting_on[phil] is not None:
+                max_wait[phil] = max(max_wait[phil], now - hungry_since[phil])
+    starved = [phil for phil in range(philos)
+               if meals[phil] == 0 or (starvation_threshold is not None
+                                       and max_wait[phil] > starvation_threshold)]
+    return {
+        'meals': meals,
+        'makespan': now,
+        'max_wait': max_wait,
+        'deadlock': deadlock,
+        'cycle': cycle,
+        'starved': starved,
+    }
+
+
+def _wait_cycle(waiting_on, holder):
+    # Segue filósofo -> hashi esperado -> dono do hashi até repetir alguém
+    for start in range(len(waiting_on)):
+        seen = {}
+        phil = start
+        while phil is not None and phil not in seen and waiting_on[phil] is not None:
+            seen[phil] = len(seen)
+            phil = holder[waiting_on[phil]]
+        if phil is not None and phil in seen:
+            path = list(seen)
+            return path[seen[phil]:]
+    return []
+
+
+def sweep(philos_values, food_values, delay_values, runs=1000, seed=0, order='asymmetric',
+          **options):
+    """
+    Roda `runs` simulações (sementes seed, seed+1, ...) para cada combinação de PHILOS, FOOD e
+    DELAY e resume cada combinação: deadlocks, rodadas com starvation, instante final médio e
+    índice de justiça de Jain médio das refeições.
+    """
+    results = []
+    for philos, food, delay in itertools.product(philos_values, food_values, delay_values):
+        deadlocks = starving = 0
+        makespans, fairness_values = [], []
+        for run in range(runs):
+            result = simulate(philos, food, delay, seed + run, order, **options)
+            deadlocks += result['deadlock']
+            starving += bool(result['starved'])
+            makespans.append(result['makespan'])
+            fairness_values.append(fairness(result['meals']))
+        results.append({
+            'philos': philos, 'food': food, 'delay': delay, 'runs': runs,
+            'deadlocks': deadlocks, 'starvation_runs': starving,
+            'mean_makespan': statistics.fmean(makespans),
+            'mean_fairness': statistics.fmean(fairness_values),
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Jantar dos filósofos em tempo virtual.')
+    parser.add_argument('--philos', type=int, nargs='+', default=[phi_problem.PHILOS])
+    parser.add_argument('--food', type=int, nargs='+', default=[phi_problem.FOOD])
+    parser.add_argument('--delay', type=float, nargs='+', default=[phi_problem.DELAY])
+    parser.add_argument('--runs', type=int, default=phi_problem.num_of_executions)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--order', choices=ORDERS, default='asymmetric')
+    parser.add_argument('--think-time', type=float, default=0)
+    parser.add_argument('--starvation-threshold', type=float,
+                        help='espera (tempo virtual) que conta como starvation')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = sweep(args.philos, args.food, args.delay, args.runs, args.seed, args.order,
+                    think_time=args.think_time, starvation_threshold=args.starvation_threshold)
+    elapsed = time.perf_counter() - start
+
+    print(f"{'PHILOS':>6} {'FOOD':>6} {'DELAY':>8} {'deadlocks':>10} {'starvation':>11} "
+          f"{'fim médio':>10} {'Jain':>6}")
+    for r in results:
+        print(f"{r['philos']:>6} {r['food']:>6} {r['delay']:>8} {r['deadlocks']:>10} "
+              f"{r['starvation_runs']:>11} {r['mean_makespan']:>10.3f} {r['mean_fairness']:>6.3f}")
+    total_runs = args.runs * len(results)
+    print(f"\n{total_runs} simulações em {elapsed:.3f} s")
+
+
+if __name__ == '__main__':
+    main()
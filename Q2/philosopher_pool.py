@@ -0,0 +1,77 @@
+import threading
+import time
+
+
+# Classe PhilosopherPool - threads de filósofos reaproveitadas entre as execuções
+class PhilosopherPool:
+    """
+    Mantém uma thread por filósofo viva durante todas as execuções, em vez de criar e destruir
+    as threads a cada rodada. Em cada rodada:
+      1. reset() restaura o estado compartilhado (com todas as threads paradas)
+      2. uma barreira libera todos os filósofos ao mesmo tempo
+      3. cada thread executa target(num)
+      4. uma segunda barreira espera todos terminarem
+    - philosophers: número de filósofos (threads)
+    - target: função de cada filósofo numa rodada; recebe o número do filósofo
+    - reset: função chamada antes de cada rodada (opcional)
+    """
+
+    def __init__(self, philosophers, target, reset=None):
+        self.philosophers = philosophers
+        self.target = target
+        self.reset = reset
+        self.rounds = 0
+        self._closing = False
+        self._errors = []
+        # +1: a thread que coordena as rodadas também passa pelas barreiras
+        self._start = threading.Barrier(philosophers + 1)
+        self._end = threading.Barrier(philosophers + 1)
+        self._threads = [threading.Thread(target=self._worker, args=(num,), daemon=True)
+                         for num in range(philosophers)]
+        for t in self._threads:
+            t.start()
+
+    def _worker(self, num):
+        while True:
+            self._start.wait()
+            if self._closing:
+                return
+            try:
+                self.target(num)
+            except Exception as error:
+                self._errors.append(error)
+            finally:
+                self._end.wait()
+
+    def run_round(self):
+        # Executa uma rodada completa e só retorna quando todos os filósofos terminarem
+        if self.reset is not None:
+            self.reset()
+        self._start.wait()
+        self._end.wait()
+        self.rounds += 1
+        if self._errors:
+            raise self._errors.pop(0)
+
+    def run(self, rounds):
+        # Executa várias rodadas e devolve quantas rodadas por segundo foram feitas
+        start = time.perf_counter()
+        for _ in range(rounds):
+            self.run_round()
+        elapsed = time.perf_counter() - start
+        return rounds / elapsed if elapsed > 0 else float('inf')
+
+    def close(self):
+        # Libera as threads da barreira de início para que terminem
+        if self._closing:
+            return
+        self._closing = True
+        self._start.wait()
+        for t in self._threads:
+            t.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
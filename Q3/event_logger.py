@@ -0,0 +1,133 @@
+import atexit
+from collections import deque
+import os
+import sys
+import threading
+import time
+
+# Níveis de log: só eventos com nível >= ao do logger são guardados; OFF desliga tudo
+DEBUG = 10
+INFO = 20
+WARNING = 30
+OFF = 100
+LEVELS = {'DEBUG': DEBUG, 'INFO': INFO, 'WARNING': WARNING, 'OFF': OFF}
+
+
+def format_event(event):
+    # (instante, thread, ação, mensagem) -> linha de texto
+    timestamp, thread, action, message = event
+    return f"[{timestamp:10.6f}] {thread:<14} {action:<10} {message}"
+
+
+# Classe EventLogger - log de eventos em buffers por thread, escrito em lotes por outra thread
+class EventLogger:
+    """
+    Substitui print() nos trechos com lock: log() só guarda uma tupla (instante, thread, ação,
+    mensagem) num deque da própria thread, sem lock nenhum (append em deque é atômico), então
+    pode ser chamado segurando a sala ou os hashis sem que a escrita na saída aconteça ali
+    dentro. Uma thread em segundo plano junta os buffers a cada flush_interval, ordena os
+    eventos pelo instante e escreve o lote inteiro de uma vez na saída.
+    - stream: saída dos eventos (padrão: sys.stdout)
+    - level: nível mínimo (OFF não guarda nada e nem cria a thread de escrita)
+    - flush_interval: intervalo entre os lotes, em segundos
+    - ring_size: tamanho máximo do buffer de cada thread; se a escrita atrasar, os eventos mais
+      antigos são descartados (e contados em dropped, somando a contagem de cada thread)
+    - formatter: função que transforma um evento em linha
+    """
+
+    def __init__(self, stream=None, level=INFO, flush_interval=0.05, ring_size=65536,
+                 formatter=format_event):
+        self.stream = stream
+        self.level = level
+        self.flush_interval = flush_interval
+        self.ring_size = ring_size
+        self.formatter = formatter
+        self._dropped_finished = 0          # Descartes de threads que já terminaram
+        self._start = time.perf_counter()
+        self._local = threading.local()
+        self._buffers = []                  # (thread, deque, descartes) de cada thread que já logou
+        self._buffers_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._drainer = None
+
+    def _buffer(self):
+        # Buffer da thread atual (criado no primeiro evento dela)
+        buffer = deque(maxlen=self.ring_size)
+        self._local.buffer = buffer
+        self._local.name = threading.current_thread().name
+        self._local.dropped = [0]           # Só a própria thread incrementa
+        with self._buffers_lock:
+            self._buffers.append((threading.current_thread(), buffer, self._local.dropped))
+            if self._drainer is None:
+                self._drainer = threading.Thread(target=self._drain_loop, name='EventLogger',
+                                                 daemon=True)
+                self._drainer.start()
+        return buffer
+
+    def log(self, action, message='', level=INFO):
+        if level < self.level:
+            return
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            buffer = self._buffer()
+        if len(buffer) == self.ring_size:
+            self._local.dropped[0] += 1
+        buffer.append((time.perf_counter() - self._start, self._local.name, action, message))
+
+    @property
+    def dropped(self):
+        # Eventos descartados por buffer cheio, somando os contadores de todas as threads
+        with self._buffers_lock:
+            return self._dropped_finished + sum(dropped[0] for _, _, dropped in self._buffers)
+
+    def flush(self):
+        # Escreve tudo o que está nos buffers, em ordem de instante, numa única escrita
+        with self._write_lock:
+            batch = []
+            with self._buffers_lock:
+                buffers = list(self._buffers)
+            for thread, buffer, dropped in buffers:
+                while buffer:
+                    batch.append(buffer.popleft())
+                if not thread.is_alive() and not buffer:
+                    # Thread que terminou: o buffer dela não recebe mais nada
+                    with self._buffers_lock:
+                        self._buffers.remove((thread, buffer, dropped))
+                        self._dropped_finished += dropped[0]
+            if not batch:
+                return
+            batch.sort()
+            stream = self.stream if self.stream is not None else sys.stdout
+            stream.write('\n'.join(map(self.formatter, batch)) + '\n')
+            stream.flush()
+
+    def _drain_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        # Para a thread de escrita e escreve o que ainda estiver nos buffers
+        self._stop.set()
+        if self._drainer is not None and self._drainer is not threading.current_thread():
+            self._drainer.join()
+        self.flush()
+
+
+def _level_from_env():
+    # EVENT_LOG_LEVEL=OFF desliga o log de eventos de todos os scripts
+    return LEVELS.get(os.environ.get('EVENT_LOG_LEVEL', 'INFO').upper(), INFO)
+
+
+# Logger compartilhado pelos scripts
+logger = EventLogger(level=_level_from_env())
+atexit.register(logger.close)
+
+
+def log(action, message='', level=INFO):
+    logger.log(action, message, level)
+
+
+def set_level(level):
+    # Aceita o número do nível ou o nome ('OFF', 'INFO', ...)
+    logger.level = LEVELS[level.upper()] if isinstance(level, str) else level
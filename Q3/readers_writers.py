@@ -1,43 +1,48 @@
 import threading
 import time
-import keyboard # pip install keyboard
+from event_logger import log
 
 writers_init_threads_length = 6 # Número de threads de escritores inicial
 readers_init_threads_length = 50 # Número de threads de leitores inicial
 readers = 0 # Contador para ter controle do número de leitores
+critical_section_time = 1 # Tempo (s) de cada leitura/escrita dentro da sala
 mutex = threading.Semaphore(1) # Semáforo para proteger o contador de leitores
 roomIsEmpty = threading.Semaphore(1) # Semáforo para verificar se a sala (região crítica) está vazia ou não
 stop_execution = threading.Event() # Evento para dar o sinal de parada
 
+def write_once(): # Uma escrita: espera a sala vazia, escreve e libera a sala
+  roomIsEmpty.acquire() # Bloqueia a sala para poder escrever
+  
+  log('escrita', 'está escrevendo algo na região critíca.')
+  time.sleep(critical_section_time)
+  
+  roomIsEmpty.release() # Libera a sala
+
+def read_once(): # Uma leitura: entra na sala junto com os outros leitores, lê e sai
+  global readers
+  mutex.acquire() # Impede que outra thread modifique o contador
+  readers += 1
+  if readers == 1:
+    roomIsEmpty.acquire() # Se tiver algum leitor, bloqueia a entrada na sala
+  mutex.release() # Libera que outra thread modifique o contador
+  
+  log('leitura', 'está lendo algo na região critíca.')
+  time.sleep(critical_section_time)
+  
+  mutex.acquire()
+  readers -= 1
+  if readers == 0:
+    roomIsEmpty.release() # Último leitor libera a sala para o escritor
+  mutex.release()
+
 def writer():
   while not stop_execution.is_set(): # Continua executando enquanto o sinal não estiver setado
-    roomIsEmpty.acquire() # Bloqueia a sala para poder escrever
-    
-    print(f'\n{threading.current_thread().name} está escrevendo algo na região critíca.')
-    time.sleep(1)
-    
-    roomIsEmpty.release() # Libera a sala
-    
+    write_once()
     time.sleep(1) # Simula que está fazendo algo fora da sala
 
 def reader():
-  global readers
   while not stop_execution.is_set(): # Continua executando enquanto o sinal não estiver setado
-    mutex.acquire() # Impede que outra thread modifique o contador
-    readers += 1
-    if readers == 1:
-      roomIsEmpty.acquire() # Se tiver algum leitor, bloqueia a entrada na sala
-    mutex.release() # Libera que outra thread modifique o contador
-    
-    print(f'\n{threading.current_thread().name} está lendo algo na região critíca.')
-    time.sleep(1)
-    
-    mutex.acquire()
-    readers -= 1
-    if readers == 0:
-      roomIsEmpty.release() # Último leitor libera a sala para o escritor
-    mutex.release()
-    
+    read_once()
     time.sleep(1) # Simula que está fazendo algo fora da sala
 
 def increase_readers_thread_length(): # Cria mais leitores no tempo de execução
@@ -54,6 +59,8 @@ def increase_readers_thread_length(): # Cria mais leitores no tempo de execuçã
       
     
 if __name__ == '__main__':
+  import keyboard # pip install keyboard
+
   writers_threads = [threading.Thread(target=writer, name=f'Escritor {index + 1}') for index in range(writers_init_threads_length)]
   readers_threads = [threading.Thread(target=reader, name=f'Leitor {index + 1}') for index in range(readers_init_threads_length)] # Valores muito altos podem causar starvation dos escritores
   
@@ -1,12 +1,13 @@
 import threading
 import time
-import keyboard  # pip install keyboard
+from event_logger import log
 
 writers_init_threads_length = 6   # Número de threads de escritores inicial
 readers_init_threads_length = 50   # Número de threads de leitores inicial
 
 # Contador de leitores
 readers = 0
+critical_section_time = 1 # Tempo (s) de cada leitura/escrita dentro da sala
 
 # Semáforos:
 mutex = threading.Semaphore(1)       # Protege o contador de leitores
@@ -15,41 +16,48 @@ turnstile = threading.Semaphore(1)   # Controla a entrada, garantindo que se um
 
 stop_execution = threading.Event()   # Evento para sinal de parada
 
-def writer():
-    while not stop_execution.is_set():
-        # Escritor requer o "turnstile" para sinalizar sua intenção de escrever antes de aguardar a sala vazia
-        turnstile.acquire()          # Bloqueia a entrada de novos leitores enquanto aguarda
-        roomIsEmpty.acquire()        # Garante exclusão mútua completa para escrever
-        turnstile.release()          # Libera para que outros, inclusive leitores, possam tentar entrar após este escritor
+def write_once():
+    # Uma escrita: passa pelo turnstile, espera a sala vazia, escreve e libera a sala
+    # Escritor requer o "turnstile" para sinalizar sua intenção de escrever antes de aguardar a sala vazia
+    turnstile.acquire()          # Bloqueia a entrada de novos leitores enquanto aguarda
+    roomIsEmpty.acquire()        # Garante exclusão mútua completa para escrever
+    turnstile.release()          # Libera para que outros, inclusive leitores, possam tentar entrar após este escritor
 
-        print(f'\n{threading.current_thread().name} está escrevendo algo na região crítica.')
-        time.sleep(1)
+    log('escrita', 'está escrevendo algo na região crítica.')
+    time.sleep(critical_section_time)
 
-        roomIsEmpty.release()        # Libera a sala após a escrita
-        time.sleep(1)                # Simula tempo fora da sala
+    roomIsEmpty.release()        # Libera a sala após a escrita
 
-def reader():
+def read_once():
+    # Uma leitura: passa pelo turnstile, entra na sala junto com os outros leitores, lê e sai
     global readers
-    while not stop_execution.is_set():
-        # Leitores também passam pelo turnstile, para garantir que não "pulem a fila" de escritores que estejam esperando
-        turnstile.acquire()
-        turnstile.release()
+    # Leitores também passam pelo turnstile, para garantir que não "pulem a fila" de escritores que estejam esperando
+    turnstile.acquire()
+    turnstile.release()
 
-        mutex.acquire()
-        readers += 1
-        if readers == 1:
-            roomIsEmpty.acquire()   # Primeiro leitor bloqueia a sala
-        mutex.release()
+    mutex.acquire()
+    readers += 1
+    if readers == 1:
+        roomIsEmpty.acquire()   # Primeiro leitor bloqueia a sala
+    mutex.release()
 
-        print(f'\n{threading.current_thread().name} está lendo algo na região crítica.')
-        time.sleep(1)
+    log('leitura', 'está lendo algo na região crítica.')
+    time.sleep(critical_section_time)
 
-        mutex.acquire()
-        readers -= 1
-        if readers == 0:
-            roomIsEmpty.release()   # Último leitor libera a sala
-        mutex.release()
+    mutex.acquire()
+    readers -= 1
+    if readers == 0:
+        roomIsEmpty.release()   # Último leitor libera a sala
+    mutex.release()
 
+def writer():
+    while not stop_execution.is_set():
+        write_once()
+        time.sleep(1)                # Simula tempo fora da sala
+
+def reader():
+    while not stop_execution.is_set():
+        read_once()
         time.sleep(1)
 
 def increase_readers_thread_length():
@@ -62,6 +70,8 @@ def increase_readers_thread_length():
             new_reader_thread.start()
 
 if __name__ == '__main__':
+    import keyboard  # pip install keyboard
+
     writers_threads = [threading.Thread(target=writer, name=f'Escritor {index + 1}') for index in range(writers_init_threads_length)]
     readers_threads = [threading.Thread(target=reader, name=f'Leitor {index + 1}') for index in range(readers_init_threads_length)]
 
@@ -1,6 +1,6 @@
 import threading
 import time
-import keyboard  # pip install keyboard
+from event_logger import log, logger
 import matplotlib.pyplot as plt
 
 # ==============================
@@ -13,6 +13,7 @@ readers_init_threads_length = 50  # Número de threads de leitores inicial
 readers = 0
 # Contador de escritores (quantos estão escrevendo agora)
 active_writers = 0
+critical_section_time = 1  # Tempo (s) de cada leitura/escrita dentro da sala
 
 # Semáforos
 mutex = threading.Semaphore(1)       # Protege o contador de leitores
@@ -35,50 +36,57 @@ start_time = time.time()       # Momento em que o programa começou
 # ==============================
 # Funções de Escrita e Leitura
 # ==============================
-def writer():
+def write_once():
+    # Uma escrita: passa pelo turnstile, espera a sala vazia, escreve e libera a sala
     global active_writers
-    while not stop_execution.is_set():
-        # Escritor requer o "turnstile"
-        turnstile.acquire()
-        roomIsEmpty.acquire()
-        turnstile.release()
+    # Escritor requer o "turnstile"
+    turnstile.acquire()
+    roomIsEmpty.acquire()
+    turnstile.release()
 
-        # Início da escrita
-        with data_lock:
-            active_writers += 1
+    # Início da escrita
+    with data_lock:
+        active_writers += 1
 
-        print(f'\n{threading.current_thread().name} está escrevendo algo na região crítica.')
-        time.sleep(1)  # Simula tempo de escrita
+    log('escrita', 'está escrevendo algo na região crítica.')
+    time.sleep(critical_section_time)  # Simula tempo de escrita
 
-        # Fim da escrita
-        with data_lock:
-            active_writers -= 1
+    # Fim da escrita
+    with data_lock:
+        active_writers -= 1
 
-        roomIsEmpty.release()
-        time.sleep(1)  # Simula tempo fora da sala
+    roomIsEmpty.release()
 
-def reader():
+def read_once():
+    # Uma leitura: passa pelo turnstile, entra na sala junto com os outros leitores, lê e sai
     global readers
-    while not stop_execution.is_set():
-        # Respeita o turnstile (para não furar fila de escritores)
-        turnstile.acquire()
-        turnstile.release()
+    # Respeita o turnstile (para não furar fila de escritores)
+    turnstile.acquire()
+    turnstile.release()
 
-        mutex.acquire()
-        readers += 1
-        if readers == 1:
-            roomIsEmpty.acquire()  # Primeiro leitor bloqueia a sala
-        mutex.release()
+    mutex.acquire()
+    readers += 1
+    if readers == 1:
+        roomIsEmpty.acquire()  # Primeiro leitor bloqueia a sala
+    mutex.release()
 
-        print(f'\n{threading.current_thread().name} está lendo algo na região crítica.')
-        time.sleep(1)  # Simula tempo de leitura
+    log('leitura', 'está lendo algo na região crítica.')
+    time.sleep(critical_section_time)  # Simula tempo de leitura
 
-        mutex.acquire()
-        readers -= 1
-        if readers == 0:
-            roomIsEmpty.release()  # Último leitor libera a sala
-        mutex.release()
+    mutex.acquire()
+    readers -= 1
+    if readers == 0:
+        roomIsEmpty.release()  # Último leitor libera a sala
+    mutex.release()
 
+def writer():
+    while not stop_execution.is_set():
+        write_once()
+        time.sleep(1)  # Simula tempo fora da sala
+
+def reader():
+    while not stop_execution.is_set():
+        read_once()
         time.sleep(1)  # Simula tempo fora da sala
 
 # ==============================
@@ -113,6 +121,8 @@ def monitor_data():
 # Programa Principal
 # ==============================
 if __name__ == '__main__':
+    import keyboard  # pip install keyboard
+
     print('\nPressione qualquer tecla para finalizar o script...')
 
     # Cria as threads iniciais
@@ -145,6 +155,7 @@ if __name__ == '__main__':
         t.join()
     monitor_thread.join()
     data_thread.join()
+    logger.close()  # Escreve os eventos que ainda estão nos buffers
 
     # ==============================
     # Plot dos Dados Coletados
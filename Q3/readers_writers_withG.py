@@ -1,6 +1,6 @@
 import threading
 import time
-import keyboard  # pip install keyboard
+from event_logger import log, logger
 import matplotlib.pyplot as plt
 
 # ==============================
@@ -12,6 +12,7 @@ readers_init_threads_length = 50  # Número de threads de leitores inicial
 # Contadores de leitores e escritores
 readers = 0
 active_writers = 0  # indica se (e quantos) escritores estão escrevendo agora
+critical_section_time = 1  # Tempo (s) de cada leitura/escrita dentro da sala
 
 # Semáforos de sincronização
 mutex = threading.Semaphore(1)       # Protege o contador de leitores
@@ -30,43 +31,50 @@ start_time = time.time()       # Marca o início da execução
 # ==============================
 # Funções de Escrita e Leitura
 # ==============================
-def writer():
+def write_once():
+    # Uma escrita: espera a sala vazia, escreve e libera a sala
     global active_writers
-    while not stop_execution.is_set():
-        roomIsEmpty.acquire()  # Bloqueia a sala para poder escrever
+    roomIsEmpty.acquire()  # Bloqueia a sala para poder escrever
 
-        # Indica que este escritor começou a escrever
-        with data_lock:
-            active_writers += 1
+    # Indica que este escritor começou a escrever
+    with data_lock:
+        active_writers += 1
 
-        print(f'\n{threading.current_thread().name} está escrevendo algo na região crítica.')
-        time.sleep(1)  # Simula tempo de escrita
+    log('escrita', 'está escrevendo algo na região crítica.')
+    time.sleep(critical_section_time)  # Simula tempo de escrita
 
-        # Ao terminar, decrementa o contador de escritores
-        with data_lock:
-            active_writers -= 1
+    # Ao terminar, decrementa o contador de escritores
+    with data_lock:
+        active_writers -= 1
 
-        roomIsEmpty.release()   # Libera a sala
-        time.sleep(1)          # Simula tempo fora da sala
+    roomIsEmpty.release()   # Libera a sala
 
-def reader():
+def read_once():
+    # Uma leitura: entra na sala junto com os outros leitores, lê e sai
     global readers
-    while not stop_execution.is_set():
-        mutex.acquire()  # Protege o contador de leitores
-        readers += 1
-        if readers == 1:
-            roomIsEmpty.acquire()  # Se for o primeiro leitor, bloqueia a sala
-        mutex.release()
+    mutex.acquire()  # Protege o contador de leitores
+    readers += 1
+    if readers == 1:
+        roomIsEmpty.acquire()  # Se for o primeiro leitor, bloqueia a sala
+    mutex.release()
 
-        print(f'\n{threading.current_thread().name} está lendo algo na região crítica.')
-        time.sleep(1)  # Simula tempo de leitura
+    log('leitura', 'está lendo algo na região crítica.')
+    time.sleep(critical_section_time)  # Simula tempo de leitura
 
-        mutex.acquire()
-        readers -= 1
-        if readers == 0:
-            roomIsEmpty.release()  # Último leitor libera a sala
-        mutex.release()
+    mutex.acquire()
+    readers -= 1
+    if readers == 0:
+        roomIsEmpty.release()  # Último leitor libera a sala
+    mutex.release()
 
+def writer():
+    while not stop_execution.is_set():
+        write_once()
+        time.sleep(1)          # Simula tempo fora da sala
+
+def reader():
+    while not stop_execution.is_set():
+        read_once()
         time.sleep(1)  # Simula tempo fora da sala
 
 # ==============================
@@ -100,6 +108,8 @@ def monitor_data():
 # Programa Principal
 # ==============================
 if __name__ == '__main__':
+    import keyboard  # pip install keyboard
+
     # Criação das threads iniciais
     writers_threads = [threading.Thread(target=writer, name=f'Escritor {index + 1}') 
                        for index in range(writers_init_threads_length)]
@@ -131,6 +141,7 @@ if __name__ == '__main__':
         t.join()
     monitor_thread.join()
     data_thread.join()
+    logger.close()  # Escreve os eventos que ainda estão nos buffers
 
     # ==============================
     # Plot dos Dados Coletados
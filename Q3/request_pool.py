@@ -0,0 +1,270 @@
+import argparse
+import importlib
+import queue
+import random
+import threading
+import time
+
+import event_logger
+import rwlock
+
+# Scripts com o protocolo de leitores e escritores (todos têm read_once() e write_once()) e as
+# políticas de rwlock.py
+SCRIPTS = ('readers_writers', 'readers_writers_melhorado', 'readers_writers_withG',
+           'readers_writers_melhorado_withG')
+PROTOCOLS = SCRIPTS + tuple(rwlock.POLICIES)
+
+# Chegada das requisições: intervalos exponenciais (Poisson) ou fixos
+ARRIVALS = ('poisson', 'fixed')
+
+
+def interarrival_times(rate, arrivals='poisson', rng=None):
+    """
+    Gera os intervalos entre requisições para `rate` requisições por segundo.
+    - arrivals: 'poisson' (intervalos exponenciais de média 1/rate) ou 'fixed' (sempre 1/rate)
+    - rng: random.Random usado no sorteio (padrão: o módulo random)
+    """
+    rng = rng or random
+    while True:
+        yield rng.expovariate(rate) if arrivals == 'poisson' else 1 / rate
+
+
+# Classe LatencySample - contagem, média e máximo exatos e percentis sobre uma amostra de tamanho fixo
+class LatencySample:
+    """
+    Guarda no máximo `size` valores (amostragem de reservatório), então a memória não cresce com
+    o número de requisições; média e máximo consideram todos os valores.
+    """
+
+    def __init__(self, size=10000, rng=None):
+        self.size = size
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._sample = []
+        self._rng = rng or random.Random(0)
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        if len(self._sample) < self.size:
+            self._sample.append(value)
+        else:
+            i = self._rng.randrange(self.count)
+            if i < self.size:
+                self._sample[i] = value
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p):
+        if not self._sample:
+            return 0.0
+        ordered = sorted(self._sample)
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+
+# Classe RequestPool - número fixo de leitores e escritores atendendo requisições de filas limitadas
+class RequestPool:
+    """
+    Em vez de criar uma thread nova por leitor, `readers` threads leitoras e `writers` threads
+    escritoras ficam vivas o tempo todo e tiram requisições de duas filas limitadas (uma de
+    leituras e outra de escritas). Cada requisição é só o instante em que chegou; quando a fila
+    está cheia a requisição é recusada. Assim, threads e memória não crescem com a taxa de
+    chegada.
+    - read, write: funções que fazem uma leitura e uma escrita (read_once/write_once dos scripts)
+    - queue_size: tamanho máximo de cada fila
+    - sample_interval: intervalo (s) entre as amostras da profundidade das filas
+    - sample_size: quantas latências são guardadas para os percentis
+    """
+
+    def __init__(self, read, write, readers=8, writers=2, queue_size=1000, sample_interval=0.01,
+                 sample_size=10000):
+        self.sample_interval = sample_interval
+        self._queues = {'leitura': queue.Queue(queue_size), 'escrita': queue.Queue(queue_size)}
+        self._operations = {'leitura': read, 'escrita': write}
+        self._workers_of = {'leitura': readers, 'escrita': writers}
+        self.submitted = dict.fromkeys(self._queues, 0)
+        self.rejected = dict.fromkeys(self._queues, 0)
+        self.pending = dict.fromkeys(self._queues, 0)
+        self.wait = {kind: LatencySample(sample_size) for kind in self._queues}
+        self.latency = {kind: LatencySample(sample_size) for kind in self._queues}
+        self.depth = LatencySample(sample_size)
+        self._stats_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads = []
+
+    def start(self):
+        for kind, count in self._workers_of.items():
+            name = 'Leitor' if kind == 'leitura' else 'Escritor'
+            for index in range(count):
+                self._threads.append(threading.Thread(target=self._worker, args=(kind,),
+                                                      name=f'{name} {index + 1}'))
+        self._monitor = threading.Thread(target=self._monitor_depth, name='Monitor')
+        for t in self._threads + [self._monitor]:
+            t.start()
+
+    def submit(self, kind):
+        # Enfileira uma requisição; devolve False se a fila estiver cheia
+        self.submitted[kind] += 1
+        try:
+            self._queues[kind].put_nowait(time.perf_counter())
+        except queue.Full:
+            self.rejected[kind] += 1
+            return False
+        return True
+
+    def _worker(self, kind):
+        requests, operation = self._queues[kind], self._operations[kind]
+        while True:
+            arrival = requests.get()
+            if arrival is None:
+                break
+            started = time.perf_counter()
+            operation()
+            done = time.perf_counter()
+            with self._stats_lock:
+                self.wait[kind].add(started - arrival)
+                self.latency[kind].add(done - arrival)
+
+    def _monitor_depth(self):
+        while not self._stop.wait(self.sample_interval):
+            depth = sum(q.qsize() for q in self._queues.values())
+            with self._stats_lock:
+                self.depth.add(depth)
+
+    def generate(self, rate, duration, write_ratio=0.1, arrivals='poisson', seed=0):
+        """
+        Gera requisições por `duration` segundos (na thread atual). Os instantes de chegada são
+        absolutos, então se a thread atrasar as requisições atrasadas saem todas de uma vez e a
+        taxa média se mantém.
+        - write_ratio: fração das requisições que são escritas
+        """
+        rng = random.Random(seed)
+        start = time.perf_counter()
+        at = start
+        for gap in interarrival_times(rate, arrivals, rng):
+            at += gap
+            if at - start > duration:
+                break
+            delay = at - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            self.submit('escrita' if rng.random() < write_ratio else 'leitura')
+        return time.perf_counter() - start
+
+    def close(self):
+        # Descarta o que ficou nas filas (contado em pending) e encerra as threads
+        self._stop.set()
+        for kind, requests in self._queues.items():
+            while True:
+                try:
+                    requests.get_nowait()
+                except queue.Empty:
+                    break
+                self.pending[kind] += 1
+            for _ in range(self._workers_of[kind]):
+                requests.put(None)
+        for t in self._threads + [self._monitor]:
+            t.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def report(self):
+        # Resumo por tipo de requisição (tempos em segundos)
+        summary = {'depth_mean': self.depth.mean(), 'depth_max': self.depth.max}
+        for kind in self._queues:
+            summary[kind] = {
+                'submitted': self.submitted[kind],
+                'rejected': self.rejected[kind],
+                'completed': self.latency[kind].count,
+                'pending': self.pending[kind],
+                'wait_mean': self.wait[kind].mean(),
+                'latency_mean': self.latency[kind].mean(),
+                'latency_p50': self.latency[kind].percentile(50),
+                'latency_p99': self.latency[kind].percentile(99),
+                'latency_max': self.latency[kind].max,
+            }
+        return summary
+
+
+def rwlock_operations(policy, critical_section_time):
+    # read_once/write_once equivalentes aos dos scripts, com um lock da política escolhida
+    lock = rwlock.POLICIES[policy]()
+
+    def read_once():
+        with lock.read_locked():
+            event_logger.log('leitura', 'está lendo algo na região crítica.')
+            time.sleep(critical_section_time)
+
+    def write_once():
+        with lock.write_locked():
+            event_logger.log('escrita', 'está escrevendo algo na região crítica.')
+            time.sleep(critical_section_time)
+
+    return read_once, write_once
+
+
+def run_load(protocol='readers_writers_melhorado', rate=100, duration=5, readers=8, writers=2,
+             write_ratio=0.1, arrivals='poisson', queue_size=1000, critical_section_time=0.001,
+             seed=0):
+    """
+    Teste de carga de um dos scripts ou de uma política de rwlock.py: ajusta o tempo de cada
+    leitura/escrita na sala (critical_section_time), roda o pool e devolve o report() com o tempo
+    de geração e a vazão.
+    """
+    if protocol in rwlock.POLICIES:
+        read, write = rwlock_operations(protocol, critical_section_time)
+    else:
+        module = importlib.import_module(protocol)
+        module.critical_section_time = critical_section_time
+        read, write = module.read_once, module.write_once
+    with RequestPool(read, write, readers, writers, queue_size) as pool:
+        elapsed = pool.generate(rate, duration, write_ratio, arrivals, seed)
+    summary = pool.report()
+    summary['elapsed'] = elapsed
+    summary['throughput'] = sum(summary[kind]['completed'] for kind in ('leitura', 'escrita')) / elapsed
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Leitores e escritores com pool fixo de threads e fila de requisições.')
+    parser.add_argument('--protocol', choices=PROTOCOLS, default='readers_writers_melhorado')
+    parser.add_argument('--rate', type=float, default=100, help='requisições por segundo')
+    parser.add_argument('--duration', type=float, default=5, help='segundos gerando requisições')
+    parser.add_argument('--arrivals', choices=ARRIVALS, default='poisson')
+    parser.add_argument('--readers', type=int, default=8, help='threads leitoras')
+    parser.add_argument('--writers', type=int, default=2, help='threads escritoras')
+    parser.add_argument('--write-ratio', type=float, default=0.1)
+    parser.add_argument('--queue-size', type=int, default=1000)
+    parser.add_argument('--work', type=float, default=0.001,
+                        help='tempo (s) de cada leitura/escrita na sala')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--log', action='store_true', help='mostra o log de cada leitura/escrita')
+    args = parser.parse_args(argv)
+
+    if not args.log:
+        event_logger.set_level('OFF')
+    r = run_load(args.protocol, args.rate, args.duration, args.readers, args.writers,
+                 args.write_ratio, args.arrivals, args.queue_size, args.work, args.seed)
+
+    print(f"\n{'tipo':<8} {'chegaram':>9} {'recusadas':>9} {'feitas':>7} {'pendentes':>9} "
+          f"{'fila ms':>8} {'média ms':>9} {'p50 ms':>8} {'p99 ms':>8} {'máx ms':>8}")
+    for kind in ('leitura', 'escrita'):
+        k = r[kind]
+        print(f"{kind:<8} {k['submitted']:>9} {k['rejected']:>9} {k['completed']:>7} {k['pending']:>9} "
+              f"{k['wait_mean'] * 1e3:>8.2f} {k['latency_mean'] * 1e3:>9.2f} "
+              f"{k['latency_p50'] * 1e3:>8.2f} {k['latency_p99'] * 1e3:>8.2f} {k['latency_max'] * 1e3:>8.2f}")
+    print(f"\nProfundidade das filas: média {r['depth_mean']:.1f}, máxima {r['depth_max']}")
+    print(f"Vazão: {r['throughput']:.1f} requisições/s em {r['elapsed']:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+from contextlib import contextmanager
+import threading
+import time
+
+# Locks de leitores e escritores com as políticas dos scripts (e mais duas), para usar fora
+# deles. Todas seguem a mesma interface: acquire_read/acquire_write devolvem False se o timeout
+# acabar, e read_locked()/write_locked() são context managers que levantam TimeoutError.
+
+
+def _remaining(deadline):
+    # Timeout que sobra até o prazo (None: sem prazo)
+    return None if deadline is None else max(deadline - time.monotonic(), 0)
+
+
+# Classe RWLock - base: estado da sala protegido por uma Condition
+class RWLock:
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self.readers = 0        # Leitores dentro da sala
+        self.writer = False     # Se tem um escritor dentro da sala
+
+    def acquire_read(self, timeout=None):
+        raise NotImplementedError
+
+    def acquire_write(self, timeout=None):
+        raise NotImplementedError
+
+    def release_read(self):
+        with self._cond:
+            self.readers -= 1
+            if self.readers == 0:
+                self._cond.notify_all() # Último leitor libera a sala
+
+    def release_write(self):
+        with self._cond:
+            self.writer = False
+            self._cond.notify_all()
+
+    @contextmanager
+    def read_locked(self, timeout=None):
+        if not self.acquire_read(timeout):
+            raise TimeoutError('timeout esperando para ler')
+        try:
+            yield self
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self, timeout=None):
+        if not self.acquire_write(timeout):
+            raise TimeoutError('timeout esperando para escrever')
+        try:
+            yield self
+        finally:
+            self.release_write()
+
+    def _enter_read(self, can_read, timeout):
+        if self._cond.wait_for(can_read, timeout):
+            self.readers += 1
+            return True
+        return False
+
+    def _room_is_empty(self):
+        return not self.writer and self.readers == 0
+
+
+# Classe ReaderPreferringRWLock - readers_writers.py: leitores entram sempre que não há escritor
+# na sala (muitos leitores podem deixar os escritores em starvation)
+class ReaderPreferringRWLock(RWLock):
+    def acquire_read(self, timeout=None):
+        with self._cond:
+            return self._enter_read(lambda: not self.writer, timeout)
+
+    def acquire_write(self, timeout=None):
+        with self._cond:
+            if not self._cond.wait_for(self._room_is_empty, timeout):
+                return False
+            self.writer = True
+            return True
+
+
+# Classe TurnstileRWLock - readers_writers_melhorado.py: todos passam por uma catraca FIFO (como
+# o Semaphore dos scripts) e o escritor a segura enquanto espera a sala esvaziar, então nenhum
+# leitor que chegou depois dele entra antes
+class TurnstileRWLock(RWLock):
+    def __init__(self):
+        super().__init__()
+        self._next_ticket = 0   # Próxima senha da catraca
+        self._serving = 0       # Senha da vez
+        self._abandoned = set() # Senhas de quem desistiu (timeout) antes da sua vez
+
+    def _pass_turnstile(self, timeout):
+        ticket = self._next_ticket
+        self._next_ticket += 1
+        if self._cond.wait_for(lambda: self._serving == ticket, timeout):
+            return True
+        self._abandoned.add(ticket)
+        return False
+
+    def _advance(self):
+        # Libera a catraca para a próxima senha (pulando quem desistiu)
+        self._serving += 1
+        while self._serving in self._abandoned:
+            self._abandoned.remove(self._serving)
+            self._serving += 1
+        self._cond.notify_all()
+
+    def acquire_read(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            if not self._pass_turnstile(timeout):
+                return False
+            self._advance()
+            return self._enter_read(lambda: not self.writer, _remaining(deadline))
+
+    def acquire_write(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            if not self._pass_turnstile(timeout):
+                return False
+            entered = self._cond.wait_for(self._room_is_empty, _remaining(deadline))
+            if entered:
+                self.writer = True
+            self._advance() # Libera a catraca, tendo entrado na sala ou não
+            return entered
+
+
+# Classe WriterPriorityRWLock - nenhum leitor entra enquanto houver escritor esperando
+# (agora são os leitores que podem ficar em starvation)
+class WriterPriorityRWLock(RWLock):
+    def __init__(self):
+        super().__init__()
+        self.waiting_writers = 0
+
+    def acquire_read(self, timeout=None):
+        with self._cond:
+            return self._enter_read(lambda: not self.writer and self.waiting_writers == 0,
+                                    timeout)
+
+    def acquire_write(self, timeout=None):
+        with self._cond:
+            self.waiting_writers += 1
+            entered = self._cond.wait_for(self._room_is_empty, timeout)
+            self.waiting_writers -= 1
+            if entered:
+                self.writer = True
+            else:
+                self._cond.notify_all() # Leitores que esperavam por este escritor podem entrar
+            return entered
+
+
+# Classe PhaseFairRWLock - fases de leitura e de escrita se alternam: com escritor esperando,
+# leitores novos esperam a próxima escrita terminar, e depois dela todos os leitores que
+# esperavam entram antes do escritor seguinte (ninguém fica em starvation)
+class PhaseFairRWLock(RWLock):
+    def __init__(self):
+        super().__init__()
+        self.waiting_writers = 0
+        self.waiting_readers = 0
+        self._write_phases = 0  # Escritas terminadas
+        self._readers_owed = 0  # Leitores liberados pela última escrita que ainda não entraram
+
+    def acquire_read(self, timeout=None):
+        with self._cond:
+            if not self.writer and self.waiting_writers == 0:
+                self.readers += 1
+                return True
+            phase = self._write_phases
+            self.waiting_readers += 1
+            # Entra quando a próxima escrita terminar (ou se os escritores desistirem)
+            entered = self._cond.wait_for(
+                lambda: self._write_phases > phase
+                or (not self.writer and self.waiting_writers == 0), timeout)
+            self.waiting_readers -= 1
+            if entered:
+                if self._write_phases > phase:
+                    self._readers_owed -= 1
+                self.readers += 1
+            return entered
+
+    def acquire_write(self, timeout=None):
+        with self._cond:
+            self.waiting_writers += 1
+            entered = self._cond.wait_for(
+                lambda: self._room_is_empty() and self._readers_owed == 0, timeout)
+            self.waiting_writers -= 1
+            if entered:
+                self.writer = True
+            else:
+                self._cond.notify_all()
+            return entered
+
+    def release_write(self):
+        with self._cond:
+            self.writer = False
+            self._write_phases += 1
+            self._readers_owed = self.waiting_readers # Fase de leitura de quem estava esperando
+            self._cond.notify_all()
+
+
+POLICIES = {
+    'reader': ReaderPreferringRWLock,
+    'turnstile': TurnstileRWLock,
+    'writer': WriterPriorityRWLock,
+    'phase_fair': PhaseFairRWLock,
+}
@@ -0,0 +1,81 @@
+import argparse
+import threading
+import time
+
+import rwlock
+
+
+def run_policy(policy, readers=8, writers=2, duration=1.0, read_time=0.0005, write_time=0.0005,
+               think_time=0.0005):
+    """
+    Roda `readers` leitores e `writers` escritores em loop por `duration` segundos com a política
+    escolhida: cada um espera o lock, fica read_time/write_time na sala e think_time fora dela.
+    Retorna as leituras e escritas por segundo e a espera média e máxima de cada tipo. A pior
+    espera inclui quem só consegue entrar depois do fim (starvation aparece aqui).
+    """
+    lock = rwlock.POLICIES[policy]()
+    stop = threading.Event()
+    stats_lock = threading.Lock()
+    stats = {kind: {'count': 0, 'total_wait': 0.0, 'max_wait': 0.0} for kind in ('read', 'write')}
+
+    def worker(kind):
+        locked = lock.read_locked if kind == 'read' else lock.write_locked
+        hold = read_time if kind == 'read' else write_time
+        count, total, worst = 0, 0.0, 0.0
+        while not stop.is_set():
+            asked = time.perf_counter()
+            with locked():
+                wait = time.perf_counter() - asked
+                time.sleep(hold)
+            count += 1
+            total += wait
+            worst = max(worst, wait)
+            time.sleep(think_time)
+        with stats_lock:
+            s = stats[kind]
+            s['count'] += count
+            s['total_wait'] += total
+            s['max_wait'] = max(s['max_wait'], worst)
+
+    threads = ([threading.Thread(target=worker, args=('read',)) for _ in range(readers)]
+               + [threading.Thread(target=worker, args=('write',)) for _ in range(writers)])
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    time.sleep(duration)
+    stop.set()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    result = {'policy': policy}
+    for kind, s in stats.items():
+        result[f'{kind}s_per_sec'] = s['count'] / elapsed
+        result[f'{kind}_mean_wait'] = s['total_wait'] / s['count'] if s['count'] else 0.0
+        result[f'{kind}_max_wait'] = s['max_wait']
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Vazão e pior espera de cada política de RWLock.')
+    parser.add_argument('--policies', nargs='+', choices=rwlock.POLICIES, default=list(rwlock.POLICIES))
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=2)
+    parser.add_argument('--duration', type=float, default=1.0)
+    parser.add_argument('--read-time', type=float, default=0.0005)
+    parser.add_argument('--write-time', type=float, default=0.0005)
+    parser.add_argument('--think-time', type=float, default=0.0005)
+    args = parser.parse_args(argv)
+
+    print(f"{'política':<11} {'leituras/s':>11} {'escritas/s':>11} {'leit. média ms':>15} "
+          f"{'leit. pior ms':>14} {'escr. média ms':>15} {'escr. pior ms':>14}")
+    for policy in args.policies:
+        r = run_policy(policy, args.readers, args.writers, args.duration, args.read_time,
+                       args.write_time, args.think_time)
+        print(f"{policy:<11} {r['reads_per_sec']:>11,.1f} {r['writes_per_sec']:>11,.1f} "
+              f"{r['read_mean_wait'] * 1e3:>15.3f} {r['read_max_wait'] * 1e3:>14.3f} "
+              f"{r['write_mean_wait'] * 1e3:>15.3f} {r['write_max_wait'] * 1e3:>14.3f}")
+
+
+if __name__ == '__main__':
+    main()